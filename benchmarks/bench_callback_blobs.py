@@ -0,0 +1,191 @@
+"""Measure Redis memory taken by callback payloads of a series navigation session.
+
+Usage (from the repository root, with the default Redis callback storage
+reachable at REDIS_HOST:REDIS_PORT)::
+
+    REDIS_HOST=localhost REDIS_PORT=6379 PYTHONPATH=src python benchmarks/bench_callback_blobs.py [seasons]
+
+The session opens a series with ten seasons, then for each visited season
+shows the season keyboard, runs a torrent search (results cache entry, back
+button) and pages through two pages of results, like the search handlers
+do. It runs once with blob deduplication disabled and once with it enabled.
+Each run only counts and deletes the keys it created. Memory is measured
+with ``MEMORY USAGE`` where the server supports it, otherwise as key plus
+value bytes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from types import SimpleNamespace
+
+from redis import ResponseError
+
+from bot.constants import SEASON_LIST_CALLBACK
+from models.movie_detail_service_types import MovieRatings, MovieSearchResult, TorrentDetails
+from models.search_provider_types import MediaDetails, Provider, SeasonDetails
+from services.callback_storage.redis_storage import (
+    CALLBACK_BLOB_PREFIX,
+    CALLBACK_INDEX_PREFIX,
+)
+from services.redis_services.client import close_redis, redis_client
+from utilities import handlers_utils
+from utilities.media_search_utils import show_season_choices
+from utilities.torrent_search_utils import format_torrent_search_results
+
+DESCRIPTION = (
+    "Фермер Сэм Кирби с семьёй оказывается в центре противостояния древних "
+    "сил, и каждый новый сезон раскрывает ещё одну тайну маленького городка. "
+) * 4
+
+
+def series_details() -> MediaDetails:
+    return MediaDetails(
+        provider_id="tv:1399",
+        provider=Provider.TMDB,
+        title="Игра престолов",
+        original_title="Game of Thrones",
+        year=2011,
+        poster_url="https://image.tmdb.org/t/p/w500/poster.jpg",
+        is_series=True,
+        description=DESCRIPTION,
+        seasons=[
+            SeasonDetails(season_number=number, year=2010 + number, episodes_count=10)
+            for number in range(1, 11)
+        ],
+    )
+
+
+def torrent_results(season: int, count: int = 16) -> list[MovieSearchResult]:
+    return [
+        MovieSearchResult(
+            movie_id=str(season * 1000 + i),
+            size=f"{20 + i}.4 ГБ",
+            search_name=f"Игра престолов / Game of Thrones / Сезон {season} / 2160p",
+            seeds=100 - i,
+            peers=i,
+            has_full_details=i % 2 == 0,
+            name="Игра престолов",
+            year="2011",
+            genres=["фэнтези", "драма", "приключения"],
+            director="Тим Ван Паттен, Алан Тейлор",
+            actors=[f"Актёр {n}" for n in range(12)],
+            season=season,
+            video_quality="2160p" if i % 3 else "1080p",
+            audio_quality="DUB",
+            ratings=MovieRatings(imdb="9.2", kinopoisk="9.0"),
+            torrent_details=[
+                TorrentDetails(key=f"Параметр {n}", value="значение " * 4)
+                for n in range(6)
+            ],
+        )
+        for i in range(count)
+    ]
+
+
+async def browse(seasons: int) -> None:
+    details = series_details()
+    movie_dump = details.model_dump(mode="json", by_alias=True, exclude_none=True)
+    tmdb_info = {"original_title": details.original_title, "year": details.year}
+
+    async def edit_text(*args, **kwargs) -> None:
+        return None
+
+    callback_query = SimpleNamespace(message=SimpleNamespace(edit_text=edit_text))
+    season_numbers = [season.season_number for season in details.seasons]
+
+    for season in range(1, seasons + 1):
+        await show_season_choices(
+            callback_query,
+            details,
+            season_numbers,
+            original_query="игра престолов",
+            requested_item=details.title,
+            requested_type="series",
+        )
+        back_callback_key = await handlers_utils.redis_callback_save(
+            {
+                "action": SEASON_LIST_CALLBACK,
+                "movie_id": details.provider_id,
+                "movie": movie_dump,
+                "movie_details": movie_dump,
+                "original_query": "игра престолов",
+                "requested_item": details.title,
+                "requested_type": "series",
+            }
+        )
+        results = torrent_results(season)
+        results_cache_key = await handlers_utils.redis_callback_save(
+            {
+                "results": [result.model_dump(mode="json") for result in results],
+                "requested_item": f"{details.title} {season} сезон",
+                "back_callback_key": back_callback_key,
+                "back_button_text": "⬅️ Назад к сезонам",
+                "tmdb_info": tmdb_info,
+            }
+        )
+        # The first page, the second one and back again.
+        for page in (0, 1, 0):
+            await format_torrent_search_results(
+                results,
+                results_cache_key,
+                page=page,
+                back_callback_key=back_callback_key,
+                back_button_text="⬅️ Назад к сезонам",
+                tmdb_info=tmdb_info,
+            )
+
+
+async def supports_memory_usage() -> bool:
+    try:
+        await redis_client.memory_usage("bench:probe")
+    except ResponseError:
+        return False
+    return True
+
+
+async def key_size(key: str, memory_usage: bool) -> int:
+    if memory_usage:
+        return await redis_client.memory_usage(key) or 0
+    return len(key) + await redis_client.strlen(key)
+
+
+async def run(label: str, seasons: int, memory_usage: bool) -> int:
+    before = {key async for key in redis_client.scan_iter(count=1000)}
+    await browse(seasons)
+    created = [
+        key async for key in redis_client.scan_iter(count=1000) if key not in before
+    ]
+    # The per-chat index is bookkeeping, the same with or without blobs.
+    sizes = [
+        await key_size(key, memory_usage)
+        for key in created
+        if not key.startswith(CALLBACK_INDEX_PREFIX)
+    ]
+    blobs = sum(key.startswith(CALLBACK_BLOB_PREFIX) for key in created)
+    total = sum(sizes)
+    print(f"{label:<8} keys={len(sizes):4} blobs={blobs:3} bytes={total:9,}")
+    if created:
+        await redis_client.delete(*created)
+    return total
+
+
+async def main() -> None:
+    seasons = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    min_bytes = handlers_utils.CALLBACK_BLOB_MIN_BYTES
+    try:
+        memory_usage = await supports_memory_usage()
+        if not memory_usage:
+            print("MEMORY USAGE is not supported, counting key and value bytes")
+        handlers_utils.CALLBACK_BLOB_MIN_BYTES = sys.maxsize
+        inline = await run("inline", seasons, memory_usage)
+        handlers_utils.CALLBACK_BLOB_MIN_BYTES = min_bytes
+        deduped = await run("blobs", seasons, memory_usage)
+    finally:
+        await close_redis()
+    print(f"saved {inline - deduped:,} bytes ({1 - deduped / inline:.0%})")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,82 @@
+"""Measure callback payload reads with and without the in-process cache.
+
+Usage (from the repository root, with Redis reachable at REDIS_HOST:REDIS_PORT)::
+
+    REDIS_HOST=localhost REDIS_PORT=6379 PYTHONPATH=src python benchmarks/bench_callback_l1.py [sessions]
+
+Each session follows the usual button path: a search saves the results
+cache entry and its result keyboard, then the user opens a result (its
+payload and the results cache entry are read), opens the download
+options and goes back to the results page. The run is repeated with the
+cache disabled (``CALLBACK_L1_SIZE=0``) and with the configured size, and
+reports read latency percentiles.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+import sys
+from time import perf_counter
+
+from bench_callback_blobs import torrent_results
+from services.redis_services.client import close_redis
+from utilities import handlers_utils
+from utilities.handlers_utils import (
+    callback_namespace,
+    redis_callback_delete,
+    redis_callback_get,
+    redis_callback_save,
+    redis_callback_save_many,
+)
+
+BENCH_CHAT = "bench-l1"
+RESULTS = [result.model_dump(mode="json") for result in torrent_results(1, count=40)]
+
+
+async def session(latencies: list[float]) -> list[str]:
+    results_cache_key = await redis_callback_save(
+        {"results": RESULTS, "requested_item": "Игра престолов 1 сезон"}
+    )
+    buttons = await redis_callback_save_many(
+        [
+            {"action": "bench_result", "results_cache_key": results_cache_key, "index": index}
+            for index in range(10)
+        ]
+    )
+    # Open a result, its download options, then back to the results page.
+    for callback_key in (buttons[3], results_cache_key, buttons[3], results_cache_key):
+        started_at = perf_counter()
+        assert await redis_callback_get(callback_key) is not None
+        latencies.append(perf_counter() - started_at)
+    return [results_cache_key, *buttons]
+
+
+async def run(label: str, sessions: int, l1_size: int) -> None:
+    handlers_utils.CALLBACK_L1_SIZE = l1_size
+    handlers_utils._l1.clear()
+    latencies: list[float] = []
+    created: list[str] = []
+    for _ in range(sessions):
+        created += await session(latencies)
+    p95 = statistics.quantiles(latencies, n=20)[-1]
+    print(
+        f"{label:<8} reads={len(latencies):5} "
+        f"p50={statistics.median(latencies) * 1e6:8.1f} us p95={p95 * 1e6:8.1f} us"
+    )
+    await redis_callback_delete(BENCH_CHAT, created)
+
+
+async def main() -> None:
+    sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    l1_size = handlers_utils.CALLBACK_L1_SIZE
+    callback_namespace.set(BENCH_CHAT)
+    try:
+        await run("no L1", sessions, 0)
+        await run("L1", sessions, l1_size)
+    finally:
+        await close_redis()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
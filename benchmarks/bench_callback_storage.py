@@ -0,0 +1,113 @@
+"""Compare the callback storage backends.
+
+Usage (from the repository root; Redis is included when reachable at
+REDIS_HOST:REDIS_PORT)::
+
+    REDIS_HOST=localhost REDIS_PORT=6379 PYTHONPATH=src python benchmarks/bench_callback_storage.py [operations]
+
+Every backend is timed on keyboard saves and reads, one at a time for
+latency and from 50 concurrent tasks for throughput. The ``CallbackStorage``
+contract itself is checked by tests/services/test_callback_storage.py.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+import sys
+import tempfile
+import uuid
+from collections.abc import Callable
+from pathlib import Path
+from time import perf_counter
+
+from redis import RedisError
+
+from bot.config import REDIS_HOST
+from services.callback_storage.interface import CallbackStorage
+from services.callback_storage.memory_storage import MemoryCallbackStorage
+from services.callback_storage.redis_storage import RedisCallbackStorage
+from services.callback_storage.sqlite_storage import SQLiteCallbackStorage
+from services.redis_services.client import close_redis, redis_bytes_client
+
+KEYBOARD_SIZE = 10
+CONCURRENCY = 50
+ENTRY = b"\x01\x00" + b'{"action":"bench","results_cache_key":"x","index":7}' * 5
+
+
+def unique(label: str) -> str:
+    # Keeps runs apart from each other and from real chats sharing a Redis.
+    return f"bench-{label}-{uuid.uuid4().hex[:8]}"
+
+
+def percentiles(latencies: list[float]) -> str:
+    p95 = statistics.quantiles(latencies, n=20)[-1]
+    return f"p50={statistics.median(latencies) * 1e6:7.1f} us p95={p95 * 1e6:7.1f} us"
+
+
+async def timed(storage: CallbackStorage, operations: int) -> None:
+    chat = unique("timed")
+    keyboards = [
+        {f"{number}-{button}": ENTRY for button in range(KEYBOARD_SIZE)}
+        for number in range(operations // KEYBOARD_SIZE)
+    ]
+    saves, reads = [], []
+    for keyboard in keyboards:
+        started_at = perf_counter()
+        await storage.save(chat, keyboard, {})
+        saves.append(perf_counter() - started_at)
+    keys = [key for keyboard in keyboards for key in keyboard]
+    for key in keys:
+        started_at = perf_counter()
+        await storage.get(chat, key)
+        reads.append(perf_counter() - started_at)
+
+    pending = iter(keys)
+
+    async def reader() -> None:
+        for key in pending:
+            await storage.get(chat, key)
+
+    started_at = perf_counter()
+    await asyncio.gather(*(reader() for _ in range(CONCURRENCY)))
+    throughput = len(keys) / (perf_counter() - started_at)
+    print(
+        f"  save {KEYBOARD_SIZE}-key keyboard {percentiles(saves)} | "
+        f"get {percentiles(reads)} | concurrent gets {throughput:,.0f}/s"
+    )
+    await storage.delete(chat, keys)
+
+
+async def redis_reachable() -> bool:
+    if not REDIS_HOST:
+        return False
+    try:
+        await redis_bytes_client.ping()
+    except (RedisError, OSError):
+        return False
+    return True
+
+
+async def main() -> None:
+    operations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    with tempfile.TemporaryDirectory() as directory:
+        sqlite_path = str(Path(directory) / "callbacks.sqlite3")
+        backends: dict[str, Callable[..., CallbackStorage]] = {
+            "memory": MemoryCallbackStorage,
+            "sqlite": lambda **kwargs: SQLiteCallbackStorage(sqlite_path, **kwargs),
+        }
+        if await redis_reachable():
+            backends["redis"] = RedisCallbackStorage
+        else:
+            print("Redis is not reachable, skipping the redis backend")
+
+        for name, make in backends.items():
+            print(name)
+            storage = make(max_keys=operations)
+            await timed(storage, operations)
+            await storage.aclose()
+    await close_redis()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
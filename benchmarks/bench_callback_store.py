@@ -0,0 +1,119 @@
+"""Measure how callback payloads of a busy group chat are kept in check.
+
+Usage (from the repository root, with Redis reachable at REDIS_HOST:REDIS_PORT,
+or another backend chosen with CALLBACK_STORAGE)::
+
+    REDIS_HOST=localhost REDIS_PORT=6379 PYTHONPATH=src python benchmarks/bench_callback_store.py [searches] [cap]
+
+One group chat runs ``searches`` searches, each saving a 20-button result
+keyboard, while 20 private chats run five searches each. Before every new
+search the group presses a button of its first keyboard, which stays in use.
+The run is repeated without a per-chat cap and with ``cap`` live keys per
+chat, and prints the memory report of each, save latency and whether the
+pinned keyboard survived.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+import sys
+from time import perf_counter
+
+from services.callback_storage.registry import close_callback_storage, get_callback_storage
+from services.redis_services.client import close_redis
+from utilities.handlers_utils import (
+    callback_memory_report,
+    callback_namespace,
+    redis_callback_delete,
+    redis_callback_get,
+    redis_callback_save_many,
+)
+
+GROUP_CHAT = "-1001234567890"
+PRIVATE_CHATS = [str(100_000 + chat) for chat in range(20)]
+KEYBOARD_SIZE = 20
+
+# Keys saved per chat, deleted after every run.
+created: dict[str, list[str]] = {}
+
+
+def keyboard(chat: str, search: int) -> list[dict]:
+    return [
+        {
+            "action": "bench_result",
+            "chat": chat,
+            "search": search,
+            "index": index,
+            "title": f"Результат {index} поиска {search}",
+        }
+        for index in range(KEYBOARD_SIZE)
+    ]
+
+
+async def search(chat: str, number: int, latencies: list[float]) -> list[str]:
+    token = callback_namespace.set(chat)
+    try:
+        started_at = perf_counter()
+        keys = await redis_callback_save_many(keyboard(chat, number))
+        latencies.append(perf_counter() - started_at)
+        created.setdefault(chat, []).extend(keys)
+        return keys
+    finally:
+        callback_namespace.reset(token)
+
+
+async def press(chat: str, callback_key: str) -> bool:
+    token = callback_namespace.set(chat)
+    try:
+        return await redis_callback_get(callback_key) is not None
+    finally:
+        callback_namespace.reset(token)
+
+
+async def run(label: str, searches: int, cap: int) -> None:
+    get_callback_storage().max_keys = cap
+    latencies: list[float] = []
+    pinned = (await search(GROUP_CHAT, 0, latencies))[0]
+    pinned_alive = True
+    for number in range(1, searches):
+        pinned_alive = await press(GROUP_CHAT, pinned) and pinned_alive
+        await search(GROUP_CHAT, number, latencies)
+    for chat in PRIVATE_CHATS:
+        for number in range(5):
+            await search(chat, number, latencies)
+    pinned_alive = await press(GROUP_CHAT, pinned) and pinned_alive
+
+    report = await callback_memory_report()
+    group_keys, group_bytes = report.get(GROUP_CHAT, (0, 0))
+    private = [report.get(chat, (0, 0)) for chat in PRIVATE_CHATS]
+    print(
+        f"{label:<9} group keys={group_keys:6} bytes={group_bytes:10,} | "
+        f"private keys={sum(k for k, _ in private):5} "
+        f"bytes={sum(b for _, b in private):9,} | "
+        f"save p50={statistics.median(latencies) * 1000:5.2f} ms | "
+        f"pinned button {'alive' if pinned_alive else 'evicted'}"
+    )
+    await cleanup()
+
+
+async def cleanup() -> None:
+    """Delete the payloads saved by the benchmark only."""
+    for chat, keys in created.items():
+        await redis_callback_delete(chat, keys)
+    created.clear()
+
+
+async def main() -> None:
+    searches = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    cap = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    try:
+        await run("uncapped", searches, sys.maxsize)
+        await run(f"cap={cap}", searches, cap)
+    finally:
+        await close_callback_storage()
+        await close_redis()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
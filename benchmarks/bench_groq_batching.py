@@ -0,0 +1,200 @@
+"""Compare per-item and batched Groq validation against a local stub endpoint.
+
+Usage (from the repository root)::
+
+    GROQ_API_KEY=stub PYTHONPATH=src python benchmarks/bench_groq_batching.py [titles] [batch_size]
+
+The stub speaks the OpenAI-compatible chat completions API used by the Groq
+SDK, sleeps a fixed base latency plus a per-token cost and reports token
+usage as ``len(prompt) / 4``. A repeated system message is reported as cached
+prompt tokens, like the provider's prefix cache. Verdicts are cached in
+memory instead of Redis. Nothing leaves the machine.
+The first two runs use titles the local cascade cannot decide; the
+``cascade`` run mixes in obvious matches and non-video releases that never
+reach the LLM.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+import sys
+from time import perf_counter
+from uuid import uuid4
+
+from aiohttp import web
+from groq import AsyncGroq
+
+from models.movie_detail_service_types import MovieRatings, MovieSearchResult
+from services.redis_services import verdict_cache
+from utilities import groq_utils
+from utilities.groq_scheduler import GroqScheduler
+
+BASE_LATENCY = 0.15
+LATENCY_PER_1K_TOKENS = 0.02
+BATCH_LINE_RE = re.compile(r"^(\d+)\. (.+)$", re.MULTILINE)
+
+VERDICT = {
+    "is_valid": True,
+    "name": "Дюна",
+    "year": "2021",
+    "genres": [],
+    "director": "",
+    "actors": [],
+    "image_url": "",
+    "ratings": {"imdb": "", "kinopoisk": ""},
+    "torrent_details": [],
+    "video_quality": "BDRip 1080p",
+    "audio_quality": "",
+    "audio_language": [{"language": "RUS", "quality": "DUB"}],
+}
+
+
+class StubStats:
+    def __init__(self) -> None:
+        self.requests = 0
+        self.prompt_tokens = 0
+        self.cached_tokens = 0
+        self.seen_prefixes: set[str] = set()
+
+
+class MemoryVerdictCache:
+    """In-process stand-in for ``verdict_cache`` so no Redis is needed."""
+
+    verdict_cache_key = staticmethod(verdict_cache.verdict_cache_key)
+
+    def __init__(self) -> None:
+        self.verdicts: dict[str, dict] = {}
+
+    async def get_verdicts(self, keys: list[str]) -> list[dict | None]:
+        return [self.verdicts.get(key) for key in keys]
+
+    async def save_verdicts(self, verdicts: dict[str, dict]) -> None:
+        self.verdicts.update(verdicts)
+
+    async def record_lookups(self, hits: int, misses: int) -> None:
+        pass
+
+
+async def start_stub(stats: StubStats) -> web.AppRunner:
+    async def completions(request: web.Request) -> web.Response:
+        body = await request.json()
+        prompt = "\n".join(message["content"] for message in body["messages"])
+        prompt_tokens = len(prompt) // 4
+        # Emulate provider prefix caching: a repeated system message is cached.
+        system = body["messages"][0]["content"]
+        cached_tokens = len(system) // 4 if system in stats.seen_prefixes else 0
+        stats.seen_prefixes.add(system)
+        stats.requests += 1
+        stats.prompt_tokens += prompt_tokens
+        stats.cached_tokens += cached_tokens
+        await asyncio.sleep(BASE_LATENCY + LATENCY_PER_1K_TOKENS * prompt_tokens / 1000)
+
+        if "titles:" in prompt:
+            indices = [int(m.group(1)) for m in BATCH_LINE_RE.finditer(prompt)]
+            content = json.dumps({"results": [{"index": i, **VERDICT} for i in indices]})
+        else:
+            content = json.dumps(VERDICT)
+        return web.json_response(
+            {
+                "id": "stub",
+                "object": "chat.completion",
+                "created": 0,
+                "model": body["model"],
+                "choices": [
+                    {
+                        "index": 0,
+                        "finish_reason": "stop",
+                        "message": {"role": "assistant", "content": content},
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": len(content) // 4,
+                    "total_tokens": prompt_tokens + len(content) // 4,
+                    "prompt_tokens_details": {"cached_tokens": cached_tokens},
+                },
+            }
+        )
+
+    app = web.Application()
+    app.router.add_post("/openai/v1/chat/completions", completions)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", 8765).start()
+    return runner
+
+
+# Obvious match, obvious non-video release and a year the cascade cannot settle.
+TITLE_SHAPES = (
+    "Дюна / Dune / 2021 / ДБ / BDRip (1080p)",
+    "Dune OST / 2021 / FLAC",
+    "Дюна / Dune / 1984 / ДБ / BDRip (1080p)",
+)
+
+
+def make_movies(count: int, tag: str, mixed: bool) -> list[MovieSearchResult]:
+    return [
+        MovieSearchResult(
+            movie_id=str(i),
+            size="10 ГБ",
+            search_name=f"{TITLE_SHAPES[i % 3 if mixed else 2]} {tag}#{i}",
+            name=f"{TITLE_SHAPES[i % 3 if mixed else 2]} {tag}#{i}",
+            year="",
+            genres=[],
+            director="",
+            actors=[],
+            ratings=MovieRatings(),
+            torrent_details=[],
+        )
+        for i in range(count)
+    ]
+
+
+async def run(
+    label: str, stats: StubStats, count: int, batch_size: int, mixed: bool = False
+) -> None:
+    stats.requests = stats.prompt_tokens = stats.cached_tokens = 0
+    started_at = perf_counter()
+    filtered = await groq_utils.filter_movies_with_groq(
+        # Distinct titles per run so the verdict cache does not hide LLM calls.
+        make_movies(count, f"{label}-{uuid4().hex[:6]}", mixed),
+        requested_item="Дюна",
+        requested_type="movie",
+        expected_titles=["Дюна", "Dune"],
+        year=2021,
+        batch_size=batch_size,
+    )
+    elapsed = perf_counter() - started_at
+    print(
+        f"{label:<10} requests={stats.requests:<4} prompt_tokens={stats.prompt_tokens:<7} "
+        f"cached={stats.cached_tokens:<7} "
+        f"latency={elapsed * 1000:.0f} ms valid={len(filtered)}"
+    )
+
+
+async def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    stats = StubStats()
+    runner = await start_stub(stats)
+    client = AsyncGroq(api_key="stub", base_url="http://127.0.0.1:8765", max_retries=0)
+    groq_utils.verdict_cache = MemoryVerdictCache()
+    # The stub has no rate limits; keep the scheduler from throttling the runs.
+    groq_utils.scheduler = GroqScheduler(
+        lambda **kwargs: client.chat.completions.create(**kwargs),
+        requests_per_minute=10_000,
+        tokens_per_minute=10_000_000,
+        max_concurrency=count,
+    )
+    try:
+        await run("per-item", stats, count, batch_size=1)
+        await run(f"batch={batch_size}", stats, count, batch_size=batch_size)
+        await run("cascade", stats, count, batch_size=batch_size, mixed=True)
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,110 @@
+"""Drive GroqScheduler against a local fake that enforces provider limits.
+
+Usage (from the repository root)::
+
+    GROQ_API_KEY=stub PYTHONPATH=src python benchmarks/bench_groq_scheduler.py
+
+The fake allows ``RPM`` requests and ``TPM`` tokens per rolling minute (time is
+scaled so a "minute" lasts ``MINUTE`` seconds) and answers with a 429 and a
+``retry-after`` header once either limit is exceeded, like the real API.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from types import SimpleNamespace
+
+import httpx
+from groq import RateLimitError
+
+from utilities.groq_scheduler import GroqScheduler, Priority
+
+MINUTE = 2.0
+RPM = 30
+TPM = 20_000
+TOKENS_PER_CALL = 1_500
+CALLS = 60
+
+
+class LimitedFake:
+    def __init__(self) -> None:
+        self._window: deque[tuple[float, int]] = deque()
+        self.accepted = 0
+        self.rejected = 0
+
+    async def create(self, **kwargs) -> SimpleNamespace:
+        now = time.monotonic()
+        while self._window and now - self._window[0][0] >= MINUTE:
+            self._window.popleft()
+        used_tokens = sum(tokens for _, tokens in self._window)
+        if len(self._window) >= RPM or used_tokens + TOKENS_PER_CALL > TPM:
+            self.rejected += 1
+            retry_after = MINUTE - (now - self._window[0][0])
+            response = httpx.Response(
+                429,
+                headers={"retry-after": f"{retry_after:.2f}"},
+                request=httpx.Request("POST", "http://fake/openai/v1/chat/completions"),
+            )
+            raise RateLimitError("rate limited", response=response, body=None)
+        self._window.append((now, TOKENS_PER_CALL))
+        self.accepted += 1
+        await asyncio.sleep(0.05)
+        return SimpleNamespace(usage=SimpleNamespace(total_tokens=TOKENS_PER_CALL))
+
+
+async def unscheduled() -> None:
+    fake = LimitedFake()
+    started_at = time.monotonic()
+    results = await asyncio.gather(
+        *(fake.create() for _ in range(CALLS)), return_exceptions=True
+    )
+    dropped = sum(isinstance(result, Exception) for result in results)
+    print(
+        f"unscheduled: ok={CALLS - dropped} dropped={dropped} "
+        f"429s={fake.rejected} time={time.monotonic() - started_at:.2f}s"
+    )
+
+
+async def scheduled() -> None:
+    fake = LimitedFake()
+    scheduler = GroqScheduler(
+        fake.create,
+        requests_per_minute=RPM,
+        tokens_per_minute=TPM,
+        max_concurrency=4,
+        max_retries=5,
+        base_backoff=0.1,
+        window_seconds=MINUTE,
+    )
+
+    finished: list[Priority] = []
+
+    async def call(priority: Priority) -> None:
+        await scheduler.create(estimated_tokens=TOKENS_PER_CALL, priority=priority)
+        finished.append(priority)
+
+    started_at = time.monotonic()
+    background = [asyncio.create_task(call(Priority.BACKGROUND)) for _ in range(CALLS)]
+    await asyncio.sleep(0)
+    interactive = [asyncio.create_task(call(Priority.INTERACTIVE)) for _ in range(5)]
+    results = await asyncio.gather(*background, *interactive, return_exceptions=True)
+    dropped = sum(isinstance(result, Exception) for result in results)
+    last_interactive = max(
+        i for i, priority in enumerate(finished) if priority == Priority.INTERACTIVE
+    )
+    print(
+        f"scheduled:   ok={len(results) - dropped} dropped={dropped} "
+        f"429s={fake.rejected} time={time.monotonic() - started_at:.2f}s "
+        f"last interactive finished #{last_interactive + 1} of {len(finished)}"
+    )
+
+
+async def main() -> None:
+    await unscheduled()
+    await scheduled()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,120 @@
+"""Compare a client per call with the pooled TMDB client against a local stub.
+
+Usage (from the repository root)::
+
+    PYTHONPATH=src python benchmarks/bench_http_client.py [requests] [concurrency]
+
+The stub answers ``/search/multi`` like TMDB after a small fixed delay. It
+speaks plain HTTP on localhost, so connection setup is far cheaper than a
+real TLS handshake and the measured gap is a lower bound.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+import sys
+from time import perf_counter
+from typing import Any
+
+import httpx
+from aiohttp import web
+
+from services.exceptions import TmdbApiError
+from services.search_integrations.tmdb import TmdbService
+
+STUB_URL = "http://127.0.0.1:8766/3"
+STUB_LATENCY = 0.005
+
+PAYLOAD = {
+    "page": 1,
+    "total_pages": 1,
+    "total_results": 2,
+    "results": [
+        {
+            "id": 438631,
+            "media_type": "movie",
+            "title": "Дюна",
+            "original_title": "Dune",
+            "release_date": "2021-09-15",
+            "poster_path": "/poster.jpg",
+        },
+        {
+            "id": 90228,
+            "media_type": "tv",
+            "name": "Дюна: Пророчество",
+            "original_name": "Dune: Prophecy",
+            "first_air_date": "2024-11-17",
+        },
+    ],
+}
+
+
+class PerCallTmdbService(TmdbService):
+    """The previous behaviour: a fresh ``httpx.AsyncClient`` for every call."""
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+    ) -> bytes:
+        headers = {"Authorization": f"Bearer {self._api_token}"}
+        try:
+            async with httpx.AsyncClient() as client:
+                response = await client.request(
+                    method, f"{self._base_url}{path}", headers=headers, params=params
+                )
+        except httpx.HTTPError as exc:
+            raise TmdbApiError(str(exc)) from exc
+        return response.content
+
+
+async def start_stub() -> web.AppRunner:
+    async def search(request: web.Request) -> web.Response:
+        await asyncio.sleep(STUB_LATENCY)
+        return web.json_response(PAYLOAD)
+
+    app = web.Application()
+    app.router.add_get("/3/search/multi", search)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", 8766).start()
+    return runner
+
+
+async def run(label: str, service: TmdbService, total: int, concurrency: int) -> None:
+    latencies: list[float] = []
+    queue = iter(range(total))
+
+    async def worker() -> None:
+        for _ in queue:
+            started_at = perf_counter()
+            await service.search("Дюна")
+            latencies.append(perf_counter() - started_at)
+
+    started_at = perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = perf_counter() - started_at
+    p95 = statistics.quantiles(latencies, n=20)[-1]
+    print(
+        f"{label:<9} rps={total / elapsed:7.0f} "
+        f"p50={statistics.median(latencies) * 1000:6.1f} ms p95={p95 * 1000:6.1f} ms"
+    )
+    await service.aclose()
+
+
+async def main() -> None:
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    runner = await start_stub()
+    try:
+        await run("per-call", PerCallTmdbService("stub", STUB_URL), total, concurrency)
+        await run("pooled", TmdbService("stub", STUB_URL), total, concurrency)
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,96 @@
+"""Compare callback payload encodings by size and encode/decode time.
+
+Usage (from the repository root)::
+
+    PYTHONPATH=src python benchmarks/bench_payload_serializer.py [rounds]
+
+Payloads are shaped like the ones the search handlers store: a results
+cache entry with a page of torrent results, a season button carrying media
+details and a small result button. "legacy" is the previous plain
+``json.dumps`` text; the others are ``PayloadSerializer`` variants. Variants
+needing a package from the "fast" extra that is not installed are skipped.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from time import perf_counter
+
+from bench_callback_blobs import series_details, torrent_results
+from bot.constants import SEASON_SELECT_CALLBACK
+from services.redis_services import serializer
+from services.redis_services.serializer import PayloadSerializer
+
+
+def payloads() -> dict[str, dict]:
+    details = series_details()
+    movie_dump = details.model_dump(mode="json", by_alias=True, exclude_none=True)
+    results = torrent_results(1, count=40)
+    return {
+        "results": {
+            "results": [result.model_dump(mode="json") for result in results],
+            "requested_item": f"{details.title} 1 сезон",
+            "back_button_text": "⬅️ Назад к сезонам",
+            "tmdb_info": {"original_title": details.original_title, "year": details.year},
+        },
+        "season": {
+            "action": SEASON_SELECT_CALLBACK,
+            "season": 1,
+            "movie": movie_dump,
+            "original_query": "игра престолов",
+            "requested_type": "series",
+        },
+        "button": {
+            "action": "bench",
+            "results_cache_key": "0b6f3a7e-5c1d-4d1e-9f2a-7c3b8e4d2a10",
+            "index": 7,
+        },
+    }
+
+
+class LegacyJson:
+    def dumps(self, value) -> bytes:
+        return json.dumps(value).encode()
+
+    def loads(self, data: bytes):
+        return json.loads(data)
+
+
+def variants() -> dict[str, object]:
+    found = {"legacy": LegacyJson()}
+    for encoding in ("json", "msgpack"):
+        if encoding == "msgpack" and serializer.msgpack is None:
+            continue
+        for compression in ("none", "zlib", "zstd"):
+            if compression == "zstd" and serializer.zstandard is None:
+                continue
+            found[f"{encoding}+{compression}"] = PayloadSerializer(encoding, compression)
+    return found
+
+
+def timed(function, argument, rounds: int) -> float:
+    started_at = perf_counter()
+    for _ in range(rounds):
+        function(argument)
+    return (perf_counter() - started_at) / rounds
+
+
+def main() -> None:
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    print(f"orjson {'on' if serializer.orjson is not None else 'off'}")
+    for name, payload in payloads().items():
+        print(f"\n{name}")
+        for label, codec in variants().items():
+            data = codec.dumps(payload)
+            assert codec.loads(data) == payload
+            encode = timed(codec.dumps, payload, rounds)
+            decode = timed(codec.loads, data, rounds)
+            print(
+                f"  {label:<14} bytes={len(data):7,} "
+                f"encode={encode * 1e6:8.1f} us decode={decode * 1e6:8.1f} us"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Measure event loop lag under concurrent callback traffic, sync vs async Redis.
+
+Usage (from the repository root, with Redis reachable at REDIS_HOST:REDIS_PORT)::
+
+    REDIS_HOST=localhost REDIS_PORT=6379 PYTHONPATH=src python benchmarks/bench_redis_loop_lag.py [updates] [concurrency]
+
+Every simulated update reads the pressed button's payload and saves the
+callback payloads of a ten-button keyboard. "sync" is the previous path: a
+blocking ``redis.Redis``, the payload read by the action filter and again by
+the handler, and one ``SET`` per button. "async" is the current one: the
+shared ``redis.asyncio`` pool, one read by ``CallbackPayloadMiddleware`` and
+the pipelined ``redis_callback_save_many``. A ticker task sleeping 1 ms
+records how late the loop wakes it up, which is the delay every other update
+(and Telegram polling) sees.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import statistics
+import sys
+import uuid
+from time import perf_counter
+
+import redis
+
+from bot.config import REDIS_HOST, REDIS_PORT
+from services.redis_services.client import close_redis
+from utilities.handlers_utils import (
+    redis_callback_get,
+    redis_callback_save,
+    redis_callback_save_many,
+)
+
+ACTION = "bench"
+KEYBOARD_SIZE = 10
+TICK = 0.001
+
+sync_client = redis.Redis(REDIS_HOST, REDIS_PORT, decode_responses=True)
+
+
+def legacy_callback_save(callback_data: dict) -> str:
+    query_key = str(uuid.uuid4())
+    sync_client.set(query_key, json.dumps(callback_data), ex=3600)
+    return query_key
+
+
+def legacy_callback_get(callback_key: str):
+    serialized_data = sync_client.get(callback_key)
+    return json.loads(serialized_data) if serialized_data else None
+
+
+async def sync_update(callback_key: str) -> None:
+    payload = legacy_callback_get(callback_key)
+    if payload and payload.get("action") == ACTION:
+        payload = legacy_callback_get(callback_key)
+        for button in range(KEYBOARD_SIZE):
+            legacy_callback_save({**payload, "button": button})
+
+
+async def async_update(callback_key: str) -> None:
+    payload = await redis_callback_get(callback_key)
+    if payload and payload.get("action") == ACTION:
+        await redis_callback_save_many(
+            [{**payload, "button": button} for button in range(KEYBOARD_SIZE)]
+        )
+
+
+async def run(label: str, update, callback_key: str, total: int, concurrency: int) -> None:
+    lags: list[float] = []
+    stopped = asyncio.Event()
+
+    async def ticker() -> None:
+        while not stopped.is_set():
+            started_at = perf_counter()
+            await asyncio.sleep(TICK)
+            lags.append(perf_counter() - started_at - TICK)
+
+    queue = iter(range(total))
+
+    async def worker() -> None:
+        for _ in queue:
+            await update(callback_key)
+
+    ticker_task = asyncio.create_task(ticker())
+    started_at = perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = perf_counter() - started_at
+    stopped.set()
+    await ticker_task
+
+    lags = lags or [0.0]
+    p99 = statistics.quantiles(lags, n=100)[-1] if len(lags) > 1 else lags[0]
+    print(
+        f"{label:<6} updates/s={total / elapsed:7.0f} "
+        f"loop lag p50={statistics.median(lags) * 1000:6.2f} ms "
+        f"p99={p99 * 1000:6.2f} ms max={max(lags) * 1000:6.2f} ms"
+    )
+
+
+async def main() -> None:
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    callback_key = await redis_callback_save({"action": ACTION, "query": "Дюна"})
+    try:
+        await run("sync", sync_update, callback_key, total, concurrency)
+        await run("async", async_update, callback_key, total, concurrency)
+    finally:
+        sync_client.close()
+        await close_redis()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
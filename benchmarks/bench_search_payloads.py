@@ -0,0 +1,248 @@
+"""Measure metadata payload size and parse time per details call.
+
+Usage (from the repository root)::
+
+    PYTHONPATH=src python benchmarks/bench_search_payloads.py [iterations]
+
+Fixtures are synthetic documents shaped like recorded Kinopoisk
+``/movie/{id}`` and TMDB ``/tv/{id}`` responses (persons, facts, similar
+movies, networks, per-season overviews...). "before" is the previous path:
+the whole document, ``response.json()`` and the full models; "after" is the
+projected Kinopoisk request and the lean models validated straight from bytes.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from datetime import date
+from time import perf_counter
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from models.kinopoisk_types import KinopoiskMovieListResponse
+from models.tmdb_types import TmdbTVShowDetails
+from services.search_integrations.kinopoisk import MOVIE_DETAILS_FIELDS
+
+LOREM = "Семья Атрейдесов прибывает на Арракис, чтобы управлять добычей пряности. " * 3
+
+
+class LegacyKinopoiskMovieDetails(BaseModel):
+    """The full model the service used to validate details with."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    class Name(BaseModel):
+        name: str
+        language: str | None = None
+        type: str | None = None
+
+    class Poster(BaseModel):
+        url: str | None = None
+        preview_url: str | None = Field(default=None, alias="previewUrl")
+
+    class Rating(BaseModel):
+        kp: float | None = None
+        imdb: float | None = None
+
+    class ReleaseYear(BaseModel):
+        start: int | None = None
+        end: int | None = None
+
+    class SeasonInfo(BaseModel):
+        number: int | None = None
+        episodes_count: int | None = Field(default=None, alias="episodesCount")
+
+    id: int
+    name: str | None = None
+    alternative_name: str | None = Field(default=None, alias="alternativeName")
+    en_name: str | None = Field(default=None, alias="enName")
+    type: str | None = None
+    year: int | None = None
+    description: str | None = None
+    short_description: str | None = Field(default=None, alias="shortDescription")
+    status: str | None = None
+    is_series: bool = Field(default=False, alias="isSeries")
+    names: list[Name] = Field(default_factory=list)
+    poster: Poster | None = None
+    rating: Rating | None = None
+    votes: Rating | None = None
+    release_years: list[ReleaseYear] = Field(default_factory=list, alias="releaseYears")
+    seasons_info: list[SeasonInfo] = Field(default_factory=list, alias="seasonsInfo")
+
+
+class LegacyTmdbTVShowDetails(BaseModel):
+    """The TV details model before unused fields were dropped."""
+
+    class Season(BaseModel):
+        id: int
+        name: str
+        overview: str | None = None
+        air_date: date | None = None
+        episode_count: int
+        poster_path: str | None = None
+        season_number: int
+
+    id: int
+    name: str | None = None
+    original_name: str | None = None
+    overview: str | None = None
+    popularity: float | None = None
+    poster_path: str | None = None
+    backdrop_path: str | None = None
+    vote_average: float | None = None
+    vote_count: int | None = None
+    first_air_date: date | None = None
+    number_of_seasons: int
+    number_of_episodes: int
+    seasons: list[Season] = Field(default_factory=list)
+    last_air_date: date | None = None
+
+
+def kinopoisk_movie() -> dict:
+    person = {
+        "id": 1,
+        "photo": "https://st.kp.yandex.net/images/actor_iphone/iphone360_1.jpg",
+        "name": "Тимоти Шаламе",
+        "enName": "Timothée Chalamet",
+        "description": "Paul Atreides",
+        "profession": "актеры",
+        "enProfession": "actor",
+    }
+    similar = {
+        "id": 2,
+        "name": "Дюна: Часть вторая",
+        "enName": None,
+        "alternativeName": "Dune: Part Two",
+        "type": "movie",
+        "poster": {"url": "https://image.example/p.jpg", "previewUrl": "https://image.example/s.jpg"},
+        "rating": {"kp": 8.2, "imdb": 8.5},
+        "year": 2024,
+    }
+    return {
+        "id": 1032606,
+        "name": "Дюна",
+        "alternativeName": "Dune",
+        "enName": None,
+        "type": "tv-series",
+        "typeNumber": 2,
+        "year": 2021,
+        "description": LOREM,
+        "shortDescription": LOREM[:120],
+        "slogan": "Beyond fear, destiny awaits",
+        "status": "completed",
+        "isSeries": True,
+        "names": [{"name": f"Dune {i}", "language": "US", "type": None} for i in range(12)],
+        "poster": {"url": "https://image.example/p.jpg", "previewUrl": "https://image.example/s.jpg"},
+        "backdrop": {"url": "https://image.example/b.jpg", "previewUrl": "https://image.example/bs.jpg"},
+        "rating": {"kp": 7.7, "imdb": 8.0, "filmCritics": 7.2, "russianFilmCritics": 80, "await": None},
+        "votes": {"kp": 500000, "imdb": 800000, "filmCritics": 400, "russianFilmCritics": 20, "await": 1000},
+        "genres": [{"name": "фантастика"}, {"name": "драма"}],
+        "countries": [{"name": "США"}, {"name": "Канада"}],
+        "persons": [{**person, "id": i} for i in range(150)],
+        "facts": [{"value": LOREM, "type": "FACT", "spoiler": False} for _ in range(25)],
+        "similarMovies": [{**similar, "id": i} for i in range(20)],
+        "sequelsAndPrequels": [{**similar, "id": i} for i in range(4)],
+        "videos": {"trailers": [{"url": "https://video.example/t", "name": "Trailer", "site": "youtube"}] * 8},
+        "budget": {"value": 165000000, "currency": "$"},
+        "fees": {"world": {"value": 402027830, "currency": "$"}},
+        "premiere": {"world": "2021-09-03T00:00:00.000Z", "russia": "2021-09-16T00:00:00.000Z"},
+        "releaseYears": [{"start": 2021, "end": 2021}],
+        "seasonsInfo": [{"number": i, "episodesCount": 10} for i in range(1, 4)],
+        "watchability": {"items": [{"name": "Кинопоиск HD", "logo": {"url": "https://x"}, "url": "https://hd"}] * 6},
+    }
+
+
+def tmdb_tv_show() -> dict:
+    return {
+        "id": 1399,
+        "name": "Игра престолов",
+        "original_name": "Game of Thrones",
+        "overview": LOREM,
+        "popularity": 400.5,
+        "poster_path": "/poster.jpg",
+        "backdrop_path": "/backdrop.jpg",
+        "vote_average": 8.4,
+        "vote_count": 22000,
+        "first_air_date": "2011-04-17",
+        "last_air_date": "2019-05-19",
+        "number_of_seasons": 8,
+        "number_of_episodes": 73,
+        "created_by": [{"id": i, "name": "David Benioff", "profile_path": "/p.jpg"} for i in range(2)],
+        "genres": [{"id": 10765, "name": "Sci-Fi & Fantasy"}, {"id": 18, "name": "Drama"}],
+        "networks": [{"id": 49, "name": "HBO", "logo_path": "/l.png", "origin_country": "US"}],
+        "production_companies": [{"id": i, "name": "HBO", "logo_path": "/l.png", "origin_country": "US"} for i in range(6)],
+        "spoken_languages": [{"english_name": "English", "iso_639_1": "en", "name": "English"}],
+        "seasons": [
+            {
+                "id": 3624 + i,
+                "name": f"Сезон {i}",
+                "overview": LOREM,
+                "air_date": f"{2010 + i}-04-17",
+                "episode_count": 10,
+                "poster_path": "/season.jpg",
+                "season_number": i,
+                "vote_average": 8.3,
+            }
+            for i in range(9)
+        ],
+    }
+
+
+def project(document: dict, fields: tuple[str, ...]) -> dict:
+    return {"docs": [{key: document[key] for key in fields if key in document}]}
+
+
+def timed(parse, payload: bytes, iterations: int) -> float:
+    started_at = perf_counter()
+    for _ in range(iterations):
+        parse(payload)
+    return (perf_counter() - started_at) / iterations * 1e6
+
+
+def report(label: str, before: tuple[int, float], after: tuple[int, float]) -> None:
+    print(
+        f"{label:<10} bytes {before[0]:>7} -> {after[0]:>6}   "
+        f"parse {before[1]:7.1f} -> {after[1]:6.1f} us/call"
+    )
+
+
+def legacy_kinopoisk(raw: bytes) -> LegacyKinopoiskMovieDetails:
+    return LegacyKinopoiskMovieDetails.model_validate(json.loads(raw))
+
+
+def legacy_tmdb(raw: bytes) -> LegacyTmdbTVShowDetails:
+    return LegacyTmdbTVShowDetails.model_validate(json.loads(raw))
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    movie = kinopoisk_movie()
+    full = json.dumps(movie).encode()
+    projected = json.dumps(project(movie, MOVIE_DETAILS_FIELDS)).encode()
+    report(
+        "kinopoisk",
+        (
+            len(full),
+            timed(legacy_kinopoisk, full, iterations),
+        ),
+        (
+            len(projected),
+            timed(KinopoiskMovieListResponse.model_validate_json, projected, iterations),
+        ),
+    )
+
+    tv_show = json.dumps(tmdb_tv_show()).encode()
+    report(
+        "tmdb tv",
+        (
+            len(tv_show),
+            timed(legacy_tmdb, tv_show, iterations),
+        ),
+        (len(tv_show), timed(TmdbTVShowDetails.model_validate_json, tv_show, iterations)),
+    )
+
+
+if __name__ == "__main__":
+    main()
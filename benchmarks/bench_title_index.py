@@ -0,0 +1,119 @@
+"""Measure TitleIndex lookup latency and memory on synthetic titles.
+
+Usage (from the repository root)::
+
+    PYTHONPATH=src python benchmarks/bench_title_index.py [titles]
+
+Titles are built from a 20k-word synthetic vocabulary with Zipf-like word
+frequencies, as pairs of localized and original names like search
+providers return. Lookups are prefix queries as typed character by
+character, whole titles, queries starting with very common words and
+misspelled queries that fall back to trigram ranking.
+"""
+
+from __future__ import annotations
+
+import random
+import statistics
+import sys
+import tracemalloc
+from time import perf_counter
+
+from models.search_provider_types import MediaItem, Provider
+from utilities.title_index import TitleIndex
+
+RU_SYLLABLES = "ка ро ми на то ле ва ри до ше лу ма зо ки пе ту ря го".split()
+EN_SYLLABLES = "ka ro mi na to le va ri do she lu ma zo ki pe tu rya go".split()
+# A few very common words, as in real titles ("the", "of", "часть", "сезон").
+COMMON_WORDS = (("часть", "part"), ("война", "war"), ("дом", "house"), ("тень", "shadow"))
+
+
+def make_vocabulary(size: int, rng: random.Random) -> list[tuple[str, str]]:
+    vocabulary = list(COMMON_WORDS)
+    while len(vocabulary) < size:
+        syllables = [rng.randrange(len(RU_SYLLABLES)) for _ in range(rng.randint(2, 4))]
+        vocabulary.append(
+            (
+                "".join(RU_SYLLABLES[s] for s in syllables),
+                "".join(EN_SYLLABLES[s] for s in syllables),
+            )
+        )
+    return vocabulary
+
+
+def make_items(count: int, rng: random.Random) -> list[MediaItem]:
+    vocabulary = make_vocabulary(20_000, rng)
+    # Zipf-like word frequencies: a handful of words appear in many titles.
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+    items = []
+    for i in range(count):
+        words = rng.choices(vocabulary, weights, k=rng.randint(1, 4))
+        items.append(
+            MediaItem(
+                provider_id=f"movie:{i}",
+                provider=Provider.TMDB,
+                title=" ".join(ru for ru, _ in words).capitalize(),
+                original_title=" ".join(en for _, en in words).title(),
+                year=1950 + i % 75,
+                is_series=i % 3 == 0,
+            )
+        )
+    return items
+
+
+def misspell(word: str, rng: random.Random) -> str:
+    position = rng.randrange(1, len(word))
+    return word[:position] + word[position + 1 :]
+
+
+def measure(label: str, index: TitleIndex, queries: list[str]) -> None:
+    latencies = []
+    for query in queries:
+        started_at = perf_counter()
+        index.search(query)
+        latencies.append(perf_counter() - started_at)
+    p95 = statistics.quantiles(latencies, n=20)[-1]
+    print(
+        f"{label:<10} p50={statistics.median(latencies) * 1e6:7.1f} us "
+        f"p95={p95 * 1e6:7.1f} us"
+    )
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rng = random.Random(42)
+    items = make_items(count, rng)
+
+    started_at = perf_counter()
+    index = TitleIndex(max_titles=count)
+    index.add(items)
+    build_time = perf_counter() - started_at
+
+    tracemalloc.start()
+    measured = TitleIndex(max_titles=count)
+    measured.add(items)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"indexed {len(index)} titles in {build_time:.2f}s, "
+        f"{memory / 2**20:.1f} MiB ({memory / len(index):.0f} B/title)"
+    )
+
+    sample = [rng.choice(items) for _ in range(500)]
+    typed = [
+        item.title[:length]
+        for item in sample
+        for length in range(2, min(len(item.title), 12))
+    ]
+    measure("typing", index, typed)
+    measure("words", index, [item.original_title for item in sample])
+    measure("common", index, [f"{ru} {en[:2]}" for ru, en in COMMON_WORDS] * 50)
+    measure(
+        "typos",
+        index,
+        [f"{misspell(item.title.split()[0], rng)}ъ" for item in sample],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Microbenchmark: TitleMatcher vs. the legacy difflib-based fuzzy matcher.
+
+Usage (from the repository root)::
+
+    PYTHONPATH=src python benchmarks/bench_title_matcher.py [titles.txt]
+
+``titles.txt`` is an optional file with one Kinozal release title per line
+(e.g. dumped from browse.php results). Without it a synthetic set of
+Kinozal-formatted titles is generated.
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+from time import perf_counter
+
+from utilities.media_utils import calculate_similarity, clean_title_for_query
+from utilities.title_matcher import TitleMatcher
+
+SEARCHES = [
+    ("Дюна", "Dune"),
+    ("Во все тяжкие", "Breaking Bad"),
+    ("Ёлки", "Yolki"),
+    ("Игра престолов", "Game of Thrones"),
+    ("Мастер и Маргарита", None),
+    ("Оппенгеймер", "Oppenheimer"),
+]
+NOISE_TITLES = [
+    "Интерстеллар / Interstellar",
+    "Тёмный рыцарь / The Dark Knight",
+    "Друзья / Friends",
+    "Дюнкерк / Dunkirk",
+    "Мастер / The Master",
+    "Пираты Карибского моря / Pirates of the Caribbean",
+]
+QUALITIES = ["WEB-DLRip", "WEB-DL (1080p)", "BDRip (720p)", "HDTVRip", "UHD BDRemux (2160p)"]
+AUDIO = ["ДБ", "ПМ, СТ", "ДБ, ЛМ, АП (Гаврилов)", "ПМ (LostFilm)"]
+
+
+def legacy_is_fuzzy_match(result_name: str, expected_titles: list[str]) -> bool:
+    result_clean = clean_title_for_query(result_name).lower()
+    for expected in expected_titles:
+        expected_clean = clean_title_for_query(expected).lower()
+        if expected_clean in result_clean:
+            return True
+        if calculate_similarity(expected, result_name) > 0.4:
+            return True
+    return False
+
+
+def synthetic_titles(count: int) -> list[str]:
+    rng = random.Random(42)
+    names = [" / ".join(t for t in pair if t) for pair in SEARCHES] + NOISE_TITLES
+    titles = []
+    for _ in range(count):
+        name = rng.choice(names)
+        if rng.random() < 0.3:
+            name = f"{name} ({rng.randint(1, 8)} сезон: 1-{rng.randint(6, 12)} серии из 12)"
+        year = rng.randint(1995, 2024)
+        titles.append(
+            f"{name} / {year} / {rng.choice(AUDIO)} / {rng.choice(QUALITIES)}"
+        )
+    return titles
+
+
+def main() -> None:
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], encoding="utf-8") as file_handle:
+            titles = [line.strip() for line in file_handle if line.strip()]
+    else:
+        titles = synthetic_titles(3000)
+
+    legacy_time = fast_time = 0.0
+    agree = legacy_only = fast_only = 0
+    for search in SEARCHES:
+        expected = [t for t in search if t]
+
+        started_at = perf_counter()
+        legacy = [legacy_is_fuzzy_match(title, expected) for title in titles]
+        legacy_time += perf_counter() - started_at
+
+        started_at = perf_counter()
+        matcher = TitleMatcher(expected)
+        fast = [matcher.matches(title) for title in titles]
+        fast_time += perf_counter() - started_at
+
+        for old, new in zip(legacy, fast):
+            agree += old == new
+            legacy_only += old and not new
+            fast_only += new and not old
+
+    total = len(titles) * len(SEARCHES)
+    print(f"titles: {len(titles)}, searches: {len(SEARCHES)}")
+    print(f"legacy matcher: {legacy_time * 1000:.1f} ms")
+    print(f"TitleMatcher:   {fast_time * 1000:.1f} ms ({legacy_time / fast_time:.1f}x)")
+    print(
+        f"agreement: {agree / total:.2%} "
+        f"(legacy-only matches: {legacy_only}, new-only matches: {fast_only})"
+    )
+
+
+if __name__ == "__main__":
+    main()
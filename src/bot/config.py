@@ -5,6 +5,29 @@ from dotenv import load_dotenv
 load_dotenv()
 
 TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
+# Signs self-contained callback_data; defaults to the bot token.
+CALLBACK_SIGNING_KEY = os.getenv("CALLBACK_SIGNING_KEY") or TELEGRAM_BOT_TOKEN
+# Callback payload fields at least this large are stored once per content.
+CALLBACK_BLOB_MIN_BYTES = int(os.getenv("CALLBACK_BLOB_MIN_BYTES", 512))
+# json or msgpack; none, zlib or zstd (msgpack and zstd need the "fast" extra).
+CALLBACK_SERIALIZER = os.getenv("CALLBACK_SERIALIZER", "json").lower()
+CALLBACK_COMPRESSION = os.getenv("CALLBACK_COMPRESSION", "zlib").lower()
+CALLBACK_COMPRESSION_MIN_BYTES = int(os.getenv("CALLBACK_COMPRESSION_MIN_BYTES", 1024))
+# Stored callback payloads expire this long after they were last used.
+CALLBACK_TTL_SECONDS = int(os.getenv("CALLBACK_TTL_SECONDS", 3600))
+# Where stored payloads are kept: redis, sqlite or memory (single process only).
+CALLBACK_STORAGE = os.getenv("CALLBACK_STORAGE", "redis").lower()
+CALLBACK_SQLITE_PATH = os.getenv("CALLBACK_SQLITE_PATH", "callbacks.sqlite3")
+CALLBACK_SQLITE_PURGE_INTERVAL = float(os.getenv("CALLBACK_SQLITE_PURGE_INTERVAL", 60))
+CALLBACK_MEMORY_MAX_ENTRIES = int(os.getenv("CALLBACK_MEMORY_MAX_ENTRIES", 50_000))
+CALLBACK_MEMORY_MAX_BLOB_BYTES = int(os.getenv("CALLBACK_MEMORY_MAX_BLOB_BYTES", 64 * 2**20))
+# Live stored payloads per chat; the least recently used are evicted beyond it.
+CALLBACK_CHAT_MAX_KEYS = int(os.getenv("CALLBACK_CHAT_MAX_KEYS", 1000))
+# In-process cache of recently saved or read payloads, in front of Redis.
+CALLBACK_L1_SIZE = int(os.getenv("CALLBACK_L1_SIZE", 1024))
+CALLBACK_L1_TTL_SECONDS = float(os.getenv("CALLBACK_L1_TTL_SECONDS", 30))
+# Seconds between callback memory reports in the log; 0 disables them.
+CALLBACK_MEMORY_REPORT_INTERVAL = int(os.getenv("CALLBACK_MEMORY_REPORT_INTERVAL", 900))
 BOT_SERVER_PORT = os.getenv("BOT_SERVER_PORT")
 KINOZAL_CREDENTIALS = dict(
     username=os.getenv("KINOZAL_USERNAME"), password=os.getenv("KINOZAL_PASSWORD")
@@ -25,11 +48,24 @@ LOCAL_BUILD = os.getenv("LOCAL_BUILD", 0)
 REDIS_HOST = os.getenv("REDIS_HOST")
 REDIS_PORT = os.getenv("REDIS_PORT")
 REDIS_DB = os.getenv("REDIS_DB")
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", 50))
+REDIS_POOL_TIMEOUT = float(os.getenv("REDIS_POOL_TIMEOUT", 5.0))
 
 PLEX_URL = os.getenv("PLEX_URL")
 PLEX_TOKEN = os.getenv("PLEX_TOKEN")
 
 GROQ_API_KEY = os.getenv("GROQ_API_KEY")
+GROQ_MODEL = os.getenv("GROQ_MODEL", "openai/gpt-oss-20b")
+GROQ_BATCH_SIZE = int(os.getenv("GROQ_BATCH_SIZE", 10))
+GROQ_RESPONSE_FORMAT = os.getenv("GROQ_RESPONSE_FORMAT", "json_object")
+GROQ_REQUESTS_PER_MINUTE = int(os.getenv("GROQ_REQUESTS_PER_MINUTE", 30))
+GROQ_TOKENS_PER_MINUTE = int(os.getenv("GROQ_TOKENS_PER_MINUTE", 8000))
+GROQ_MAX_CONCURRENCY = int(os.getenv("GROQ_MAX_CONCURRENCY", 4))
+GROQ_MAX_RETRIES = int(os.getenv("GROQ_MAX_RETRIES", 3))
+GROQ_CASCADE_ACCEPT_SCORE = float(os.getenv("GROQ_CASCADE_ACCEPT_SCORE", 0.9))
+GROQ_CASCADE_REJECT_SCORE = float(os.getenv("GROQ_CASCADE_REJECT_SCORE", 0.3))
+# Validate torrent search results with the LLM (one call per uncertain batch).
+GROQ_TORRENT_FILTER = os.getenv("GROQ_TORRENT_FILTER", "false").lower() in ("1", "true", "yes")
 
 KINOPOISK_API_URL = os.getenv("KINOPOISK_API_URL", "https://api.poiskkino.dev/v1.4")
 KINOPOISK_API_KEY = os.getenv("KINOPOISK_API_KEY")
@@ -38,7 +74,26 @@ KINOPOISK_SEARCH_LIMIT = int(os.getenv("KINOPOISK_SEARCH_LIMIT", 10))
 TMDB_API_URL = os.getenv("TMDB_API_URL", "https://api.themoviedb.org/3")
 TMDB_API_TOKEN = os.getenv("TMDB_API_TOKEN")
 
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", 3.0))
+HTTP_READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT", 10.0))
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", 20))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", 10))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", 30.0))
+
 SEARCH_PROVIDER = os.getenv("SEARCH_PROVIDER", "tmdb").lower()
+SEARCH_HEDGE_DELAY = float(os.getenv("SEARCH_HEDGE_DELAY", 0.4))
+SEARCH_MERGE_WINDOW = float(os.getenv("SEARCH_MERGE_WINDOW", 0.15))
+INLINE_DEBOUNCE_SECONDS = float(os.getenv("INLINE_DEBOUNCE_SECONDS", 0.35))
+INLINE_RESULTS_LIMIT = int(os.getenv("INLINE_RESULTS_LIMIT", 10))
+INLINE_CACHE_TIME = int(os.getenv("INLINE_CACHE_TIME", 300))
+TITLE_INDEX_MAX_TITLES = int(os.getenv("TITLE_INDEX_MAX_TITLES", 100_000))
+POSTER_CARDS_LIMIT = int(os.getenv("POSTER_CARDS_LIMIT", 5))
+POSTER_DOWNLOAD_CONCURRENCY = int(os.getenv("POSTER_DOWNLOAD_CONCURRENCY", 4))
+POSTER_MAX_BYTES = int(os.getenv("POSTER_MAX_BYTES", 5 * 1024 * 1024))
+SEARCH_CACHE_SEARCH_TTL = int(os.getenv("SEARCH_CACHE_SEARCH_TTL", 60 * 15))
+SEARCH_CACHE_DETAILS_TTL = int(os.getenv("SEARCH_CACHE_DETAILS_TTL", 60 * 60 * 24))
+SEARCH_CACHE_STALE_TTL = int(os.getenv("SEARCH_CACHE_STALE_TTL", 60 * 60 * 24 * 7))
+SEARCH_CACHE_L1_SIZE = int(os.getenv("SEARCH_CACHE_L1_SIZE", 512))
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 TEMPLATES_DIR = os.path.join(BASE_DIR, "..", "templates")
@@ -2,6 +2,7 @@ SEARCH_COMMAND = "search"
 STATUS_COMMAND = "status"
 REFRESH_PLEX_COMMAND = "refresh_plex"
 TORRENT_DEFAULT_CATEGORY = "Movies"
+TORRENT_RESULTS_PAGE_SIZE = 8
 
 # Callbacks Actions
 REFRESH_CALLBACK = "qbt-refresh"
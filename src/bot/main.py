@@ -5,6 +5,7 @@ from aiogram.types import BotCommand
 
 from bot.constants import REFRESH_PLEX_COMMAND, STATUS_COMMAND
 from bot.logger_config import setup_logging
+from bot.middlewares import CallbackNamespaceMiddleware, CallbackPayloadMiddleware
 from config import TELEGRAM_BOT_TOKEN
 from handlers import (
     search_handler,
@@ -15,7 +16,17 @@ from handlers import (
     start_torrent_handler,
     delete_torrent_handler,
     refresh_plex_handler,
+    inline_search_handler,
 )
+from services.callback_storage.registry import close_callback_storage
+from services.redis_services.client import close_redis
+from services.search_integrations.registry import close_search_providers
+from utilities.handlers_utils import (
+    start_callback_memory_reports,
+    stop_callback_memory_reports,
+)
+from utilities.inline_search_utils import warm_title_index
+from utilities.poster_utils import close_poster_downloads
 
 dp = Dispatcher()
 
@@ -23,6 +34,8 @@ dp = Dispatcher()
 async def main() -> None:
     setup_logging()
     bot = Bot(token=TELEGRAM_BOT_TOKEN)
+    dp.update.outer_middleware(CallbackNamespaceMiddleware())
+    dp.callback_query.outer_middleware(CallbackPayloadMiddleware())
     dp.include_routers(
         movie_download_handler.router,
         torrents_statuses_handler.router,
@@ -31,6 +44,7 @@ async def main() -> None:
         start_torrent_handler.router,
         delete_torrent_handler.router,
         refresh_plex_handler.router,
+        inline_search_handler.router,
         search_handler.router,
     )
     await bot.set_my_commands(
@@ -41,6 +55,13 @@ async def main() -> None:
             ),
         ]
     )
+    dp.startup.register(warm_title_index)
+    dp.startup.register(start_callback_memory_reports)
+    dp.shutdown.register(stop_callback_memory_reports)
+    dp.shutdown.register(close_search_providers)
+    dp.shutdown.register(close_poster_downloads)
+    dp.shutdown.register(close_callback_storage)
+    dp.shutdown.register(close_redis)
     await bot.delete_webhook(drop_pending_updates=True)
     await dp.start_polling(bot)
 
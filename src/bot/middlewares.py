@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from aiogram import BaseMiddleware
+from aiogram.types import CallbackQuery, Update
+
+from utilities.handlers_utils import callback_namespace, redis_callback_get
+
+logger = logging.getLogger(__name__)
+
+
+class CallbackNamespaceMiddleware(BaseMiddleware):
+    """Scopes callback payloads saved and read during an update to its chat.
+
+    Registered as an outer middleware on ``dp.update``, after aiogram's own
+    one that resolves ``event_chat``. Updates without a chat (inline queries,
+    buttons of inline messages) keep the default namespace.
+    """
+
+    async def __call__(
+        self,
+        handler: Callable[[Update, dict[str, Any]], Awaitable[Any]],
+        event: Update,
+        data: dict[str, Any],
+    ) -> Any:
+        chat = data.get("event_chat")
+        if chat is None:
+            return await handler(event, data)
+        token = callback_namespace.set(str(chat.id))
+        try:
+            return await handler(event, data)
+        finally:
+            callback_namespace.reset(token)
+
+
+class CallbackPayloadMiddleware(BaseMiddleware):
+    """Resolves the stored payload of a callback query once per update.
+
+    Registered as an outer middleware on the dispatcher, it runs before any
+    router filter. The decoded payload is passed on as ``callback_payload``
+    (``None`` when the key is unknown or expired), so ``ActionFilter`` routes
+    by ``action`` and handlers read the payload without another storage lookup.
+    """
+
+    async def __call__(
+        self,
+        handler: Callable[[CallbackQuery, dict[str, Any]], Awaitable[Any]],
+        event: CallbackQuery,
+        data: dict[str, Any],
+    ) -> Any:
+        data["callback_payload"] = (
+            await redis_callback_get(event.data) if event.data else None
+        )
+        return await handler(event, data)
+
+
+__all__ = ["CallbackNamespaceMiddleware", "CallbackPayloadMiddleware"]
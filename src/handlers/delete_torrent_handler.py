@@ -9,20 +9,23 @@ from bot.constants import TORRENT_DELETE_CALLBACK
 from handlers.torrents_statuses_handler import refresh_all_status
 from services.qbt_services import get_client
 from services.qbt_services.qbt_torrent_pause_start_delete import delete_torrent
-from utilities.handlers_utils import check_action, redis_callback_get
+from utilities.handlers_utils import ActionFilter
 
 logger = logging.getLogger(__name__)
 router = Router(name=__name__)
 
 
-@router.callback_query(lambda c: check_action(c.data, TORRENT_DELETE_CALLBACK))
-async def handle_torrent_delete(callback_query: CallbackQuery):
+@router.callback_query(ActionFilter(TORRENT_DELETE_CALLBACK))
+async def handle_torrent_delete(
+    callback_query: CallbackQuery, callback_payload: dict
+):
     """
     Handles the delete button for a torrent.
 
     :param callback_query: CallbackQuery object.
+    :param callback_payload: Stored payload of the pressed button.
     """
-    torrent_hash = redis_callback_get(callback_query.data).get("torrent_hash")
+    torrent_hash = callback_payload.get("torrent_hash")
     logger.info(f"Delete torrent {torrent_hash}")
     if not torrent_hash:
         await callback_query.answer("Torrent hash not found.")
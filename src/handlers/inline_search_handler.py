@@ -0,0 +1,30 @@
+import logging
+
+from aiogram import Router
+from aiogram.types import InlineQuery
+
+from bot.config import INLINE_CACHE_TIME
+from services.exceptions import KinopoiskApiError, TmdbApiError
+from utilities.inline_search_utils import build_inline_results, inline_search
+
+logger = logging.getLogger(__name__)
+router = Router(name=__name__)
+
+
+@router.inline_query()
+async def handle_inline_query(inline_query: InlineQuery):
+    query = inline_query.query.strip()
+    if not query:
+        await inline_query.answer([], cache_time=INLINE_CACHE_TIME)
+        return
+
+    try:
+        items = await inline_search(query, inline_query.from_user.id)
+    except (KinopoiskApiError, TmdbApiError) as exc:
+        logger.warning("Inline search API error for '%s': %s", query, exc)
+        items = []
+
+    if items is None:
+        # Superseded by a newer query from the same user.
+        return
+    await inline_query.answer(build_inline_results(items), cache_time=INLINE_CACHE_TIME)
@@ -15,7 +15,7 @@ from models.movie_detail_service_types import MovieDetails, MovieSearchResult
 from torrents import get_torrent_provider
 from services.qbt_services import qbt_get_categories, get_client
 from utilities import kinozal_utils, handlers_utils
-from utilities.handlers_utils import check_action
+from utilities.handlers_utils import ActionFilter
 from pydantic import ValidationError
 
 logger = logging.getLogger(__name__)
@@ -24,24 +24,27 @@ router = Router(name=__name__)
 torrent_provider = get_torrent_provider()
 
 
-@router.callback_query(lambda c: check_action(c.data, MOVIE_DETAILED_CALLBACK))
-async def handle_movie_selection(callback_query: CallbackQuery):
+@router.callback_query(ActionFilter(MOVIE_DETAILED_CALLBACK))
+async def handle_movie_selection(
+    callback_query: CallbackQuery, callback_payload: dict
+):
     """Handle torrent selection and display detailed information."""
-    callback_data = handlers_utils.redis_callback_get(callback_query.data)
-    movie_id = callback_data.get("movie_id")
-    results_cache_key = callback_data.get("results_cache_key")
-    tmdb_info = callback_data.get("tmdb_info")
+    movie_id = callback_payload.get("movie_id")
+    results_cache_key = callback_payload.get("results_cache_key")
+    tmdb_info = callback_payload.get("tmdb_info")
+    page = callback_payload.get("page", 0)
     
     logger.info(f"Movie selected with ID: {movie_id}")
 
     try:
-        movie_details = await _get_movie_details(callback_data, movie_id)
+        movie_details = await _get_movie_details(callback_payload, movie_id)
         await send_movie_details(
             callback_query,
             movie_details,
             movie_id,
             results_cache_key,
             tmdb_info=tmdb_info,
+            page=page,
         )
     except Exception as e:
         logger.error(f"Error in fetching movie details: {e}", exc_info=True)
@@ -72,6 +75,7 @@ async def send_movie_details(
     movie_id: int | str,
     results_cache_key: str | None,
     tmdb_info: dict | None = None,
+    page: int = 0,
 ) -> None:
     """Send formatted movie details with download buttons."""
     message_caption = format_movie_details_message(movie_details)
@@ -80,46 +84,53 @@ async def send_movie_details(
     qbt_client = await get_client(**QBT_CREDENTIALS)
     categories = await qbt_get_categories(qbt_client)
 
-    reply_markup = create_reply_markup(
+    reply_markup = await create_reply_markup(
         movie_id,
         movie_details.name,
         categories,
         results_cache_key,
         tmdb_info=tmdb_info,
+        page=page,
     )
     await callback_query.message.edit_text(
         message_caption, parse_mode=ParseMode.HTML, reply_markup=reply_markup
     )
 
 
-def create_reply_markup(
+async def create_reply_markup(
     movie_id: int | str,
     query: str,
     categories: list[str],
     results_cache_key: str | None,
     tmdb_info: dict | None = None,
+    page: int = 0,
 ) -> InlineKeyboardMarkup:
     """Create inline keyboard with download buttons and navigation."""
-    download_buttons = [
-        InlineKeyboardButton(
-            text=f"{category} 🔽",
-            callback_data=handlers_utils.redis_callback_save({
+    *download_keys, back_key = await handlers_utils.redis_callback_save_many([
+        *(
+            {
                 "action": DOWNLOAD_TORRENT_CALLBACK,
                 "movie_id": movie_id,
                 "category": category,
                 "query": query,
                 "tmdb_info": tmdb_info,
-            }),
-        )
-        for category in categories
+            }
+            for category in categories
+        ),
+        {
+            "action": SEARCH_MOVIE_CALLBACK,
+            "results_cache_key": results_cache_key,
+            "page": page,
+        },
+    ])
+    download_buttons = [
+        InlineKeyboardButton(text=f"{category} 🔽", callback_data=callback_key)
+        for category, callback_key in zip(categories, download_keys)
     ]
 
     back_button = InlineKeyboardButton(
         text="Назад к результатам поиска",
-        callback_data=handlers_utils.redis_callback_save({
-            "action": SEARCH_MOVIE_CALLBACK,
-            "results_cache_key": results_cache_key,
-        }),
+        callback_data=back_key,
     )
     
     kinozal_button = InlineKeyboardButton(
@@ -10,7 +10,7 @@ from services.qbt_services import get_client
 from services.qbt_services.qbt_add_and_rename import add_torrent_and_rename
 from torrents import get_torrent_provider
 from torrents.interfaces import DownloadResult
-from utilities.handlers_utils import check_action, redis_callback_get
+from utilities.handlers_utils import ActionFilter
 
 torrent_provider = get_torrent_provider()
 
@@ -18,13 +18,14 @@ router = Router(name=__name__)
 logger = logging.getLogger(__name__)
 
 
-@router.callback_query(lambda c: check_action(c.data, DOWNLOAD_TORRENT_CALLBACK))
-async def handle_movie_download(callback_query: CallbackQuery):
+@router.callback_query(ActionFilter(DOWNLOAD_TORRENT_CALLBACK))
+async def handle_movie_download(
+    callback_query: CallbackQuery, callback_payload: dict
+):
     """Handle torrent download and add to qBittorrent."""
-    callback_data = redis_callback_get(callback_query.data)
-    movie_id = callback_data.get("movie_id")
-    category = callback_data.get("category")
-    tmdb_info = callback_data.get("tmdb_info")
+    movie_id = callback_payload.get("movie_id")
+    category = callback_payload.get("category")
+    tmdb_info = callback_payload.get("tmdb_info")
     
     logger.info(f"Handling download request for movie ID: {movie_id}")
 
@@ -7,21 +7,24 @@ from aiogram.types import CallbackQuery
 from bot.config import QBT_CREDENTIALS
 from bot.constants import TORRENT_PAUSE_CALLBACK
 from services.qbt_services import get_client, pause_torrent
-from utilities.handlers_utils import check_action, redis_callback_get
+from utilities.handlers_utils import ActionFilter
 from .torrent_detailed_handler import handle_torrent_button, get_inline_keyboard
 
 logger = logging.getLogger(__name__)
 router = Router(name=__name__)
 
 
-@router.callback_query(lambda c: check_action(c.data, TORRENT_PAUSE_CALLBACK))
-async def handle_torrent_pause(callback_query: CallbackQuery):
+@router.callback_query(ActionFilter(TORRENT_PAUSE_CALLBACK))
+async def handle_torrent_pause(
+    callback_query: CallbackQuery, callback_payload: dict
+):
     """
     Handles the pause button for a torrent.
 
     :param callback_query: CallbackQuery object.
+    :param callback_payload: Stored payload of the pressed button.
     """
-    torrent_hash = redis_callback_get(callback_query.data).get("torrent_hash")
+    torrent_hash = callback_payload.get("torrent_hash")
     logger.info(f"Pausing torrent {torrent_hash}")
     if not torrent_hash:
         await callback_query.answer("Torrent hash not found.")
@@ -31,7 +34,7 @@ async def handle_torrent_pause(callback_query: CallbackQuery):
             await pause_torrent(qbt_client, torrent_hash)
             await callback_query.answer("Torrent resumed.")
             await asyncio.sleep(4)
-            await handle_torrent_button(callback_query)
+            await handle_torrent_button(callback_query, callback_payload)
         except Exception as e:
             logger.error(f"Error in pausing torrent: {e}", exc_info=True)
             await callback_query.answer("Failed to pause torrent.")
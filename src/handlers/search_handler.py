@@ -13,8 +13,7 @@ from bot.constants import (
 from services.exceptions import KinopoiskApiError, NoResultsFoundError, TmdbApiError
 from utilities import media_utils
 from utilities.handlers_utils import (
-    check_action,
-    redis_callback_get,
+    ActionFilter,
     redis_callback_save,
 )
 from utilities.media_search_utils import (
@@ -41,7 +40,7 @@ async def handle_search_query(message: Message):
     status_message = await message.answer(f"Ищу «{query}»...")
 
     try:
-        await show_media_results(query, status_message)
+        await show_media_results(query, status_message, with_posters=True)
     except NoResultsFoundError:
         logger.info("Search for '%s' returned no results.", query)
         await status_message.edit_text(
@@ -59,43 +58,42 @@ async def handle_search_query(message: Message):
         await status_message.edit_text("Произошла непредвиденная ошибка при поиске.")
 
 
-@router.callback_query(lambda c: check_action(c.data, SEARCH_MOVIE_CALLBACK))
-async def handle_search_callback(callback_query: CallbackQuery):
-    if not (search_info := redis_callback_get(callback_query.data)):
-        await callback_query.answer(
-            "Не удалось получить данные для поиска.", show_alert=True
-        )
-        return
-
+@router.callback_query(ActionFilter(SEARCH_MOVIE_CALLBACK))
+async def handle_search_callback(
+    callback_query: CallbackQuery, callback_payload: dict
+):
     if (
-        cache_key := search_info.get("results_cache_key")
-    ) and await show_cached_torrent_results(callback_query.message, cache_key):
+        cache_key := callback_payload.get("results_cache_key")
+    ) and await show_cached_torrent_results(
+        callback_query.message, cache_key, page=callback_payload.get("page", 0)
+    ):
         await callback_query.answer()
         return
 
-    if not (query := search_info.get("query")):
+    if not (query := callback_payload.get("query")):
         await callback_query.answer(
             "Недостаточно данных для нового поиска.", show_alert=True
         )
         return
 
-    movie_details = await get_details_from_callback(search_info)
+    movie_details = await get_details_from_callback(callback_payload)
 
     await perform_torrent_search(
         query,
         callback_query.message,
         callback_query,
-        requested_item=search_info.get("requested_item"),
-        requested_type=search_info.get("requested_type"),
+        requested_item=callback_payload.get("requested_item"),
+        requested_type=callback_payload.get("requested_type"),
         media_details=movie_details,
     )
     await callback_query.answer()
 
 
-@router.callback_query(lambda c: check_action(c.data, MEDIA_LIST_CALLBACK))
-async def handle_media_results_list(callback_query: CallbackQuery):
-    redis_data = redis_callback_get(callback_query.data)
-    query = redis_data.get("query") if redis_data else None
+@router.callback_query(ActionFilter(MEDIA_LIST_CALLBACK))
+async def handle_media_results_list(
+    callback_query: CallbackQuery, callback_payload: dict
+):
+    query = callback_payload.get("query")
 
     if not query:
         await callback_query.answer("Не удалось обновить список.", show_alert=True)
@@ -115,13 +113,11 @@ async def handle_media_results_list(callback_query: CallbackQuery):
         await callback_query.answer()
 
 
-@router.callback_query(lambda c: check_action(c.data, MEDIA_SELECT_CALLBACK))
-async def handle_media_selection(callback_query: CallbackQuery):
-    if not (redis_data := redis_callback_get(callback_query.data)):
-        await callback_query.answer("Не удалось обработать выбор.", show_alert=True)
-        return
-
-    if not (movie_details := await get_details_from_callback(redis_data)):
+@router.callback_query(ActionFilter(MEDIA_SELECT_CALLBACK))
+async def handle_media_selection(
+    callback_query: CallbackQuery, callback_payload: dict
+):
+    if not (movie_details := await get_details_from_callback(callback_payload)):
         await callback_query.answer("Не удалось получить детали.", show_alert=True)
         return
 
@@ -134,9 +130,9 @@ async def handle_media_selection(callback_query: CallbackQuery):
             callback_query,
             movie_details,
             seasons,
-            original_query=redis_data.get("query"),
-            requested_item=redis_data.get("requested_item"),
-            requested_type=redis_data.get("requested_type", "series"),
+            original_query=callback_payload.get("query"),
+            requested_item=callback_payload.get("requested_item"),
+            requested_type=callback_payload.get("requested_type", "series"),
         )
         await callback_query.answer()
         return
@@ -144,14 +140,14 @@ async def handle_media_selection(callback_query: CallbackQuery):
     # Handle movie search or series without seasons
     search_query = media_utils.build_torrent_query_from_media_details(movie_details)
     search_context = (
-        (redis_data.get("query") or "").strip()
-        or (redis_data.get("requested_item") or "").strip()
+        (callback_payload.get("query") or "").strip()
+        or (callback_payload.get("requested_item") or "").strip()
         or movie_details.title
     )
 
     back_callback_key = None
     if search_context:
-        back_callback_key = redis_callback_save(
+        back_callback_key = await redis_callback_save(
             {
                 "action": MEDIA_LIST_CALLBACK,
                 "query": search_context,
@@ -162,8 +158,8 @@ async def handle_media_selection(callback_query: CallbackQuery):
         search_query,
         callback_query.message,
         callback_query,
-        requested_item=redis_data.get("requested_item"),
-        requested_type=redis_data.get("requested_type", "movie"),
+        requested_item=callback_payload.get("requested_item"),
+        requested_type=callback_payload.get("requested_type", "movie"),
         back_callback_key=back_callback_key,
         back_button_text="⬅️ Назад к результатам поиска",
         media_details=movie_details,
@@ -171,21 +167,21 @@ async def handle_media_selection(callback_query: CallbackQuery):
     await callback_query.answer()
 
 
-@router.callback_query(lambda c: check_action(c.data, SEASON_SELECT_CALLBACK))
-async def handle_season_selection(callback_query: CallbackQuery):
-    if not (
-        redis_data := redis_callback_get(callback_query.data)
-    ) or not redis_data.get("season"):
+@router.callback_query(ActionFilter(SEASON_SELECT_CALLBACK))
+async def handle_season_selection(
+    callback_query: CallbackQuery, callback_payload: dict
+):
+    if not callback_payload.get("season"):
         await callback_query.answer("Не удалось определить сезон.", show_alert=True)
         return
 
-    if not (movie_details := await get_details_from_callback(redis_data)):
+    if not (movie_details := await get_details_from_callback(callback_payload)):
         await callback_query.answer(
             "Не удалось получить детали для сезона.", show_alert=True
         )
         return
 
-    season_number = int(redis_data["season"])
+    season_number = int(callback_payload["season"])
     season_year = next(
         (s.year for s in movie_details.seasons if s.season_number == season_number),
         None,
@@ -197,20 +193,20 @@ async def handle_season_selection(callback_query: CallbackQuery):
         season_year=season_year,
     )
 
-    requested_item = redis_data.get("requested_item", movie_details.title)
+    requested_item = callback_payload.get("requested_item", movie_details.title)
     validation_item = (
         f"{requested_item} {season_number} сезон" if requested_item else None
     )
 
-    back_callback_key = redis_callback_save(
+    back_callback_key = await redis_callback_save(
         {
             "action": SEASON_LIST_CALLBACK,
             "movie_id": movie_details.provider_id,
-            "movie": redis_data.get("movie"),
-            "movie_details": redis_data.get("movie_details") or redis_data.get("movie"),
-            "original_query": redis_data.get("original_query"),
-            "requested_item": redis_data.get("requested_item") or movie_details.title,
-            "requested_type": redis_data.get("requested_type", "series"),
+            "movie": callback_payload.get("movie"),
+            "movie_details": callback_payload.get("movie_details") or callback_payload.get("movie"),
+            "original_query": callback_payload.get("original_query"),
+            "requested_item": callback_payload.get("requested_item") or movie_details.title,
+            "requested_type": callback_payload.get("requested_type", "series"),
         }
     )
 
@@ -219,7 +215,7 @@ async def handle_season_selection(callback_query: CallbackQuery):
         callback_query.message,
         callback_query,
         requested_item=validation_item,
-        requested_type=redis_data.get("requested_type", "series"),
+        requested_type=callback_payload.get("requested_type", "series"),
         back_callback_key=back_callback_key,
         back_button_text="⬅️ Назад к сезонам",
         media_details=movie_details,
@@ -228,15 +224,11 @@ async def handle_season_selection(callback_query: CallbackQuery):
     await callback_query.answer()
 
 
-@router.callback_query(lambda c: check_action(c.data, SEASON_LIST_CALLBACK))
-async def handle_season_list(callback_query: CallbackQuery):
-    if not (redis_data := redis_callback_get(callback_query.data)):
-        await callback_query.answer(
-            "Не удалось вернуть список сезонов.", show_alert=True
-        )
-        return
-
-    if not (movie_details := await get_details_from_callback(redis_data)):
+@router.callback_query(ActionFilter(SEASON_LIST_CALLBACK))
+async def handle_season_list(
+    callback_query: CallbackQuery, callback_payload: dict
+):
+    if not (movie_details := await get_details_from_callback(callback_payload)):
         await callback_query.answer(
             "Не удалось получить информацию о сериале.", show_alert=True
         )
@@ -253,8 +245,8 @@ async def handle_season_list(callback_query: CallbackQuery):
         callback_query,
         movie_details,
         seasons,
-        original_query=redis_data.get("original_query"),
-        requested_item=redis_data.get("requested_item") or movie_details.title,
-        requested_type=redis_data.get("requested_type", "series"),
+        original_query=callback_payload.get("original_query"),
+        requested_item=callback_payload.get("requested_item") or movie_details.title,
+        requested_type=callback_payload.get("requested_type", "series"),
     )
     await callback_query.answer()
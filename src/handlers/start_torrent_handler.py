@@ -9,20 +9,23 @@ from bot.constants import TORRENT_START_CALLBACK
 from handlers.torrent_detailed_handler import handle_torrent_button, get_inline_keyboard
 from services.qbt_services import get_client
 from services.qbt_services.qbt_torrent_pause_start_delete import resume_torrent
-from utilities.handlers_utils import check_action, redis_callback_get
+from utilities.handlers_utils import ActionFilter
 
 logger = logging.getLogger(__name__)
 router = Router(name=__name__)
 
 
-@router.callback_query(lambda c: check_action(c.data, TORRENT_START_CALLBACK))
-async def handle_torrent_start(callback_query: CallbackQuery):
+@router.callback_query(ActionFilter(TORRENT_START_CALLBACK))
+async def handle_torrent_start(
+    callback_query: CallbackQuery, callback_payload: dict
+):
     """
     Handles the resume button for a torrent.
 
     :param callback_query: CallbackQuery object.
+    :param callback_payload: Stored payload of the pressed button.
     """
-    torrent_hash = redis_callback_get(callback_query.data).get("torrent_hash")
+    torrent_hash = callback_payload.get("torrent_hash")
     logger.info(f"Resuming torrent {torrent_hash}")
     if not torrent_hash:
         await callback_query.answer("Torrent hash not found.")
@@ -32,7 +35,7 @@ async def handle_torrent_start(callback_query: CallbackQuery):
             await resume_torrent(qbt_client, torrent_hash)
             await callback_query.answer("Torrent resumed.")
             await asyncio.sleep(4)
-            await handle_torrent_button(callback_query)
+            await handle_torrent_button(callback_query, callback_payload)
         except Exception as e:
             logger.error(f"Error in resume torrent: {e}", exc_info=True)
             await callback_query.answer("Failed to resume torrent.")
@@ -22,9 +22,8 @@ from utilities.format_utils import (
     format_eta,
 )
 from utilities.handlers_utils import (
-    check_action,
-    redis_callback_get,
-    redis_callback_save,
+    ActionFilter,
+    redis_callback_save_many,
 )
 
 router = Router(name=__name__)
@@ -56,7 +55,7 @@ def create_detail_message(torrent: TorrentInfo) -> str:
     )
 
 
-def get_inline_keyboard(
+async def get_inline_keyboard(
     torrent_hash: str, is_paused: bool = True, is_downloading: bool = False
 ) -> InlineKeyboardMarkup:
     """
@@ -67,57 +66,42 @@ def get_inline_keyboard(
     :param torrent_hash: Unique hash of the torrent.
     :return: InlineKeyboardMarkup object for the torrent.
     """
-    action_buttons = [
-        InlineKeyboardButton(
-            text="Delete",
-            callback_data=redis_callback_save(
-                {"action": TORRENT_DELETE_CALLBACK, "torrent_hash": torrent_hash}
-            ),
-        ),
-    ]
+    actions = [("Delete", TORRENT_DELETE_CALLBACK)]
     if is_downloading:
-        action_buttons += [
-            InlineKeyboardButton(
-                text="Pause",
-                callback_data=redis_callback_save(
-                    {"action": TORRENT_PAUSE_CALLBACK, "torrent_hash": torrent_hash}
-                ),
-            ),
-        ]
+        actions.append(("Pause", TORRENT_PAUSE_CALLBACK))
     elif is_paused:
-        action_buttons += [
-            InlineKeyboardButton(
-                text="Start",
-                callback_data=redis_callback_save(
-                    {"action": TORRENT_START_CALLBACK, "torrent_hash": torrent_hash}
-                ),
-            ),
-        ]
+        actions.append(("Start", TORRENT_START_CALLBACK))
+    actions.append(("Refresh", TORRENT_DETAILED_CALLBACK))
+
+    callback_keys = await redis_callback_save_many(
+        [{"action": action, "torrent_hash": torrent_hash} for _, action in actions]
+    )
+    *action_buttons, refresh_button = [
+        InlineKeyboardButton(text=text, callback_data=callback_key)
+        for (text, _), callback_key in zip(actions, callback_keys)
+    ]
 
     buttons = [
         action_buttons,
         [
-            InlineKeyboardButton(
-                text="Refresh",
-                callback_data=redis_callback_save(
-                    {"action": TORRENT_DETAILED_CALLBACK, "torrent_hash": torrent_hash}
-                ),
-            ),
+            refresh_button,
             InlineKeyboardButton(text="Back", callback_data=REFRESH_CALLBACK),
         ],
     ]
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
 
-@router.callback_query(lambda c: check_action(c.data, TORRENT_DETAILED_CALLBACK))
-async def handle_torrent_button(callback_query: CallbackQuery):
+@router.callback_query(ActionFilter(TORRENT_DETAILED_CALLBACK))
+async def handle_torrent_button(
+    callback_query: CallbackQuery, callback_payload: dict
+):
     """
     Handles the callback query for a torrent button.
 
     :param callback_query: CallbackQuery object from the user interaction.
+    :param callback_payload: Stored payload of the pressed button.
     """
-    callback_data = redis_callback_get(callback_query.data)
-    torrent_hash = callback_data.get("torrent_hash")
+    torrent_hash = callback_payload.get("torrent_hash")
     if not torrent_hash:
         await callback_query.answer("Torrent hash not found.")
         return
@@ -139,7 +123,7 @@ async def handle_torrent_button(callback_query: CallbackQuery):
     await callback_query.message.edit_text(
         message,
         parse_mode="HTML",
-        reply_markup=get_inline_keyboard(
+        reply_markup=await get_inline_keyboard(
             torrent_hash,
             is_downloading=torrent_details.state
             in (TorrentState.DOWNLOADING, TorrentState.STALLED_DL),
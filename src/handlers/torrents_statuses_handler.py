@@ -16,7 +16,7 @@ from bot.constants import STATUS_COMMAND, REFRESH_CALLBACK, TORRENT_DETAILED_CAL
 from services.qbt_services import get_client
 from services.qbt_services.qbt_status import torrents_info
 from utilities.common import truncate_string
-from utilities.handlers_utils import redis_callback_save
+from utilities.handlers_utils import redis_callback_save_many
 
 router = Router(name=__name__)
 logger = logging.getLogger(__name__)
@@ -42,20 +42,22 @@ async def get_torrents() -> list:
         return []
 
 
-def get_inline_keyboard(torrents):
+async def get_inline_keyboard(torrents):
     """Creates an inline keyboard with a button for each torrent."""
-    buttons = []
-    for torrent in torrents:
-        callback_data = redis_callback_save(
+    callback_keys = await redis_callback_save_many(
+        [
             {"action": TORRENT_DETAILED_CALLBACK, "torrent_hash": torrent.hash}
-        )
-        buttons.append(
-            [
-                InlineKeyboardButton(
-                    text=format_status_message(torrent), callback_data=callback_data
-                )
-            ]
-        )
+            for torrent in torrents
+        ]
+    )
+    buttons = [
+        [
+            InlineKeyboardButton(
+                text=format_status_message(torrent), callback_data=callback_data
+            )
+        ]
+        for torrent, callback_data in zip(torrents, callback_keys)
+    ]
 
     buttons.append(
         [InlineKeyboardButton(text="Refresh All", callback_data=REFRESH_CALLBACK)]
@@ -66,14 +68,14 @@ def get_inline_keyboard(torrents):
 async def send_status_message(message: Message):
     """Sends the current status message in response to a user's command."""
     torrents = await get_torrents()
-    keyboard = get_inline_keyboard(torrents)
+    keyboard = await get_inline_keyboard(torrents)
     await message.answer("Select a torrent:", reply_markup=keyboard)
 
 
 async def refresh_status_message(callback_query: CallbackQuery):
     """Sends the current status message in response to a user's command."""
     torrents = await get_torrents()
-    keyboard = get_inline_keyboard(torrents)
+    keyboard = await get_inline_keyboard(torrents)
     try:
         await callback_query.message.edit_text(
             "Select a torrent:", reply_markup=keyboard
@@ -13,11 +13,7 @@ class TmdbBase(BaseModel):
 class TmdbSearchResult(TmdbBase):
     id: int
     overview: str | None = None
-    popularity: float | None = None
     poster_path: str | None = Field(default=None, alias="poster_path")
-    backdrop_path: str | None = Field(default=None, alias="backdrop_path")
-    vote_average: float | None = Field(default=None, alias="vote_average")
-    vote_count: int | None = Field(default=None, alias="vote_count")
     media_type: str | None = Field(default=None, alias="media_type")
 
 
@@ -68,20 +64,13 @@ class TmdbSearchResponse(TmdbBase):
 
 
 class TmdbSeason(TmdbBase):
-    id: int
-    name: str
-    overview: str | None = None
     air_date: date | None = Field(default=None, alias="air_date")
     episode_count: int = Field(alias="episode_count")
-    poster_path: str | None = Field(default=None, alias="poster_path")
     season_number: int = Field(alias="season_number")
 
 
 class TmdbTVShowDetails(TmdbTVShowSearchResult):
-    number_of_seasons: int = Field(alias="number_of_seasons")
-    number_of_episodes: int = Field(alias="number_of_episodes")
     seasons: list[TmdbSeason] = Field(default_factory=list)
-    last_air_date: date | None = Field(default=None, alias="last_air_date")
 
 
 class TmdbMovieDetails(TmdbMovieSearchResult):
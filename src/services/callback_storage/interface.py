@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
+
+from bot.config import CALLBACK_CHAT_MAX_KEYS, CALLBACK_TTL_SECONDS
+
+# Pseudo-namespace under which ``usage`` reports the shared blobs.
+BLOBS_NAMESPACE = "blobs"
+
+
+class CallbackStorage(ABC):
+    """Stores serialized callback payloads per namespace (a chat).
+
+    Entries expire ``ttl`` seconds after they were last used; beyond
+    ``max_keys`` live entries in a namespace, the least recently used ones
+    are evicted. Blobs are shared between namespaces and expire ``ttl``
+    seconds after they were last written or read, so an entry can outlive
+    the blobs it references.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: int = CALLBACK_TTL_SECONDS,
+        max_keys: int = CALLBACK_CHAT_MAX_KEYS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.ttl = ttl
+        self.max_keys = max_keys
+        self._clock = clock
+        self._pending_touches: dict[str, dict[str, float]] = {}
+
+    @abstractmethod
+    async def save(
+        self, namespace: str, entries: dict[str, bytes], blobs: dict[str, bytes]
+    ) -> list[str]:
+        """Store entries and blobs; return the keys evicted from the namespace."""
+
+    @abstractmethod
+    async def get(self, namespace: str, key: str) -> bytes | None:
+        """Read an entry, marking it used and sliding its TTL."""
+
+    @abstractmethod
+    async def get_blobs(self, digests: list[str]) -> list[bytes | None]:
+        """Read blobs aligned with ``digests``, sliding their TTL."""
+
+    @abstractmethod
+    async def delete(self, namespace: str, keys: Iterable[str]) -> None: ...
+
+    @abstractmethod
+    async def usage(self) -> dict[str, tuple[int, int]]:
+        """Live entries and their key plus value bytes, by namespace."""
+
+    def touch(self, namespace: str, key: str) -> None:
+        """Record a use of an entry served from a cache in front of the storage.
+
+        Uses are applied with the namespace's next ``save`` or ``get``, so
+        serving from the cache costs no round-trip.
+        """
+        self._pending_touches.setdefault(namespace, {})[key] = self._clock()
+
+    async def aclose(self) -> None:
+        """Release connections held by the storage."""
+
+    def _take_touches(self, namespace: str) -> dict[str, float]:
+        return self._pending_touches.pop(namespace, {})
+
+
+__all__ = ["BLOBS_NAMESPACE", "CallbackStorage"]
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import logging
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from bot.config import CALLBACK_MEMORY_MAX_BLOB_BYTES, CALLBACK_MEMORY_MAX_ENTRIES
+from services.callback_storage.interface import BLOBS_NAMESPACE, CallbackStorage
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class _Stored:
+    value: bytes
+    expires_at: float
+
+
+class MemoryCallbackStorage(CallbackStorage):
+    """Callback storage kept in the bot process.
+
+    Needs no service, but payloads are lost on restart and are not shared
+    between processes. Besides the per-namespace limit, at most
+    ``max_entries`` entries and ``max_blob_bytes`` of blobs are kept overall,
+    the least recently used going first.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = CALLBACK_MEMORY_MAX_ENTRIES,
+        max_blob_bytes: int = CALLBACK_MEMORY_MAX_BLOB_BYTES,
+        **kwargs,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.max_entries = max_entries
+        self.max_blob_bytes = max_blob_bytes
+        # All in least recently used first order.
+        self._entries: OrderedDict[tuple[str, str], _Stored] = OrderedDict()
+        self._namespaces: dict[str, OrderedDict[str, None]] = {}
+        self._blobs: OrderedDict[str, _Stored] = OrderedDict()
+        self._blob_bytes = 0
+
+    async def save(
+        self, namespace: str, entries: dict[str, bytes], blobs: dict[str, bytes]
+    ) -> list[str]:
+        expires_at = self._clock() + self.ttl
+        for digest, blob in blobs.items():
+            if (previous := self._blobs.get(digest)) is not None:
+                self._blob_bytes -= len(previous.value)
+            self._blobs[digest] = _Stored(blob, expires_at)
+            self._blobs.move_to_end(digest)
+            self._blob_bytes += len(blob)
+        for key, entry in entries.items():
+            self._entries[namespace, key] = _Stored(entry, expires_at)
+            self._entries.move_to_end((namespace, key))
+            self._namespaces.setdefault(namespace, OrderedDict())[key] = None
+            self._namespaces[namespace].move_to_end(key)
+
+        self._purge_expired()
+        evicted = []
+        keys = self._namespaces.get(namespace, {})
+        while len(keys) > self.max_keys:
+            key, _ = keys.popitem(last=False)
+            del self._entries[namespace, key]
+            evicted.append(key)
+        if evicted:
+            logger.info(f"Evicted {len(evicted)} callback payloads from namespace {namespace}")
+        while len(self._entries) > self.max_entries:
+            (other_namespace, key), _ = self._entries.popitem(last=False)
+            self._forget(other_namespace, key)
+            if other_namespace == namespace:
+                evicted.append(key)
+        # Entries whose blob goes here read as missing, like expired ones.
+        while self._blob_bytes > self.max_blob_bytes:
+            self._pop_oldest_blob()
+        return evicted
+
+    async def get(self, namespace: str, key: str) -> bytes | None:
+        stored = self._entries.get((namespace, key))
+        if stored is None:
+            return None
+        if self._clock() >= stored.expires_at:
+            del self._entries[namespace, key]
+            self._forget(namespace, key)
+            return None
+        self.touch(namespace, key)
+        return stored.value
+
+    async def get_blobs(self, digests: list[str]) -> list[bytes | None]:
+        now = self._clock()
+        found = []
+        for digest in digests:
+            stored = self._blobs.get(digest)
+            if stored is None or now >= stored.expires_at:
+                found.append(None)
+                continue
+            stored.expires_at = now + self.ttl
+            self._blobs.move_to_end(digest)
+            found.append(stored.value)
+        return found
+
+    async def delete(self, namespace: str, keys: Iterable[str]) -> None:
+        for key in keys:
+            if self._entries.pop((namespace, key), None) is not None:
+                self._forget(namespace, key)
+
+    async def usage(self) -> dict[str, tuple[int, int]]:
+        self._purge_expired()
+        report: dict[str, tuple[int, int]] = {}
+        for (namespace, key), stored in self._entries.items():
+            count, size = report.get(namespace, (0, 0))
+            report[namespace] = count + 1, size + len(key) + len(stored.value)
+        report[BLOBS_NAMESPACE] = (
+            len(self._blobs),
+            sum(len(digest) + len(stored.value) for digest, stored in self._blobs.items()),
+        )
+        return report
+
+    def touch(self, namespace: str, key: str) -> None:
+        stored = self._entries.get((namespace, key))
+        if stored is None:
+            return
+        stored.expires_at = self._clock() + self.ttl
+        self._entries.move_to_end((namespace, key))
+        self._namespaces[namespace].move_to_end(key)
+
+    def _forget(self, namespace: str, key: str) -> None:
+        keys = self._namespaces[namespace]
+        del keys[key]
+        if not keys:
+            del self._namespaces[namespace]
+
+    def _purge_expired(self) -> None:
+        # Every use slides the TTL by the same amount, so in last use order
+        # the expired entries and blobs are all at the front.
+        now = self._clock()
+        while self._entries:
+            (namespace, key), stored = next(iter(self._entries.items()))
+            if now < stored.expires_at:
+                break
+            del self._entries[namespace, key]
+            self._forget(namespace, key)
+        while self._blobs and now >= next(iter(self._blobs.values())).expires_at:
+            self._pop_oldest_blob()
+
+    def _pop_oldest_blob(self) -> None:
+        _, stored = self._blobs.popitem(last=False)
+        self._blob_bytes -= len(stored.value)
+
+
+__all__ = ["MemoryCallbackStorage"]
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import logging
+import re
+from collections.abc import Iterable
+
+from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
+
+from services.callback_storage.interface import BLOBS_NAMESPACE, CallbackStorage
+from services.redis_services.client import redis_bytes_client
+
+logger = logging.getLogger(__name__)
+
+CALLBACK_ENTRY_PREFIX = "callback:"
+CALLBACK_INDEX_PREFIX = "callback_index:"
+CALLBACK_BLOB_PREFIX = "callback_blob:"
+# Entries saved before namespacing were stored under a bare uuid4 key with
+# this fixed TTL, so none of them outlives a process by more than that.
+LEGACY_ENTRY_TTL_SECONDS = 3600
+_LEGACY_KEY_RE = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}"
+)
+
+
+class RedisCallbackStorage(CallbackStorage):
+    """Callback storage shared by every bot process through Redis.
+
+    Entries live under ``callback:<namespace>:<key>`` with a native TTL. A
+    ``callback_index:<namespace>`` sorted set scores each key by its last use
+    and drives the per-namespace eviction. ``redis`` must not decode
+    responses.
+    """
+
+    def __init__(self, redis: Redis | None = None, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._redis = redis if redis is not None else redis_bytes_client
+        self._legacy_until = self._clock() + LEGACY_ENTRY_TTL_SECONDS
+
+    async def save(
+        self, namespace: str, entries: dict[str, bytes], blobs: dict[str, bytes]
+    ) -> list[str]:
+        index_key = CALLBACK_INDEX_PREFIX + namespace
+        now = self._clock()
+        async with self._redis.pipeline(transaction=False) as pipeline:
+            # Every write refreshes the blob TTL. Uses recorded with touch()
+            # slide the entries only, so a blob can still expire first.
+            for digest, blob in blobs.items():
+                pipeline.set(CALLBACK_BLOB_PREFIX + digest, blob, ex=self.ttl)
+            self._queue_touches(pipeline, namespace)
+            for key, entry in entries.items():
+                pipeline.set(_entry_key(namespace, key), entry, ex=self.ttl)
+            # Members older than the TTL belong to entries that have already
+            # expired.
+            if entries:
+                pipeline.zadd(index_key, dict.fromkeys(entries, now))
+            pipeline.zremrangebyscore(index_key, "-inf", now - self.ttl)
+            pipeline.zcard(index_key)
+            pipeline.expire(index_key, self.ttl)
+            *_, live_keys, _ = await pipeline.execute()
+
+        if live_keys <= self.max_keys:
+            return []
+        evicted = await self._redis.zpopmin(index_key, live_keys - self.max_keys)
+        keys = [key.decode() for key, _ in evicted]
+        if keys:
+            await self._redis.delete(*(_entry_key(namespace, key) for key in keys))
+            logger.info(f"Evicted {len(keys)} callback payloads from namespace {namespace}")
+        return keys
+
+    async def get(self, namespace: str, key: str) -> bytes | None:
+        async with self._redis.pipeline(transaction=False) as pipeline:
+            pipeline.getex(_entry_key(namespace, key), ex=self.ttl)
+            self._queue_touches(pipeline, namespace)
+            pipeline.zadd(CALLBACK_INDEX_PREFIX + namespace, {key: self._clock()}, xx=True)
+            value, *_ = await pipeline.execute()
+        if value is None and self._may_be_legacy(key):
+            # Entries saved before namespacing live under the bare key until
+            # they expire.
+            value = await self._redis.get(key)
+        return value
+
+    async def get_blobs(self, digests: list[str]) -> list[bytes | None]:
+        async with self._redis.pipeline(transaction=False) as pipeline:
+            for digest in digests:
+                pipeline.getex(CALLBACK_BLOB_PREFIX + digest, ex=self.ttl)
+            return await pipeline.execute()
+
+    async def delete(self, namespace: str, keys: Iterable[str]) -> None:
+        keys = list(keys)
+        if not keys:
+            return
+        async with self._redis.pipeline(transaction=False) as pipeline:
+            pipeline.zrem(CALLBACK_INDEX_PREFIX + namespace, *keys)
+            pipeline.delete(*(_entry_key(namespace, key) for key in keys))
+            await pipeline.execute()
+
+    async def usage(self) -> dict[str, tuple[int, int]]:
+        report: dict[str, tuple[int, int]] = {}
+        async for index_key in self._redis.scan_iter(
+            match=CALLBACK_INDEX_PREFIX + "*", count=500
+        ):
+            namespace = index_key.decode().removeprefix(CALLBACK_INDEX_PREFIX)
+            entry_keys = [
+                _entry_key(namespace, key.decode())
+                for key in await self._redis.zrange(index_key, 0, -1)
+            ]
+            report[namespace] = await self._measure(entry_keys)
+        blob_keys = [
+            key.decode()
+            async for key in self._redis.scan_iter(
+                match=CALLBACK_BLOB_PREFIX + "*", count=500
+            )
+        ]
+        report[BLOBS_NAMESPACE] = await self._measure(blob_keys)
+        return report
+
+    async def _measure(self, keys: list[str]) -> tuple[int, int]:
+        if not keys:
+            return 0, 0
+        async with self._redis.pipeline(transaction=False) as pipeline:
+            for key in keys:
+                pipeline.strlen(key)
+            lengths = await pipeline.execute()
+        live = [(key, length) for key, length in zip(keys, lengths) if length]
+        return len(live), sum(len(key) + length for key, length in live)
+
+    def _may_be_legacy(self, key: str) -> bool:
+        return self._clock() < self._legacy_until and bool(_LEGACY_KEY_RE.fullmatch(key))
+
+    def _queue_touches(self, pipeline: Pipeline, namespace: str) -> None:
+        if touches := self._take_touches(namespace):
+            pipeline.zadd(CALLBACK_INDEX_PREFIX + namespace, touches, xx=True)
+            for key in touches:
+                pipeline.expire(_entry_key(namespace, key), self.ttl)
+
+
+def _entry_key(namespace: str, key: str) -> str:
+    return f"{CALLBACK_ENTRY_PREFIX}{namespace}:{key}"
+
+
+__all__ = [
+    "CALLBACK_BLOB_PREFIX",
+    "CALLBACK_ENTRY_PREFIX",
+    "CALLBACK_INDEX_PREFIX",
+    "RedisCallbackStorage",
+]
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from bot.config import CALLBACK_STORAGE
+from services.callback_storage.interface import CallbackStorage
+from services.callback_storage.memory_storage import MemoryCallbackStorage
+from services.callback_storage.redis_storage import RedisCallbackStorage
+from services.callback_storage.sqlite_storage import SQLiteCallbackStorage
+
+CALLBACK_STORAGES: dict[str, type[CallbackStorage]] = {
+    "memory": MemoryCallbackStorage,
+    "redis": RedisCallbackStorage,
+    "sqlite": SQLiteCallbackStorage,
+}
+
+_storage: CallbackStorage | None = None
+
+
+def get_callback_storage() -> CallbackStorage:
+    global _storage
+    if _storage is None:
+        try:
+            _storage = CALLBACK_STORAGES[CALLBACK_STORAGE]()
+        except KeyError:
+            raise ValueError(f"Unknown callback storage: {CALLBACK_STORAGE}") from None
+    return _storage
+
+
+async def close_callback_storage() -> None:
+    global _storage
+    if _storage is not None:
+        await _storage.aclose()
+        _storage = None
+
+
+__all__ = ["CALLBACK_STORAGES", "close_callback_storage", "get_callback_storage"]
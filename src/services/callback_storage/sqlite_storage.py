@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import sqlite3
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
+
+from bot.config import CALLBACK_SQLITE_PATH, CALLBACK_SQLITE_PURGE_INTERVAL
+from services.callback_storage.interface import BLOBS_NAMESPACE, CallbackStorage
+
+logger = logging.getLogger(__name__)
+
+# Expired rows deleted per statement, so a purge never holds the write lock long.
+PURGE_BATCH_SIZE = 1000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS callback_entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value BLOB NOT NULL,
+    used_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE INDEX IF NOT EXISTS callback_entries_by_use ON callback_entries (namespace, used_at);
+CREATE INDEX IF NOT EXISTS callback_entries_by_age ON callback_entries (used_at);
+CREATE TABLE IF NOT EXISTS callback_blobs (
+    digest TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS callback_blobs_by_age ON callback_blobs (used_at);
+"""
+
+ResultT = TypeVar("ResultT")
+
+
+class SQLiteCallbackStorage(CallbackStorage):
+    """Callback storage in a local SQLite database.
+
+    Survives restarts without running a service, and bot processes on the
+    same host can share the file. The database runs in WAL mode, so readers
+    never wait for the writer. All calls run on one dedicated thread owning
+    the connection. Expired rows are never returned; they are deleted by
+    saves in batches of ``PURGE_BATCH_SIZE``, at most every
+    ``purge_interval`` seconds while there is no backlog.
+    """
+
+    def __init__(
+        self,
+        path: str = CALLBACK_SQLITE_PATH,
+        *,
+        purge_interval: float = CALLBACK_SQLITE_PURGE_INTERVAL,
+        **kwargs,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.path = path
+        self.purge_interval = purge_interval
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="callback-sqlite")
+        self._connection: sqlite3.Connection | None = None
+        self._next_purge = 0.0
+
+    async def save(
+        self, namespace: str, entries: dict[str, bytes], blobs: dict[str, bytes]
+    ) -> list[str]:
+        touches = self._take_touches(namespace)
+        evicted = await self._run(self._save, namespace, entries, blobs, touches, self._clock())
+        if evicted:
+            logger.info(f"Evicted {len(evicted)} callback payloads from namespace {namespace}")
+        return evicted
+
+    async def get(self, namespace: str, key: str) -> bytes | None:
+        touches = self._take_touches(namespace)
+        return await self._run(self._get, namespace, key, touches, self._clock())
+
+    async def get_blobs(self, digests: list[str]) -> list[bytes | None]:
+        return await self._run(self._get_blobs, digests, self._clock())
+
+    async def delete(self, namespace: str, keys: Iterable[str]) -> None:
+        await self._run(self._delete, namespace, list(keys))
+
+    async def usage(self) -> dict[str, tuple[int, int]]:
+        return await self._run(self._usage, self._clock())
+
+    async def aclose(self) -> None:
+        if self._connection is not None:
+            await self._run(self._connection.close)
+            self._connection = None
+        self._executor.shutdown()
+
+    async def _run(self, function: Callable[..., ResultT], *args) -> ResultT:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, function, *args)
+
+    def _db(self) -> sqlite3.Connection:
+        if self._connection is None:
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            # Safe with WAL: a power loss may only drop the latest commits.
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("PRAGMA busy_timeout=5000")
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def _save(
+        self,
+        namespace: str,
+        entries: dict[str, bytes],
+        blobs: dict[str, bytes],
+        touches: dict[str, float],
+        now: float,
+    ) -> list[str]:
+        db = self._db()
+        evicted: list[str] = []
+        with db:
+            # Every write refreshes the blob TTL. Uses recorded with touch()
+            # slide the entries only, so a blob can still expire first.
+            db.executemany(
+                "INSERT OR REPLACE INTO callback_blobs VALUES (?, ?, ?)",
+                [(digest, blob, now) for digest, blob in blobs.items()],
+            )
+            _apply_touches(db, namespace, touches, self.ttl)
+            db.executemany(
+                "INSERT OR REPLACE INTO callback_entries VALUES (?, ?, ?, ?)",
+                [(namespace, key, entry, now) for key, entry in entries.items()],
+            )
+            (live_keys,) = db.execute(
+                "SELECT COUNT(*) FROM callback_entries WHERE namespace = ? AND used_at > ?",
+                (namespace, now - self.ttl),
+            ).fetchone()
+            if live_keys > self.max_keys:
+                evicted = [
+                    key
+                    for (key,) in db.execute(
+                        "DELETE FROM callback_entries WHERE rowid IN ("
+                        " SELECT rowid FROM callback_entries"
+                        " WHERE namespace = ? AND used_at > ? ORDER BY used_at LIMIT ?"
+                        ") RETURNING key",
+                        (namespace, now - self.ttl, live_keys - self.max_keys),
+                    )
+                ]
+        if now >= self._next_purge:
+            self._purge(now)
+        return evicted
+
+    def _get(
+        self, namespace: str, key: str, touches: dict[str, float], now: float
+    ) -> bytes | None:
+        db = self._db()
+        with db:
+            _apply_touches(db, namespace, touches, self.ttl)
+            row = db.execute(
+                "UPDATE callback_entries SET used_at = ?"
+                " WHERE namespace = ? AND key = ? AND used_at > ? RETURNING value",
+                (now, namespace, key, now - self.ttl),
+            ).fetchone()
+        return row[0] if row else None
+
+    def _get_blobs(self, digests: list[str], now: float) -> list[bytes | None]:
+        if not digests:
+            return []
+        db = self._db()
+        placeholders = ", ".join("?" * len(digests))
+        with db:
+            found = dict(
+                db.execute(
+                    f"UPDATE callback_blobs SET used_at = ?"
+                    f" WHERE digest IN ({placeholders}) AND used_at > ?"
+                    f" RETURNING digest, value",
+                    (now, *digests, now - self.ttl),
+                )
+            )
+        return [found.get(digest) for digest in digests]
+
+    def _delete(self, namespace: str, keys: list[str]) -> None:
+        db = self._db()
+        with db:
+            db.executemany(
+                "DELETE FROM callback_entries WHERE namespace = ? AND key = ?",
+                [(namespace, key) for key in keys],
+            )
+
+    def _usage(self, now: float) -> dict[str, tuple[int, int]]:
+        db = self._db()
+        cutoff = now - self.ttl
+        report = {
+            namespace: (count, size)
+            for namespace, count, size in db.execute(
+                "SELECT namespace, COUNT(*), SUM(length(key) + length(value))"
+                " FROM callback_entries WHERE used_at > ? GROUP BY namespace",
+                (cutoff,),
+            )
+        }
+        count, size = db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(length(digest) + length(value)), 0)"
+            " FROM callback_blobs WHERE used_at > ?",
+            (cutoff,),
+        ).fetchone()
+        report[BLOBS_NAMESPACE] = (count, size)
+        return report
+
+    def _purge(self, now: float) -> None:
+        db = self._db()
+        backlog = False
+        with db:
+            for table in ("callback_entries", "callback_blobs"):
+                deleted = db.execute(
+                    f"DELETE FROM {table} WHERE rowid IN ("
+                    f" SELECT rowid FROM {table} WHERE used_at <= ? LIMIT ?"
+                    f")",
+                    (now - self.ttl, PURGE_BATCH_SIZE),
+                ).rowcount
+                backlog = backlog or deleted == PURGE_BATCH_SIZE
+        # A full batch means more rows are waiting: purge again on the next save.
+        self._next_purge = now if backlog else now + self.purge_interval
+
+
+def _apply_touches(
+    db: sqlite3.Connection, namespace: str, touches: dict[str, float], ttl: float
+) -> None:
+    # Entries that expired meanwhile stay expired.
+    db.executemany(
+        "UPDATE callback_entries SET used_at = ?"
+        " WHERE namespace = ? AND key = ? AND used_at BETWEEN ? AND ?",
+        [
+            (used_at, namespace, key, used_at - ttl, used_at)
+            for key, used_at in touches.items()
+        ],
+    )
+
+
+__all__ = ["PURGE_BATCH_SIZE", "SQLiteCallbackStorage"]
@@ -17,7 +17,7 @@ async def qbt_get_categories(client: APIClient) -> list:
     :param client:
     :return: list[dict]
     """
-    cached_categories = redis_client.get(CACHE_KEY)
+    cached_categories = await redis_client.get(CACHE_KEY)
     if cached_categories:
         logger.info("Returning cached categories from Redis.")
         return json.loads(cached_categories)
@@ -28,5 +28,5 @@ async def qbt_get_categories(client: APIClient) -> list:
         categories = await client.torrents.categories()
         category_names = list(categories.keys())
 
-    redis_client.set(CACHE_KEY, json.dumps(category_names), ex=CACHE_TTL_SECONDS)
+    await redis_client.set(CACHE_KEY, json.dumps(category_names), ex=CACHE_TTL_SECONDS)
     return category_names
@@ -1,5 +1,32 @@
-import redis
+from redis.asyncio import BlockingConnectionPool, Redis
 
-from bot.config import REDIS_HOST, REDIS_PORT
+from bot.config import REDIS_HOST, REDIS_MAX_CONNECTIONS, REDIS_POOL_TIMEOUT, REDIS_PORT
 
-redis_client = redis.Redis(REDIS_HOST, REDIS_PORT, decode_responses=True)
+# Callers wait up to REDIS_POOL_TIMEOUT for a free connection instead of
+# failing as soon as REDIS_MAX_CONNECTIONS are in use.
+redis_pool = BlockingConnectionPool(
+    host=REDIS_HOST,
+    port=REDIS_PORT,
+    decode_responses=True,
+    max_connections=REDIS_MAX_CONNECTIONS,
+    timeout=REDIS_POOL_TIMEOUT,
+)
+redis_client = Redis(connection_pool=redis_pool)
+
+# Serialized binary payloads (see serializer.py) are read without decoding.
+redis_bytes_pool = BlockingConnectionPool(
+    host=REDIS_HOST,
+    port=REDIS_PORT,
+    max_connections=REDIS_MAX_CONNECTIONS,
+    timeout=REDIS_POOL_TIMEOUT,
+)
+redis_bytes_client = Redis(connection_pool=redis_bytes_pool)
+
+
+async def close_redis() -> None:
+    for client, pool in (
+        (redis_client, redis_pool),
+        (redis_bytes_client, redis_bytes_pool),
+    ):
+        await client.aclose()
+        await pool.aclose()
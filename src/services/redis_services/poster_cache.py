@@ -0,0 +1,52 @@
+import hashlib
+import logging
+
+from redis import RedisError
+
+from services.redis_services.client import redis_client
+
+POSTER_KEY_PREFIX = "poster:file_id:"
+# Telegram keeps file_ids valid indefinitely; the TTL only drops unused posters.
+POSTER_TTL_SECONDS = 60 * 60 * 24 * 90  # ninety days
+
+logger = logging.getLogger(__name__)
+
+
+def poster_cache_key(poster_url: str) -> str:
+    return POSTER_KEY_PREFIX + hashlib.sha256(poster_url.encode()).hexdigest()
+
+
+async def get_poster_file_ids(poster_urls: list[str]) -> list[str | None]:
+    """
+    Fetch Telegram file_ids of already sent posters in one round-trip.
+    :param poster_urls: poster URLs as returned by the search providers
+    :return: list aligned with poster_urls, None for posters not sent yet
+    """
+    if not poster_urls:
+        return []
+    try:
+        return await redis_client.mget([poster_cache_key(url) for url in poster_urls])
+    except RedisError as exc:
+        logger.warning("Failed to read cached poster file_ids: %s", exc)
+        return [None] * len(poster_urls)
+
+
+async def save_poster_file_ids(file_ids: dict[str, str]) -> None:
+    if not file_ids:
+        return
+    try:
+        async with redis_client.pipeline(transaction=False) as pipeline:
+            for poster_url, file_id in file_ids.items():
+                pipeline.set(poster_cache_key(poster_url), file_id, ex=POSTER_TTL_SECONDS)
+            await pipeline.execute()
+    except RedisError as exc:
+        logger.warning("Failed to cache poster file_ids: %s", exc)
+
+
+async def forget_poster_file_ids(poster_urls: list[str]) -> None:
+    if not poster_urls:
+        return
+    try:
+        await redis_client.delete(*(poster_cache_key(url) for url in poster_urls))
+    except RedisError as exc:
+        logger.warning("Failed to drop cached poster file_ids: %s", exc)
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import json
+import logging
+import zlib
+from enum import IntEnum
+from typing import Any
+
+from bot.config import (
+    CALLBACK_COMPRESSION,
+    CALLBACK_COMPRESSION_MIN_BYTES,
+    CALLBACK_SERIALIZER,
+)
+
+# Optional speedups from the "fast" extra; stdlib json and zlib otherwise.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+# Entries written before the versioned format are plain JSON text.
+_LEGACY_JSON_START = frozenset(b'{["')
+
+
+class Encoding(IntEnum):
+    JSON = 0
+    MSGPACK = 1
+
+
+class Compression(IntEnum):
+    NONE = 0
+    ZLIB = 1
+    ZSTD = 2
+
+
+class PayloadSerializer:
+    """Encodes cached payloads as a two-byte header and an encoded body.
+
+    The header holds the format version and how the body was encoded and
+    compressed, so any entry can be read back whatever the current settings
+    are, including legacy plain-JSON entries. Bodies shorter than
+    ``compress_min_bytes`` are stored uncompressed.
+    """
+
+    def __init__(
+        self,
+        encoding: str = "json",
+        compression: str = "zlib",
+        compress_min_bytes: int = 1024,
+    ) -> None:
+        self.encoding = Encoding[encoding.upper()]
+        if self.encoding is Encoding.MSGPACK and msgpack is None:
+            logger.warning("msgpack is not installed, serializing payloads as JSON")
+            self.encoding = Encoding.JSON
+        self.compression = Compression[compression.upper()]
+        if self.compression is Compression.ZSTD and zstandard is None:
+            logger.warning("zstandard is not installed, compressing payloads with zlib")
+            self.compression = Compression.ZLIB
+        self.compress_min_bytes = compress_min_bytes
+
+    def dumps(self, value: Any) -> bytes:
+        body = _encode(self.encoding, value)
+        compression = (
+            self.compression
+            if len(body) >= self.compress_min_bytes
+            else Compression.NONE
+        )
+        if compression is not Compression.NONE:
+            body = _compress(compression, body)
+        return bytes((FORMAT_VERSION, self.encoding << 4 | compression)) + body
+
+    def loads(self, data: bytes) -> Any:
+        if data[0] in _LEGACY_JSON_START:
+            return json.loads(data)
+        if data[0] != FORMAT_VERSION:
+            raise ValueError(f"Unknown payload format version {data[0]}")
+        encoding, compression = Encoding(data[1] >> 4), Compression(data[1] & 0x0F)
+        return _decode(encoding, _decompress(compression, data[2:]))
+
+
+def _encode(encoding: Encoding, value: Any) -> bytes:
+    if encoding is Encoding.MSGPACK:
+        return msgpack.packb(value)
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _decode(encoding: Encoding, body: bytes) -> Any:
+    if encoding is Encoding.MSGPACK:
+        if msgpack is None:
+            raise ValueError("Payload is msgpack-encoded but msgpack is not installed")
+        return msgpack.unpackb(body)
+    return orjson.loads(body) if orjson is not None else json.loads(body)
+
+
+def _compress(compression: Compression, body: bytes) -> bytes:
+    if compression is Compression.ZSTD:
+        return zstandard.ZstdCompressor(level=3).compress(body)
+    return zlib.compress(body, 6)
+
+
+def _decompress(compression: Compression, body: bytes) -> bytes:
+    if compression is Compression.NONE:
+        return body
+    if compression is Compression.ZLIB:
+        return zlib.decompress(body)
+    if zstandard is None:
+        raise ValueError("Payload is zstd-compressed but zstandard is not installed")
+    return zstandard.ZstdDecompressor().decompress(body)
+
+
+callback_serializer = PayloadSerializer(
+    CALLBACK_SERIALIZER, CALLBACK_COMPRESSION, CALLBACK_COMPRESSION_MIN_BYTES
+)
+
+__all__ = [
+    "Compression",
+    "Encoding",
+    "PayloadSerializer",
+    "callback_serializer",
+]
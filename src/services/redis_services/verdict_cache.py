@@ -0,0 +1,66 @@
+import hashlib
+import json
+import logging
+
+from redis import RedisError
+
+from services.redis_services.client import redis_client
+
+VERDICT_KEY_PREFIX = "groq:verdict:"
+VERDICT_STATS_KEY = "groq:verdict:stats"
+VERDICT_TTL_SECONDS = 60 * 60 * 24 * 30  # thirty days
+
+logger = logging.getLogger(__name__)
+
+
+def verdict_cache_key(
+    title: str, requested_item: str, requested_type: str, prompt_version: str
+) -> str:
+    raw_key = "\x1f".join((prompt_version, requested_type, requested_item, title))
+    return VERDICT_KEY_PREFIX + hashlib.sha256(raw_key.encode()).hexdigest()
+
+
+async def get_verdicts(keys: list[str]) -> list[dict | None]:
+    """
+    Fetch cached LLM verdicts for the given keys in one round-trip.
+    :param keys: keys built with verdict_cache_key
+    :return: list aligned with keys, None for misses
+    """
+    if not keys:
+        return []
+    try:
+        cached = await redis_client.mget(keys)
+    except RedisError as exc:
+        logger.warning("Failed to read cached Groq verdicts: %s", exc)
+        return [None] * len(keys)
+    return [json.loads(value) if value else None for value in cached]
+
+
+async def save_verdicts(verdicts: dict[str, dict]) -> None:
+    if not verdicts:
+        return
+    try:
+        async with redis_client.pipeline(transaction=False) as pipeline:
+            for key, verdict in verdicts.items():
+                pipeline.set(key, json.dumps(verdict), ex=VERDICT_TTL_SECONDS)
+            await pipeline.execute()
+    except RedisError as exc:
+        logger.warning("Failed to cache Groq verdicts: %s", exc)
+
+
+async def record_lookups(hits: int, misses: int) -> None:
+    try:
+        async with redis_client.pipeline(transaction=False) as pipeline:
+            pipeline.hincrby(VERDICT_STATS_KEY, "hits", hits)
+            pipeline.hincrby(VERDICT_STATS_KEY, "misses", misses)
+            await pipeline.execute()
+    except RedisError as exc:
+        logger.warning("Failed to record Groq verdict cache stats: %s", exc)
+        return
+    total = hits + misses
+    logger.debug(
+        "Groq verdict cache: %d/%d hits (%.0f%%)",
+        hits,
+        total,
+        100 * hits / total if total else 0,
+    )
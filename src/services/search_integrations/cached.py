@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import TypeVar
+
+from pydantic import BaseModel
+from redis import RedisError
+from redis.asyncio import Redis
+
+from bot.config import (
+    SEARCH_CACHE_DETAILS_TTL,
+    SEARCH_CACHE_L1_SIZE,
+    SEARCH_CACHE_SEARCH_TTL,
+    SEARCH_CACHE_STALE_TTL,
+)
+from models.search_provider_types import MediaDetails, SearchResults
+from services.redis_services.client import redis_client
+from services.search_integrations.interface import SearchProvider
+
+logger = logging.getLogger(__name__)
+
+SEARCH_CACHE_KEY_PREFIX = "search_cache:"
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+@dataclass(frozen=True, slots=True)
+class _Entry:
+    value: BaseModel
+    fresh_until: float
+    stale_until: float
+
+
+class CachedSearchProvider(SearchProvider):
+    """Two-tier cache in front of another ``SearchProvider``.
+
+    Results are kept in a small in-process LRU and in Redis. Each method has
+    its own freshness TTL; for ``stale_ttl`` seconds after that a stale value
+    is still served while a single background call refreshes it. Concurrent
+    misses for the same key share one upstream call.
+    """
+
+    def __init__(
+        self,
+        provider: SearchProvider,
+        namespace: str,
+        *,
+        search_ttl: float = SEARCH_CACHE_SEARCH_TTL,
+        details_ttl: float = SEARCH_CACHE_DETAILS_TTL,
+        stale_ttl: float = SEARCH_CACHE_STALE_TTL,
+        l1_size: int = SEARCH_CACHE_L1_SIZE,
+        redis: Redis | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._provider = provider
+        self._namespace = namespace
+        self._search_ttl = search_ttl
+        self._details_ttl = details_ttl
+        self._stale_ttl = stale_ttl
+        self._l1_size = l1_size
+        self._redis = redis if redis is not None else redis_client
+        self._clock = clock
+        self._l1: OrderedDict[str, _Entry] = OrderedDict()
+        self._in_flight: dict[str, asyncio.Task] = {}
+
+    async def search(self, query: str) -> SearchResults:
+        return await self._get(
+            self._key("search", query.strip().casefold()),
+            lambda: self._provider.search(query),
+            SearchResults,
+            self._search_ttl,
+        )
+
+    async def get_details(
+        self, media_id: str, *, is_series: bool | None = None
+    ) -> MediaDetails:
+        # The hint picks the upstream endpoint, so it is part of the key.
+        return await self._get(
+            self._key("details", f"{media_id}:{is_series}"),
+            lambda: self._provider.get_details(media_id, is_series=is_series),
+            MediaDetails,
+            self._details_ttl,
+        )
+
+    async def aclose(self) -> None:
+        for task in self._in_flight.values():
+            task.cancel()
+        self._in_flight.clear()
+        await self._provider.aclose()
+
+    async def _get(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[ModelT]],
+        model: type[ModelT],
+        ttl: float,
+    ) -> ModelT:
+        entry = self._l1_get(key) or await self._l2_get(key, model)
+        now = self._clock()
+        if entry is not None and now < entry.stale_until:
+            if now >= entry.fresh_until and key not in self._in_flight:
+                logger.debug("Serving stale %s, refreshing in background", key)
+                self._refresh(key, fetch, ttl).add_done_callback(_log_refresh_error)
+            return entry.value.model_copy(deep=True)
+
+        value = await asyncio.shield(self._refresh(key, fetch, ttl))
+        return value.model_copy(deep=True)
+
+    def _refresh(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[ModelT]],
+        ttl: float,
+    ) -> asyncio.Task:
+        if (task := self._in_flight.get(key)) is not None:
+            return task
+
+        async def load() -> ModelT:
+            try:
+                value = await fetch()
+                await self._store(key, value, ttl)
+                return value
+            finally:
+                self._in_flight.pop(key, None)
+
+        task = asyncio.create_task(load())
+        self._in_flight[key] = task
+        return task
+
+    async def _store(self, key: str, value: BaseModel, ttl: float) -> None:
+        now = self._clock()
+        entry = _Entry(value, now + ttl, now + ttl + self._stale_ttl)
+        self._l1_put(key, entry)
+        payload = json.dumps(
+            {"fresh_until": entry.fresh_until, "value": value.model_dump(mode="json")}
+        )
+        try:
+            await self._redis.set(key, payload, ex=int(ttl + self._stale_ttl))
+        except RedisError as exc:
+            logger.warning("Failed to cache %s: %s", key, exc)
+
+    def _l1_get(self, key: str) -> _Entry | None:
+        entry = self._l1.get(key)
+        if entry is None:
+            return None
+        if self._clock() >= entry.stale_until:
+            del self._l1[key]
+            return None
+        self._l1.move_to_end(key)
+        return entry
+
+    def _l1_put(self, key: str, entry: _Entry) -> None:
+        self._l1[key] = entry
+        self._l1.move_to_end(key)
+        while len(self._l1) > self._l1_size:
+            self._l1.popitem(last=False)
+
+    async def _l2_get(self, key: str, model: type[ModelT]) -> _Entry | None:
+        try:
+            raw = await self._redis.get(key)
+        except RedisError as exc:
+            logger.warning("Failed to read cached %s: %s", key, exc)
+            return None
+        if not raw:
+            return None
+        try:
+            payload = json.loads(raw)
+            entry = _Entry(
+                model.model_validate(payload["value"]),
+                payload["fresh_until"],
+                payload["fresh_until"] + self._stale_ttl,
+            )
+        except (KeyError, TypeError, ValueError) as exc:
+            logger.warning("Dropping malformed cache entry %s: %s", key, exc)
+            return None
+        self._l1_put(key, entry)
+        return entry
+
+    def _key(self, method: str, argument: str) -> str:
+        digest = hashlib.sha256(argument.encode()).hexdigest()[:32]
+        return f"{SEARCH_CACHE_KEY_PREFIX}{self._namespace}:{method}:{digest}"
+
+
+def _log_refresh_error(task: asyncio.Task) -> None:
+    if not task.cancelled() and (exc := task.exception()) is not None:
+        logger.warning("Background search cache refresh failed: %s", exc)
+
+
+__all__ = ["CachedSearchProvider", "SEARCH_CACHE_KEY_PREFIX"]
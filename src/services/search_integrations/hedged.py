@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import Counter
+
+from bot.config import SEARCH_HEDGE_DELAY, SEARCH_MERGE_WINDOW
+from models.search_provider_types import MediaDetails, MediaItem, Provider, SearchResults
+from services.search_integrations.interface import SearchProvider
+from utilities.title_features import normalize_title
+
+logger = logging.getLogger(__name__)
+
+
+class HedgedSearchProvider(SearchProvider):
+    """Searches several providers and answers with the fastest useful result.
+
+    The first provider is asked immediately; the others only when it has
+    not answered with results within ``hedge_delay`` (zero queries them all
+    at once). The first non-empty answer wins, and answers arriving within
+    ``merge_window`` after it are merged in, de-duplicated by original title
+    and year. Details go to the provider that issued the id.
+    """
+
+    def __init__(
+        self,
+        providers: dict[Provider, SearchProvider],
+        *,
+        hedge_delay: float = SEARCH_HEDGE_DELAY,
+        merge_window: float = SEARCH_MERGE_WINDOW,
+    ) -> None:
+        self._providers = providers
+        self._hedge_delay = hedge_delay
+        self._merge_window = merge_window
+        self.wins: Counter[Provider] = Counter()
+
+    async def search(self, query: str) -> SearchResults:
+        names = list(self._providers)
+        tasks = {
+            asyncio.create_task(self._providers[names[0]].search(query)): names[0]
+        }
+        winner: Provider | None = None
+        answers: dict[Provider, SearchResults] = {}
+        errors: list[BaseException] = []
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self._hedge_delay)
+            winner = self._collect(done, tasks, answers, errors)
+            if winner is None:
+                for name in names[1:]:
+                    tasks[asyncio.create_task(self._providers[name].search(query))] = name
+            while winner is None and (pending := [t for t in tasks if not t.done()]):
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = self._collect(done, tasks, answers, errors)
+
+            if winner is not None and (pending := [t for t in tasks if not t.done()]):
+                done, _ = await asyncio.wait(pending, timeout=self._merge_window)
+                self._collect(done, tasks, answers, errors)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        if winner is None:
+            if answers:
+                return SearchResults()
+            raise errors[0]
+
+        self.wins[winner] += 1
+        logger.info(
+            "Search '%s' won by %s (merged: %s)",
+            query,
+            winner.value,
+            ", ".join(name.value for name in answers if name != winner) or "none",
+        )
+        return _merge(answers[winner], *(a for n, a in answers.items() if n != winner))
+
+    async def get_details(
+        self, media_id: str, *, is_series: bool | None = None
+    ) -> MediaDetails:
+        return await self._provider_for_id(media_id).get_details(
+            media_id, is_series=is_series
+        )
+
+    async def aclose(self) -> None:
+        for provider in self._providers.values():
+            await provider.aclose()
+
+    def _provider_for_id(self, media_id: str) -> SearchProvider:
+        # TMDB ids carry their media type ("movie:603"); Kinopoisk ids are numeric.
+        name = Provider.TMDB if ":" in media_id else Provider.KINOPOISK
+        return self._providers[name]
+
+    @staticmethod
+    def _collect(
+        done: set[asyncio.Task],
+        tasks: dict[asyncio.Task, Provider],
+        answers: dict[Provider, SearchResults],
+        errors: list[BaseException],
+    ) -> Provider | None:
+        """Record finished searches; return the first one that found anything."""
+        winner = None
+        for task in done:
+            name = tasks[task]
+            if (exc := task.exception()) is not None:
+                logger.warning("Search provider %s failed: %s", name.value, exc)
+                errors.append(exc)
+                continue
+            answers[name] = task.result()
+            if winner is None and answers[name].results:
+                winner = name
+        return winner
+
+
+def _merge(first: SearchResults, *others: SearchResults) -> SearchResults:
+    seen: set[tuple[str, int | None]] = set()
+    merged: list[MediaItem] = []
+    for item in (item for answer in (first, *others) for item in answer.results):
+        key = (normalize_title(item.original_title or item.title), item.year)
+        if key not in seen:
+            seen.add(key)
+            merged.append(item)
+    return SearchResults(results=merged)
+
+
+__all__ = ["HedgedSearchProvider"]
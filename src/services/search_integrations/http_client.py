@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import logging
+from importlib.util import find_spec
+
+import httpx
+
+from bot.config import (
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_KEEPALIVE_EXPIRY,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    HTTP_READ_TIMEOUT,
+)
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 needs ``h2``, installed with the ``httpx[http2]`` dependency; it can
+# only be missing from an environment not synced with uv.lock.
+HTTP2_AVAILABLE = find_spec("h2") is not None
+
+
+class PooledHttpClient:
+    """Lazily created, long-lived ``httpx.AsyncClient`` for one API.
+
+    Connections are kept alive and reused across calls (multiplexed over
+    HTTP/2 when ``h2`` is installed). The client is created on first use and
+    again after ``aclose``, so a closed service can still be used from
+    scripts and benchmarks.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._client: httpx.AsyncClient | None = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            if not HTTP2_AVAILABLE:
+                logger.warning(
+                    "h2 is not installed, %s HTTP client falls back to HTTP/1.1",
+                    self._name,
+                )
+            self._client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+                ),
+                timeout=httpx.Timeout(
+                    HTTP_READ_TIMEOUT,
+                    connect=HTTP_CONNECT_TIMEOUT,
+                ),
+            )
+            logger.debug("Opened %s HTTP client (http2=%s)", self._name, HTTP2_AVAILABLE)
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+
+
+__all__ = ["HTTP2_AVAILABLE", "PooledHttpClient"]
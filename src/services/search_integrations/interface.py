@@ -10,7 +10,13 @@ class SearchProvider(ABC):
     async def search(self, query: str) -> SearchResults: ...
 
     @abstractmethod
-    async def get_details(self, media_id: str) -> MediaDetails: ...
+    async def get_details(
+        self, media_id: str, *, is_series: bool | None = None
+    ) -> MediaDetails:
+        """Fetch full details; ``is_series`` is a hint when the type is already known."""
+
+    async def aclose(self) -> None:
+        """Release network resources held by the provider."""
 
 
 __all__ = ["SearchProvider"]
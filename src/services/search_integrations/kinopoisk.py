@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
@@ -9,6 +10,7 @@ from bot.config import KINOPOISK_API_KEY, KINOPOISK_API_URL, KINOPOISK_SEARCH_LI
 from models.kinopoisk_types import (
     KinopoiskMovieBase,
     KinopoiskMovieDetails,
+    KinopoiskMovieListResponse,
     KinopoiskSearchResponse,
     KinopoiskSeason,
     KinopoiskSeasonListResponse,
@@ -21,10 +23,28 @@ from models.search_provider_types import (
     SeasonDetails,
 )
 from services.exceptions import KinopoiskApiError
+from services.search_integrations.http_client import PooledHttpClient
 from services.search_integrations.interface import SearchProvider
 
 logger = logging.getLogger(__name__)
 
+# Almost every series fits in one page; further pages are fetched only if needed.
+SEASONS_PAGE_LIMIT = 50
+# Projections for endpoints that accept selectFields; full movie documents
+# also carry persons, facts and similar movies that are never read.
+MOVIE_DETAILS_FIELDS = (
+    "id",
+    "name",
+    "alternativeName",
+    "enName",
+    "year",
+    "isSeries",
+    "poster",
+    "description",
+    "shortDescription",
+)
+SEASON_FIELDS = ("number", "airDate", "episodesCount")
+
 
 class KinopoiskService(SearchProvider):
     def __init__(
@@ -36,6 +56,7 @@ class KinopoiskService(SearchProvider):
         self._api_key = api_key
         self._base_url = base_url.rstrip("/")
         self._default_limit = default_limit
+        self._http = PooledHttpClient("Kinopoisk")
 
     async def search(self, query: str) -> SearchResults:
         trimmed_query = query.strip()
@@ -50,7 +71,7 @@ class KinopoiskService(SearchProvider):
 
         payload = await self._request("GET", "/movie/search", params=params)
         try:
-            response = KinopoiskSearchResponse.model_validate(payload)
+            response = KinopoiskSearchResponse.model_validate_json(payload)
         except Exception as exc:
             message = "Failed to parse Kinopoisk search response."
             logger.error("%s Raw payload: %s", message, payload, exc_info=True)
@@ -58,33 +79,76 @@ class KinopoiskService(SearchProvider):
 
         return self._to_search_results(response)
 
-    async def get_details(self, media_id: str) -> MediaDetails:
-        payload = await self._request("GET", f"/movie/{media_id}")
+    async def get_details(
+        self, media_id: str, *, is_series: bool | None = None
+    ) -> MediaDetails:
+        if is_series:
+            details, seasons = await asyncio.gather(
+                self._get_movie_details(media_id), self._get_seasons(media_id)
+            )
+        else:
+            details = await self._get_movie_details(media_id)
+            # Without a hint the type is only known once the details arrive.
+            seasons = (
+                await self._get_seasons(media_id)
+                if is_series is None and details.is_series
+                else []
+            )
+        return self._to_media_details(details, seasons)
+
+    async def _get_movie_details(self, media_id: str) -> KinopoiskMovieDetails:
+        # /movie/{id} cannot be projected, the filtered /movie listing can.
+        params: dict[str, Any] = {
+            "id": media_id,
+            "limit": 1,
+            "selectFields": MOVIE_DETAILS_FIELDS,
+        }
+        payload = await self._request("GET", "/movie", params=params)
         try:
-            details = KinopoiskMovieDetails.model_validate(payload)
+            response = KinopoiskMovieListResponse.model_validate_json(payload)
         except Exception as exc:
             message = f"Failed to parse Kinopoisk movie details for id {media_id}."
             logger.error("%s Raw payload: %s", message, payload, exc_info=True)
             raise KinopoiskApiError(message) from exc
-
-        seasons = await self._get_seasons(media_id)
-        return self._to_media_details(details, seasons)
+        if not response.docs:
+            raise KinopoiskApiError(f"Kinopoisk movie {media_id} was not found.")
+        return response.docs[0]
 
     async def _get_seasons(self, movie_id: str) -> list[KinopoiskSeason]:
+        first_page = await self._get_seasons_page(movie_id, 1)
+        if not first_page.pages or first_page.pages <= 1:
+            return first_page.docs
+
+        other_pages = await asyncio.gather(
+            *(
+                self._get_seasons_page(movie_id, page)
+                for page in range(2, first_page.pages + 1)
+            )
+        )
+        return first_page.docs + [
+            season for page in other_pages for season in page.docs
+        ]
+
+    async def _get_seasons_page(
+        self, movie_id: str, page: int
+    ) -> KinopoiskSeasonListResponse:
         params: dict[str, Any] = {
             "movieId": movie_id,
-            "page": 1,
-            "limit": 50,  # Assuming a series won't have more than 50 seasons
+            "page": page,
+            "limit": SEASONS_PAGE_LIMIT,
+            "selectFields": SEASON_FIELDS,
         }
 
         payload = await self._request("GET", "/season", params=params)
         try:
-            response = KinopoiskSeasonListResponse.model_validate(payload)
+            return KinopoiskSeasonListResponse.model_validate_json(payload)
         except Exception as exc:
             message = f"Failed to parse Kinopoisk seasons for movie id {movie_id}."
             logger.error("%s Raw payload: %s", message, payload, exc_info=True)
             raise KinopoiskApiError(message) from exc
-        return response.docs
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
 
     async def _request(
         self,
@@ -92,7 +156,7 @@ class KinopoiskService(SearchProvider):
         path: str,
         *,
         params: dict[str, Any] | None = None,
-    ) -> dict[str, Any]:
+    ) -> bytes:
         if not self._api_key:
             raise KinopoiskApiError("Kinopoisk API key is not configured.")
 
@@ -100,10 +164,9 @@ class KinopoiskService(SearchProvider):
         headers = {"Accept": "application/json", "X-API-KEY": self._api_key}
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.request(
-                    method, url, headers=headers, params=params
-                )
+            response = await self._http.client.request(
+                method, url, headers=headers, params=params
+            )
         except httpx.HTTPError as exc:
             message = f"Kinopoisk request to {url} failed: {exc}"
             logger.error(message)
@@ -117,7 +180,7 @@ class KinopoiskService(SearchProvider):
             logger.error(message)
             raise KinopoiskApiError(message)
 
-        return response.json()
+        return response.content
 
     def _to_search_results(self, response: KinopoiskSearchResponse) -> SearchResults:
         items = [self._movie_base_to_media_item(movie) for movie in response.docs]
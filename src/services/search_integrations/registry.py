@@ -2,17 +2,38 @@ from __future__ import annotations
 
 from bot.config import SEARCH_PROVIDER
 from models.search_provider_types import Provider
+from services.search_integrations.cached import CachedSearchProvider
+from services.search_integrations.hedged import HedgedSearchProvider
 from services.search_integrations.interface import SearchProvider
 from services.search_integrations.kinopoisk import kinopoisk_service
 from services.search_integrations.tmdb import tmdb_service
 
+HEDGED_SEARCH_PROVIDER = "hedged"
+
+_providers: dict[str, SearchProvider] = {
+    Provider.TMDB: CachedSearchProvider(tmdb_service, Provider.TMDB.value),
+    Provider.KINOPOISK: CachedSearchProvider(kinopoisk_service, Provider.KINOPOISK.value),
+}
+_hedged_provider = HedgedSearchProvider(
+    {
+        Provider.TMDB: _providers[Provider.TMDB],
+        Provider.KINOPOISK: _providers[Provider.KINOPOISK],
+    }
+)
+
 
 def get_search_provider() -> SearchProvider:
-    if SEARCH_PROVIDER == Provider.TMDB:
-        return tmdb_service
-    if SEARCH_PROVIDER == Provider.KINOPOISK:
-        return kinopoisk_service
-    raise ValueError(f"Unknown search provider: {SEARCH_PROVIDER}")
+    if SEARCH_PROVIDER == HEDGED_SEARCH_PROVIDER:
+        return _hedged_provider
+    try:
+        return _providers[SEARCH_PROVIDER]
+    except KeyError:
+        raise ValueError(f"Unknown search provider: {SEARCH_PROVIDER}") from None
+
+
+async def close_search_providers() -> None:
+    for provider in _providers.values():
+        await provider.aclose()
 
 
-__all__ = ["get_search_provider"]
+__all__ = ["HEDGED_SEARCH_PROVIDER", "close_search_providers", "get_search_provider"]
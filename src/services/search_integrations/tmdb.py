@@ -21,6 +21,7 @@ from models.tmdb_types import (
     TmdbTVShowSearchResult,
 )
 from services.exceptions import TmdbApiError
+from services.search_integrations.http_client import PooledHttpClient
 from services.search_integrations.interface import SearchProvider
 
 logger = logging.getLogger(__name__)
@@ -31,6 +32,7 @@ class TmdbService(SearchProvider):
         self._api_token = api_token
         self._base_url = base_url.rstrip("/")
         self._image_base_url = "https://image.tmdb.org/t/p/w500"
+        self._http = PooledHttpClient("TMDB")
 
     async def search(self, query: str) -> SearchResults:
         if not query.strip():
@@ -39,7 +41,7 @@ class TmdbService(SearchProvider):
         params = {"query": query, "language": "ru-RU"}
         payload = await self._request("GET", "/search/multi", params=params)
         try:
-            response = TmdbSearchResponse.model_validate(payload)
+            response = TmdbSearchResponse.model_validate_json(payload)
         except Exception as exc:
             message = "Failed to parse TMDB search response."
             logger.error("%s Raw payload: %s", message, payload, exc_info=True)
@@ -47,7 +49,9 @@ class TmdbService(SearchProvider):
 
         return self._to_search_results(response)
 
-    async def get_details(self, media_id: str) -> MediaDetails:
+    async def get_details(
+        self, media_id: str, *, is_series: bool | None = None
+    ) -> MediaDetails:
         media_type, tmdb_id = self._parse_media_id(media_id)
 
         if media_type == "movie":
@@ -62,7 +66,7 @@ class TmdbService(SearchProvider):
         params = {"language": "ru-RU"}
         payload = await self._request("GET", path, params=params)
         try:
-            details = parser.model_validate(payload)
+            details = parser.model_validate_json(payload)
         except Exception as exc:
             message = f"Failed to parse TMDB details for {media_id}."
             logger.error("%s Raw payload: %s", message, payload, exc_info=True)
@@ -70,13 +74,16 @@ class TmdbService(SearchProvider):
 
         return self._to_media_details(details)
 
+    async def aclose(self) -> None:
+        await self._http.aclose()
+
     async def _request(
         self,
         method: str,
         path: str,
         *,
         params: dict[str, Any] | None = None,
-    ) -> dict[str, Any]:
+    ) -> bytes:
         if not self._api_token:
             raise TmdbApiError("TMDB API token is not configured.")
 
@@ -87,10 +94,9 @@ class TmdbService(SearchProvider):
         }
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.request(
-                    method, url, headers=headers, params=params
-                )
+            response = await self._http.client.request(
+                method, url, headers=headers, params=params
+            )
         except httpx.HTTPError as exc:
             message = f"TMDB request to {url} failed: {exc}"
             logger.error(message)
@@ -101,7 +107,7 @@ class TmdbService(SearchProvider):
             logger.error(message)
             raise TmdbApiError(message)
 
-        return response.json()
+        return response.content
 
     def _to_search_results(self, response: TmdbSearchResponse) -> SearchResults:
         items = []
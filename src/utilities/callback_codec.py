@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import hmac
+import logging
+import os
+import uuid
+from enum import Enum
+
+from bot.config import CALLBACK_SIGNING_KEY
+from bot.constants import (
+    MEDIA_LIST_CALLBACK,
+    SEARCH_MOVIE_CALLBACK,
+    TORRENT_DELETE_CALLBACK,
+    TORRENT_DETAILED_CALLBACK,
+    TORRENT_PAUSE_CALLBACK,
+    TORRENT_START_CALLBACK,
+)
+
+logger = logging.getLogger(__name__)
+
+# Telegram limits callback_data to 64 bytes.
+CALLBACK_DATA_LIMIT = 64
+# Marks packed callback_data; never part of a Redis key or the base64url alphabet.
+COMPACT_PREFIX = "~"
+SIGNATURE_SIZE = 8
+
+
+class FieldKind(Enum):
+    HEX = "hex"  # lowercase hex string, e.g. a torrent hash
+    UUID = "uuid"  # canonical UUID string, e.g. a Redis callback key
+    INT = "int"  # non-negative integer, e.g. a page index
+    STR = "str"  # short text
+
+
+# Action codes are part of the wire format: never renumber or reuse one,
+# buttons already sent keep carrying them.
+COMPACT_ACTIONS: dict[str, tuple[int, tuple[tuple[str, FieldKind], ...]]] = {
+    TORRENT_DETAILED_CALLBACK: (1, (("torrent_hash", FieldKind.HEX),)),
+    TORRENT_START_CALLBACK: (2, (("torrent_hash", FieldKind.HEX),)),
+    TORRENT_PAUSE_CALLBACK: (3, (("torrent_hash", FieldKind.HEX),)),
+    TORRENT_DELETE_CALLBACK: (4, (("torrent_hash", FieldKind.HEX),)),
+    SEARCH_MOVIE_CALLBACK: (
+        5,
+        (("results_cache_key", FieldKind.UUID), ("page", FieldKind.INT)),
+    ),
+    MEDIA_LIST_CALLBACK: (6, (("query", FieldKind.STR),)),
+}
+_ACTIONS_BY_CODE = {
+    code: (action, fields) for action, (code, fields) in COMPACT_ACTIONS.items()
+}
+
+if CALLBACK_SIGNING_KEY:
+    _signing_key = hashlib.sha256(
+        b"callback-data:" + CALLBACK_SIGNING_KEY.encode()
+    ).digest()
+else:
+    # Packed buttons then stop verifying after a restart and fall through
+    # as unknown callbacks.
+    logger.warning("No callback signing key configured, using a random one")
+    _signing_key = os.urandom(32)
+
+
+def encode_callback(payload: dict) -> str | None:
+    """
+    Pack a callback payload into self-contained, signed callback_data.
+    :param payload: callback payload with an ``action``
+    :return: callback_data, or None when the payload has to be stored instead
+    """
+    if (compact := COMPACT_ACTIONS.get(payload.get("action"))) is None:
+        return None
+    code, fields = compact
+    if payload.keys() != {"action", *(name for name, _ in fields)}:
+        return None
+
+    body = bytearray((code,))
+    try:
+        for name, kind in fields:
+            body += _pack_field(kind, payload[name])
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+    body += _sign(body)
+    encoded = base64.urlsafe_b64encode(body).rstrip(b"=").decode()
+    callback_data = COMPACT_PREFIX + encoded
+    if len(callback_data) > CALLBACK_DATA_LIMIT:
+        return None
+    return callback_data
+
+
+def decode_callback(callback_data: str) -> dict | None:
+    """
+    Unpack callback_data made by encode_callback.
+    :return: the payload, or None when the data is malformed or forged
+    """
+    if not is_compact_callback(callback_data):
+        return None
+    try:
+        encoded = callback_data[len(COMPACT_PREFIX) :]
+        raw = base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4))
+    except ValueError:
+        return None
+    body, signature = raw[:-SIGNATURE_SIZE], raw[-SIGNATURE_SIZE:]
+    if not body or not hmac.compare_digest(signature, _sign(body)):
+        logger.warning("Rejected callback data with a bad signature")
+        return None
+    if (compact := _ACTIONS_BY_CODE.get(body[0])) is None:
+        return None
+
+    action, fields = compact
+    payload: dict = {"action": action}
+    position = 1
+    try:
+        for name, kind in fields:
+            payload[name], position = _unpack_field(kind, body, position)
+    except (IndexError, ValueError):
+        return None
+    return payload if position == len(body) else None
+
+
+def is_compact_callback(callback_data: str) -> bool:
+    return callback_data.startswith(COMPACT_PREFIX)
+
+
+def _sign(body: bytes | bytearray) -> bytes:
+    return hmac.digest(_signing_key, bytes(body), "sha256")[:SIGNATURE_SIZE]
+
+
+def _pack_field(kind: FieldKind, value) -> bytes:
+    if kind is FieldKind.HEX:
+        if value != value.lower():
+            raise ValueError("hex field must be lowercase")
+        return _with_length(bytes.fromhex(value))
+    if kind is FieldKind.UUID:
+        packed = uuid.UUID(value)
+        if str(packed) != value:
+            raise ValueError("uuid field must be canonical")
+        return packed.bytes
+    if kind is FieldKind.INT:
+        if type(value) is not int or value < 0:
+            raise ValueError("int field must be a non-negative int")
+        return _varint(value)
+    if not isinstance(value, str):
+        raise TypeError("str field must be a string")
+    return _with_length(value.encode())
+
+
+def _unpack_field(kind: FieldKind, body: bytes, position: int) -> tuple[object, int]:
+    if kind is FieldKind.UUID:
+        end = position + 16
+        if end > len(body):
+            raise ValueError("truncated uuid field")
+        return str(uuid.UUID(bytes=body[position:end])), end
+    if kind is FieldKind.INT:
+        value = shift = 0
+        while True:
+            byte = body[position]
+            position += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value, position
+            shift += 7
+
+    end = position + 1 + body[position]
+    if end > len(body):
+        raise ValueError("truncated field")
+    raw = body[position + 1 : end]
+    return (raw.hex() if kind is FieldKind.HEX else raw.decode()), end
+
+
+def _with_length(raw: bytes) -> bytes:
+    if len(raw) > 0xFF:
+        raise ValueError("field too long")
+    return bytes((len(raw),)) + raw
+
+
+def _varint(value: int) -> bytes:
+    packed = bytearray()
+    while value >= 0x80:
+        packed.append(value & 0x7F | 0x80)
+        value >>= 7
+    packed.append(value)
+    return bytes(packed)
+
+
+__all__ = [
+    "COMPACT_ACTIONS",
+    "FieldKind",
+    "decode_callback",
+    "encode_callback",
+    "is_compact_callback",
+]
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+from groq.types.chat import (
+    ChatCompletionMessageParam,
+    ChatCompletionSystemMessageParam,
+    ChatCompletionUserMessageParam,
+)
+from jinja2 import Environment, FileSystemLoader
+
+from bot.config import GROQ_RESPONSE_FORMAT, TEMPLATES_DIR
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the templates or the schema change so cached verdicts are not reused.
+PROMPT_VERSION = "3"
+
+_env = Environment(loader=FileSystemLoader(TEMPLATES_DIR))
+
+# The instructions do not depend on the searched item, so they are rendered
+# once and sent verbatim; identical prefixes let the provider reuse its cache.
+MOVIE_SEARCH_SYSTEM = _env.get_template("movie_search_system.j2").render()
+MOVIE_SEARCH_BATCH_SYSTEM = _env.get_template("movie_search_batch_system.j2").render()
+_movie_search_user = _env.get_template("movie_search_user.j2")
+_movie_search_batch_user = _env.get_template("movie_search_batch_user.j2")
+
+_STRING = {"type": "string"}
+_STRING_LIST = {"type": "array", "items": _STRING}
+VERDICT_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "is_valid": {"type": "boolean"},
+        "name": _STRING,
+        "year": _STRING,
+        "genres": _STRING_LIST,
+        "director": _STRING,
+        "actors": _STRING_LIST,
+        "image_url": _STRING,
+        "ratings": {
+            "type": "object",
+            "properties": {"imdb": _STRING, "kinopoisk": _STRING},
+            "required": ["imdb", "kinopoisk"],
+            "additionalProperties": False,
+        },
+        "torrent_details": {"type": "array", "items": {}},
+        "video_quality": _STRING,
+        "audio_quality": _STRING,
+        "audio_language": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {"language": _STRING, "quality": _STRING},
+                "required": ["language", "quality"],
+                "additionalProperties": False,
+            },
+        },
+    },
+    "required": [
+        "is_valid",
+        "name",
+        "year",
+        "genres",
+        "director",
+        "actors",
+        "image_url",
+        "ratings",
+        "torrent_details",
+        "video_quality",
+        "audio_quality",
+        "audio_language",
+    ],
+    "additionalProperties": False,
+}
+BATCH_VERDICT_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "results": {
+            "type": "array",
+            "items": {
+                **VERDICT_SCHEMA,
+                "properties": {"index": {"type": "integer"}, **VERDICT_SCHEMA["properties"]},
+                "required": ["index", *VERDICT_SCHEMA["required"]],
+            },
+        },
+    },
+    "required": ["results"],
+    "additionalProperties": False,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Prompt:
+    system: str
+    user: str
+    schema_name: str
+    schema: dict[str, Any]
+
+    @property
+    def messages(self) -> list[ChatCompletionMessageParam]:
+        return [
+            ChatCompletionSystemMessageParam(content=self.system, role="system"),
+            ChatCompletionUserMessageParam(content=self.user, role="user"),
+        ]
+
+    @property
+    def text(self) -> str:
+        return f"{self.system}\n{self.user}"
+
+    def response_format(self) -> dict[str, Any] | None:
+        """Request options for ``GROQ_RESPONSE_FORMAT``.
+
+        ``json_schema`` constrains decoding to the verdict schema (only some
+        models support it), ``json_object`` guarantees syntactically valid JSON
+        and ``text`` leaves the reply unconstrained.
+        """
+        if GROQ_RESPONSE_FORMAT == "json_schema":
+            return {
+                "type": "json_schema",
+                "json_schema": {"name": self.schema_name, "schema": self.schema},
+            }
+        if GROQ_RESPONSE_FORMAT == "json_object":
+            return {"type": "json_object"}
+        return None
+
+
+def movie_search_prompt(
+    title: str, requested_item: str, requested_type: str
+) -> Prompt:
+    return Prompt(
+        system=MOVIE_SEARCH_SYSTEM,
+        user=_movie_search_user.render(
+            title=title,
+            requested_item=requested_item,
+            requested_type=requested_type,
+        ),
+        schema_name="torrent_verdict",
+        schema=VERDICT_SCHEMA,
+    )
+
+
+def movie_search_batch_prompt(
+    titles: list[str], requested_item: str, requested_type: str
+) -> Prompt:
+    return Prompt(
+        system=MOVIE_SEARCH_BATCH_SYSTEM,
+        user=_movie_search_batch_user.render(
+            titles=titles,
+            requested_item=requested_item,
+            requested_type=requested_type,
+        ),
+        schema_name="torrent_verdicts",
+        schema=BATCH_VERDICT_SCHEMA,
+    )
+
+
+def log_prompt_usage(prompt: Prompt, usage: Any) -> None:
+    """Log the prompt tokens billed for one call, including the cached part."""
+    if usage is None:
+        return
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached_tokens = getattr(details, "cached_tokens", None) or 0
+    logger.debug(
+        "Groq %s prompt: %s tokens (%d cached), %s completion tokens",
+        prompt.schema_name,
+        usage.prompt_tokens,
+        cached_tokens,
+        usage.completion_tokens,
+    )
+
+
+__all__ = [
+    "BATCH_VERDICT_SCHEMA",
+    "MOVIE_SEARCH_BATCH_SYSTEM",
+    "MOVIE_SEARCH_SYSTEM",
+    "PROMPT_VERSION",
+    "Prompt",
+    "VERDICT_SCHEMA",
+    "log_prompt_usage",
+    "movie_search_batch_prompt",
+    "movie_search_prompt",
+]
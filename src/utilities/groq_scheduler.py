@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable
+from enum import IntEnum
+from itertools import count
+from typing import Any
+
+from groq import RateLimitError
+
+logger = logging.getLogger(__name__)
+
+
+class Priority(IntEnum):
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+class TokenBucket:
+    """Continuously refilling bucket; consumption may run into debt."""
+
+    def __init__(
+        self,
+        capacity: float,
+        refill_per_second: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.capacity = capacity
+        self._refill_per_second = refill_per_second
+        self._clock = clock
+        self._level = capacity
+        self._updated_at = clock()
+
+    def delay(self, amount: float) -> float:
+        """Seconds until ``amount`` can be consumed without going into debt."""
+        self._refill()
+        missing = min(amount, self.capacity) - self._level
+        return max(0.0, missing / self._refill_per_second)
+
+    def consume(self, amount: float) -> None:
+        self._refill()
+        self._level -= amount
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self._level = min(self.capacity, self._level + elapsed * self._refill_per_second)
+
+
+class GroqScheduler:
+    """Runs chat completion calls within the provider's rate limits.
+
+    Calls wait for both the requests-per-minute and tokens-per-minute buckets
+    and for a free concurrency slot; waiting calls are released in priority
+    order. A 429 response pauses every caller for the server supplied
+    ``retry-after`` (or a jittered exponential backoff) before retrying.
+    ``create``, ``clock``, ``sleep`` and the limit window are injectable so the
+    scheduler can be driven against a local fake.
+    """
+
+    def __init__(
+        self,
+        create: Callable[..., Awaitable[Any]],
+        *,
+        requests_per_minute: int,
+        tokens_per_minute: int,
+        max_concurrency: int,
+        max_retries: int = 3,
+        base_backoff: float = 1.0,
+        max_backoff: float = 30.0,
+        window_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        self._create = create
+        self._requests = TokenBucket(
+            requests_per_minute, requests_per_minute / window_seconds, clock
+        )
+        self._tokens = TokenBucket(
+            tokens_per_minute, tokens_per_minute / window_seconds, clock
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._max_retries = max_retries
+        self._base_backoff = base_backoff
+        self._max_backoff = max_backoff
+        self._clock = clock
+        self._sleep = sleep
+        self._blocked_until = 0.0
+        self._waiters: list[tuple[int, int, float, asyncio.Future]] = []
+        self._sequence = count()
+        self._dispatcher: asyncio.Task | None = None
+
+    async def create(
+        self,
+        *,
+        estimated_tokens: int,
+        priority: Priority = Priority.INTERACTIVE,
+        **kwargs: Any,
+    ) -> Any:
+        attempt = 0
+        while True:
+            await self._acquire(priority, estimated_tokens)
+            try:
+                response = await self._create(**kwargs)
+            except RateLimitError as exc:
+                if attempt >= self._max_retries:
+                    raise
+                delay = self._retry_delay(exc, attempt)
+                logger.warning(
+                    "Groq rate limit hit (attempt %d/%d), retrying in %.1fs",
+                    attempt + 1,
+                    self._max_retries,
+                    delay,
+                )
+                self._blocked_until = max(self._blocked_until, self._clock() + delay)
+            else:
+                self._settle_tokens(response, estimated_tokens)
+                return response
+            finally:
+                self._semaphore.release()
+            attempt += 1
+            await self._sleep(delay)
+
+    async def _acquire(self, priority: Priority, estimated_tokens: float) -> None:
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(
+            self._waiters,
+            (priority, next(self._sequence), estimated_tokens, future),
+        )
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self._semaphore.release()
+            raise
+
+    async def _dispatch(self) -> None:
+        while self._waiters:
+            await self._semaphore.acquire()
+            while True:
+                if not self._waiters:
+                    self._semaphore.release()
+                    return
+                _, _, tokens, future = self._waiters[0]
+                if future.cancelled():
+                    heapq.heappop(self._waiters)
+                    continue
+                delay = max(
+                    self._blocked_until - self._clock(),
+                    self._requests.delay(1),
+                    self._tokens.delay(tokens),
+                )
+                if delay <= 0:
+                    break
+                # Re-check the head afterwards: a higher priority call may
+                # have arrived while we were waiting for the buckets.
+                await self._sleep(delay)
+
+            heapq.heappop(self._waiters)
+            self._requests.consume(1)
+            self._tokens.consume(tokens)
+            future.set_result(None)
+
+    def _settle_tokens(self, response: Any, estimated_tokens: int) -> None:
+        usage = getattr(response, "usage", None)
+        if total_tokens := getattr(usage, "total_tokens", None):
+            self._tokens.consume(total_tokens - estimated_tokens)
+
+    def _retry_delay(self, exc: RateLimitError, attempt: int) -> float:
+        backoff = min(self._max_backoff, self._base_backoff * 2**attempt)
+        jitter = random.uniform(0, backoff)
+        retry_after = _retry_after_seconds(exc)
+        if retry_after is not None:
+            return retry_after + jitter * 0.1
+        return jitter
+
+
+def _retry_after_seconds(exc: RateLimitError) -> float | None:
+    response = getattr(exc, "response", None)
+    value = response.headers.get("retry-after") if response is not None else None
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except ValueError:
+        return None
+
+
+def estimate_tokens(prompt: str, completion_budget: int) -> int:
+    """Rough token estimate (4 characters per token) plus the expected reply."""
+    return len(prompt) // 4 + completion_budget
+
+
+__all__ = [
+    "GroqScheduler",
+    "Priority",
+    "TokenBucket",
+    "estimate_tokens",
+]
@@ -3,64 +3,228 @@ import asyncio
 import logging
 
 from groq import AsyncGroq
-from groq.types.chat import ChatCompletionSystemMessageParam
-from jinja2 import Environment, FileSystemLoader
 
 from bot import config
-from bot.config import TEMPLATES_DIR
 from models.movie_detail_service_types import AudioLanguage, MovieDetails
+from services.redis_services import verdict_cache
+from utilities.groq_prompts import (
+    PROMPT_VERSION,
+    Prompt,
+    log_prompt_usage,
+    movie_search_batch_prompt,
+    movie_search_prompt,
+)
+from utilities.groq_scheduler import GroqScheduler, Priority, estimate_tokens
+from utilities.title_cascade import CascadeDecision, TitleCascade, local_verdict
 
-client = AsyncGroq(api_key=config.GROQ_API_KEY)
+_client: AsyncGroq | None = None
+
+
+def _get_client() -> AsyncGroq:
+    """Create the client on first use; AsyncGroq refuses to start without a key."""
+    global _client
+    if _client is None:
+        # Retries are owned by the scheduler, which knows about the rate limits.
+        _client = AsyncGroq(api_key=config.GROQ_API_KEY, max_retries=0)
+    return _client
+
+
+scheduler = GroqScheduler(
+    lambda **kwargs: _get_client().chat.completions.create(**kwargs),
+    requests_per_minute=config.GROQ_REQUESTS_PER_MINUTE,
+    tokens_per_minute=config.GROQ_TOKENS_PER_MINUTE,
+    max_concurrency=config.GROQ_MAX_CONCURRENCY,
+    max_retries=config.GROQ_MAX_RETRIES,
+)
+
+# Rough upper bound of reply tokens for one title verdict.
+VERDICT_COMPLETION_TOKENS = 300
+
+_NOT_PARSED = object()
 
 
 async def get_movie_search_result(
-    movie_detail: MovieDetails, **kwargs
+    movie_detail: MovieDetails,
+    *,
+    priority: Priority = Priority.INTERACTIVE,
+    **kwargs,
 ) -> MovieDetails | None:
-    prompt = get_movie_search_prompt(**kwargs)
-    chat_completion = await client.chat.completions.create(
-        messages=[
-            ChatCompletionSystemMessageParam(
-                content=prompt,
-                role="system",
-            ),
-        ],
-        model="openai/gpt-oss-20b",
+    prompt = movie_search_prompt(
+        kwargs["title"], kwargs["requested_item"], kwargs["requested_type"]
     )
-    response = chat_completion.choices[0].message.content
-    json_response = json.loads(response)
-    if not json_response.get("is_valid"):
-        return None
+    response = await _complete(prompt, priority=priority)
+    verdict = _to_verdict(json.loads(response))
+    await verdict_cache.save_verdicts(
+        {
+            _verdict_key(
+                kwargs["title"], kwargs["requested_item"], kwargs["requested_type"]
+            ): verdict
+        }
+    )
+    return _apply_verdict(movie_detail, verdict)
+
+
+async def get_movie_search_results_batch(
+    movie_details: list[MovieDetails],
+    *,
+    requested_item: str,
+    requested_type: str,
+    priority: Priority = Priority.INTERACTIVE,
+) -> list:
+    """Validate several titles with one LLM call.
+
+    Returns one entry per movie: the validated movie, ``None`` when the model
+    rejected it, or ``_NOT_PARSED`` when its verdict is missing or malformed.
+    """
+    titles = [movie.search_name or movie.name for movie in movie_details]
+    prompt = movie_search_batch_prompt(
+        titles=titles,
+        requested_item=requested_item,
+        requested_type=requested_type,
+    )
+    response = await _complete(prompt, priority=priority, items=len(titles))
+    raw_verdicts = _parse_batch_verdicts(response, len(movie_details))
+
+    results = []
+    verdicts_to_cache = {}
+    for movie, title, raw_verdict in zip(movie_details, titles, raw_verdicts):
+        if raw_verdict is None:
+            results.append(_NOT_PARSED)
+            continue
+        try:
+            verdict = _to_verdict(raw_verdict)
+        except (TypeError, ValueError) as exc:
+            logging.warning("Malformed Groq verdict for movie id %s: %s", movie.id, exc)
+            results.append(_NOT_PARSED)
+            continue
+        verdicts_to_cache[_verdict_key(title, requested_item, requested_type)] = verdict
+        results.append(_apply_verdict(movie, verdict))
+
+    await verdict_cache.save_verdicts(verdicts_to_cache)
+    return results
+
+
+async def _complete(
+    prompt: Prompt, *, priority: Priority = Priority.INTERACTIVE, items: int = 1
+) -> str:
+    request = {}
+    if response_format := prompt.response_format():
+        request["response_format"] = response_format
+    chat_completion = await scheduler.create(
+        messages=prompt.messages,
+        model=config.GROQ_MODEL,
+        estimated_tokens=estimate_tokens(prompt.text, VERDICT_COMPLETION_TOKENS * items),
+        priority=priority,
+        **request,
+    )
+    log_prompt_usage(prompt, getattr(chat_completion, "usage", None))
+    return chat_completion.choices[0].message.content
 
-    movie_detail.video_quality = json_response.get("video_quality")
-    movie_detail.audio_quality = json_response.get("audio_quality")
+
+def _to_verdict(json_response: dict) -> dict:
+    """Reduce an LLM response to the fields we keep and cache."""
     audio_language = [
-        AudioLanguage(**lang) for lang in json_response.get("audio_language", [])
+        AudioLanguage(**lang) for lang in json_response.get("audio_language") or []
+    ]
+    return {
+        "is_valid": bool(json_response.get("is_valid")),
+        "video_quality": json_response.get("video_quality"),
+        "audio_quality": json_response.get("audio_quality"),
+        "audio_language": [lang.model_dump() for lang in audio_language],
+        "search_name": json_response.get("name"),
+    }
+
+
+def _apply_verdict(movie_detail: MovieDetails, verdict: dict) -> MovieDetails | None:
+    if not verdict["is_valid"]:
+        return None
+
+    movie_detail.video_quality = verdict["video_quality"]
+    movie_detail.audio_quality = verdict["audio_quality"]
+    movie_detail.audio_language = [
+        AudioLanguage(**lang) for lang in verdict["audio_language"]
     ]
-    movie_detail.audio_language = audio_language
-    movie_detail.search_name = json_response.get("name")
+    movie_detail.search_name = verdict["search_name"]
     return movie_detail
 
 
+def _verdict_key(title: str, requested_item: str, requested_type: str) -> str:
+    return verdict_cache.verdict_cache_key(
+        title, requested_item, requested_type, PROMPT_VERSION
+    )
+
+
+def _parse_batch_verdicts(response: str, expected: int) -> list[dict | None]:
+    verdicts: list[dict | None] = [None] * expected
+    try:
+        payload = json.loads(response)
+    except (TypeError, ValueError):
+        logging.warning("Groq batch response is not valid JSON.")
+        return verdicts
+
+    items = payload.get("results") if isinstance(payload, dict) else payload
+    if not isinstance(items, list):
+        logging.warning("Groq batch response has no results list.")
+        return verdicts
+
+    for position, item in enumerate(items):
+        if not isinstance(item, dict):
+            continue
+        index = item.get("index", position)
+        if isinstance(index, int) and 0 <= index < expected:
+            verdicts[index] = item
+    return verdicts
+
+
 async def filter_movies_with_groq(
     movies: list,
     *,
     requested_item: str,
     requested_type: str,
+    expected_titles: list[str] | None = None,
+    year: int | None = None,
+    season_number: int | None = None,
+    batch_size: int = config.GROQ_BATCH_SIZE,
+    priority: Priority = Priority.INTERACTIVE,
 ) -> list:
-    movies_to_validate = [
-        movie for movie in movies if (movie.search_name or movie.name)
-    ]
+    cascade = TitleCascade(
+        expected_titles=expected_titles or [requested_item],
+        requested_type=requested_type,
+        year=year,
+        season_number=season_number,
+    )
+    movies_to_validate, validation_results = _run_cascade(
+        [movie for movie in movies if (movie.search_name or movie.name)], cascade
+    )
     if not movies_to_validate:
         return []
 
-    validation_tasks = [
-        _validate_movie_with_groq(movie, requested_item, requested_type)
-        for movie in movies_to_validate
-    ]
-    validation_results = await asyncio.gather(
-        *validation_tasks,
-        return_exceptions=True,
+    pending = [i for i, result in enumerate(validation_results) if result is _NOT_PARSED]
+    cached_results = await _get_cached_validations(
+        [movies_to_validate[i] for i in pending], requested_item, requested_type
     )
+    for position, cached_result in zip(pending, cached_results):
+        validation_results[position] = cached_result
+    pending = [i for i in pending if validation_results[i] is _NOT_PARSED]
+    pending_movies = [movies_to_validate[i] for i in pending]
+
+    if not pending_movies:
+        llm_results = []
+    elif batch_size > 1:
+        llm_results = await _validate_in_batches(
+            pending_movies, requested_item, requested_type, batch_size, priority
+        )
+    else:
+        validation_tasks = [
+            _validate_movie_with_groq(movie, requested_item, requested_type, priority)
+            for movie in pending_movies
+        ]
+        llm_results = await asyncio.gather(
+            *validation_tasks,
+            return_exceptions=True,
+        )
+    for position, llm_result in zip(pending, llm_results):
+        validation_results[position] = llm_result
 
     filtered: list = []
     for movie, validation in zip(movies_to_validate, validation_results):
@@ -84,10 +248,108 @@ async def filter_movies_with_groq(
     return filtered
 
 
+def _run_cascade(movies: list, cascade: TitleCascade) -> tuple[list, list]:
+    """Decide what the cascade can locally.
+
+    Rejected titles are dropped, accepted ones get a verdict built from their
+    parsed features and uncertain ones are marked ``_NOT_PARSED`` for the LLM.
+    """
+    kept = []
+    results = []
+    for movie in movies:
+        title = movie.search_name or movie.name
+        decision = cascade.decide(title)
+        if decision == CascadeDecision.REJECT:
+            continue
+        kept.append(movie)
+        if decision == CascadeDecision.ACCEPT:
+            results.append(_apply_verdict(movie, local_verdict(title)))
+        else:
+            results.append(_NOT_PARSED)
+
+    stats = cascade.stats
+    logging.info(
+        "Groq cascade: %d accepted, %d rejected, %d uncertain, %d LLM calls avoided",
+        stats.accepted,
+        stats.rejected,
+        stats.unsure,
+        stats.llm_calls_avoided,
+    )
+    return kept, results
+
+
+async def _get_cached_validations(
+    movies: list,
+    requested_item: str,
+    requested_type: str,
+) -> list:
+    keys = [
+        _verdict_key(movie.search_name or movie.name, requested_item, requested_type)
+        for movie in movies
+    ]
+    results = []
+    for movie, verdict in zip(movies, await verdict_cache.get_verdicts(keys)):
+        results.append(_NOT_PARSED if verdict is None else _apply_verdict(movie, verdict))
+
+    misses = sum(result is _NOT_PARSED for result in results)
+    await verdict_cache.record_lookups(hits=len(results) - misses, misses=misses)
+    return results
+
+
+async def _validate_in_batches(
+    movies: list,
+    requested_item: str,
+    requested_type: str,
+    batch_size: int,
+    priority: Priority,
+) -> list:
+    chunks = [movies[i : i + batch_size] for i in range(0, len(movies), batch_size)]
+    chunk_results = await asyncio.gather(
+        *(
+            get_movie_search_results_batch(
+                chunk,
+                requested_item=requested_item,
+                requested_type=requested_type,
+                priority=priority,
+            )
+            for chunk in chunks
+        ),
+        return_exceptions=True,
+    )
+
+    results: list = []
+    for chunk, chunk_result in zip(chunks, chunk_results):
+        if isinstance(chunk_result, Exception):
+            logging.warning("Groq batch validation failed: %s", chunk_result)
+            chunk_result = [_NOT_PARSED] * len(chunk)
+        results.extend(chunk_result)
+
+    fallback_positions = [i for i, result in enumerate(results) if result is _NOT_PARSED]
+    if fallback_positions:
+        logging.debug(
+            "Falling back to per-item Groq validation for %d/%d titles",
+            len(fallback_positions),
+            len(movies),
+        )
+        fallbacks = await asyncio.gather(
+            *(
+                _validate_movie_with_groq(
+                    movies[i], requested_item, requested_type, priority
+                )
+                for i in fallback_positions
+            ),
+            return_exceptions=True,
+        )
+        for position, fallback in zip(fallback_positions, fallbacks):
+            results[position] = fallback
+    return results
+
+
 async def _validate_movie_with_groq(
     movie: MovieDetails,
     requested_item: str,
     requested_type: str,
+    priority: Priority = Priority.INTERACTIVE,
 ) -> MovieDetails | None:
     title = movie.search_name or movie.name
     if not title:
@@ -99,6 +361,7 @@ async def _validate_movie_with_groq(
             title=title,
             requested_item=requested_item,
             requested_type=requested_type,
+            priority=priority,
         )
     except Exception as exc:
         logging.warning(
@@ -110,17 +373,3 @@ async def _validate_movie_with_groq(
         return None
 
     return validation
-
-
-def get_movie_search_prompt(
-    title: str, requested_item: str, requested_type: str, **kwargs
-) -> str:
-    env = Environment(loader=FileSystemLoader(TEMPLATES_DIR))
-    template = env.get_template("movie_search_prompt.j2")
-
-    return template.render(
-        title=title,
-        requested_item=requested_item,
-        requested_type=requested_type,
-        **kwargs,
-    )
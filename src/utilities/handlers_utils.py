@@ -1,8 +1,87 @@
+import asyncio
+import copy
+import hashlib
 import json
 import logging
+import sqlite3
+import time
 import uuid
+from collections import OrderedDict
+from collections.abc import Iterable
+from contextlib import suppress
+from contextvars import ContextVar
+from dataclasses import dataclass
 
-from services.redis_services.client import redis_client
+from aiogram.filters import Filter
+from aiogram.types import CallbackQuery
+from redis import RedisError
+
+from bot.config import (
+    CALLBACK_BLOB_MIN_BYTES,
+    CALLBACK_L1_SIZE,
+    CALLBACK_L1_TTL_SECONDS,
+    CALLBACK_MEMORY_REPORT_INTERVAL,
+)
+from services.callback_storage.registry import get_callback_storage
+from services.redis_services.serializer import callback_serializer
+from utilities.callback_codec import (
+    decode_callback,
+    encode_callback,
+    is_compact_callback,
+)
+
+BLOB_REFERENCE = "$blob"
+# Namespace of payloads saved or read outside of a chat, e.g. for inline messages.
+DEFAULT_CALLBACK_NAMESPACE = "global"
+
+# Set per update by CallbackNamespaceMiddleware to the id of the event's chat.
+callback_namespace: ContextVar[str] = ContextVar(
+    "callback_namespace", default=DEFAULT_CALLBACK_NAMESPACE
+)
+_memory_report_task: asyncio.Task | None = None
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError(
+        "Callback payloads are shared, copy them (copy.deepcopy) before changing them"
+    )
+
+
+class _ReadOnlyDict(dict):
+    __slots__ = ()
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self) -> dict:
+        return dict(self)
+
+    def __deepcopy__(self, memo: dict) -> dict:
+        return {key: copy.deepcopy(value, memo) for key, value in self.items()}
+
+
+class _ReadOnlyList(list):
+    __slots__ = ()
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = clear = extend = insert = pop = remove = reverse = sort = _read_only
+
+    def __copy__(self) -> list:
+        return list(self)
+
+    def __deepcopy__(self, memo: dict) -> list:
+        return [copy.deepcopy(value, memo) for value in self]
+
+
+@dataclass(frozen=True, slots=True)
+class _CachedPayload:
+    payload: dict
+    expires_at: float
+
+
+# Resolved payloads by (namespace, key), frozen so that every reader can be
+# handed the same object. The callback storage stays the source of truth:
+# entries are never rewritten, and the short TTL bounds how long an entry
+# deleted or evicted by another process can still be served from here.
+_l1: OrderedDict[tuple[str, str], _CachedPayload] = OrderedDict()
 
 logger = logging.getLogger(__name__)
 
@@ -18,23 +97,220 @@ def extract_text_without_command(message_text, command):
     return message_text[command_length:].strip()
 
 
-def redis_callback_save(callback_data: dict) -> str:
-    logger.debug(f"Saving callback data: {callback_data}")
-    query_key = str(uuid.uuid4())
-    serialized_data = json.dumps(callback_data)
+async def redis_callback_save(callback_data: dict) -> str:
+    """
+    Turn a callback payload into button callback_data.
+    Small payloads are packed into the callback_data itself; only the others
+    are stored in the callback storage under a random key in the current
+    chat's namespace.
+    """
+    (callback_key,) = await redis_callback_save_many([callback_data])
+    return callback_key
+
+
+async def redis_callback_save_many(callbacks_data: list[dict]) -> list[str]:
+    """
+    Turn the callback payloads of a whole keyboard into callback_data,
+    storing the ones that don't pack in one call to the callback storage.
+    Large field values are stored once as content-addressed blobs and the
+    entries only reference them, so e.g. the same media details attached to
+    every season button take space once.
+    Entries are kept per chat (see ``callback_namespace``); once a chat has
+    more than CALLBACK_CHAT_MAX_KEYS live entries, the least recently used
+    ones are evicted.
+    Saved payloads are also kept in the in-process cache, as the next update
+    usually reads one of them back.
+    :param callbacks_data: payloads, one per button
+    :return: callback keys aligned with callbacks_data
+    """
+    callback_keys = [encode_callback(callback_data) for callback_data in callbacks_data]
+    entries: dict[str, bytes] = {}
+    payloads: dict[str, dict] = {}
+    blobs: dict[str, dict | list] = {}
+    for index, callback_key in enumerate(callback_keys):
+        if callback_key is None:
+            callback_keys[index] = query_key = str(uuid.uuid4())
+            payloads[query_key] = callbacks_data[index]
+            entry = _extract_blobs(callbacks_data[index], blobs)
+            entries[query_key] = callback_serializer.dumps(entry)
+    if not entries:
+        return callback_keys
+
+    namespace = callback_namespace.get()
+    logger.debug(
+        f"Saving {len(entries)} callback payloads, {len(blobs)} blobs "
+        f"for namespace {namespace}"
+    )
+    evicted = await get_callback_storage().save(
+        namespace,
+        entries,
+        {digest: callback_serializer.dumps(blob) for digest, blob in blobs.items()},
+    )
+    for query_key, payload in payloads.items():
+        _l1_put((namespace, query_key), payload)
+    for query_key in evicted:
+        _l1.pop((namespace, query_key), None)
+    return callback_keys
+
+
+async def redis_callback_get(callback_key: str):
+    """
+    Resolve button callback_data into its payload.
+    Reading a stored payload slides its TTL (and that of its blobs), so
+    buttons of messages still in use outlive the ones nobody presses.
+    Payloads saved or read in the last CALLBACK_L1_TTL_SECONDS come from the
+    in-process cache without a round-trip or decoding. Such uses slide the TTL
+    with the chat's next storage call.
+    With the cache enabled, payloads are shared and read-only: changing one
+    raises ``TypeError``, ``copy.deepcopy`` gives a plain mutable copy.
+    :return: the payload, or None when it is unknown, expired or evicted
+    """
+    if is_compact_callback(callback_key):
+        return decode_callback(callback_key)
+    storage = get_callback_storage()
+    namespace = callback_namespace.get()
+    if (payload := _l1_get((namespace, callback_key))) is not None:
+        storage.touch(namespace, callback_key)
+        return payload
+    logger.debug(f"Retrieving callback data for key: {namespace}:{callback_key}")
+    serialized_data = await storage.get(namespace, callback_key)
+    if not serialized_data:
+        return None
+
+    callback_data = callback_serializer.loads(serialized_data)
+    references = {
+        field: value[BLOB_REFERENCE]
+        for field, value in callback_data.items()
+        if isinstance(value, dict) and value.keys() == {BLOB_REFERENCE}
+    }
+    if references:
+        digests = list(dict.fromkeys(references.values()))
+        blobs = dict(zip(digests, await storage.get_blobs(digests)))
+        for field, digest in references.items():
+            if (blob := blobs[digest]) is None:
+                # Payloads missing a field would be misread; treat as expired.
+                logger.warning(f"Callback blob {digest} for '{field}' has expired")
+                return None
+            callback_data[field] = callback_serializer.loads(blob)
+    return _l1_put((namespace, callback_key), callback_data)
+
+
+async def redis_callback_delete(namespace: str, callback_keys: Iterable[str]) -> None:
+    """Delete stored payloads of a chat, from the in-process cache and the storage."""
+    callback_keys = list(callback_keys)
+    for callback_key in callback_keys:
+        _l1.pop((namespace, callback_key), None)
+    await get_callback_storage().delete(namespace, callback_keys)
+
+
+async def callback_memory_report() -> dict[str, tuple[int, int]]:
+    """
+    Count live stored callback payloads and their bytes per namespace.
+    Bytes are key plus value lengths, without the storage's own overhead.
+    Shared blobs are reported under the ``blobs`` pseudo-namespace.
+    :return: namespace -> (keys, bytes)
+    """
+    return await get_callback_storage().usage()
+
+
+async def log_callback_memory_report(top: int = 10) -> None:
+    report = await callback_memory_report()
+    keys = sum(count for count, _ in report.values())
+    size = sum(size for _, size in report.values())
+    largest = sorted(report.items(), key=lambda item: item[1][1], reverse=True)[:top]
+    logger.info(
+        f"Callback store: {keys} keys, {size:,} bytes in {len(report) - 1} namespaces "
+        "and blobs; "
+        + ", ".join(
+            f"{namespace}={count} keys/{size:,} B" for namespace, (count, size) in largest
+        )
+    )
+
+
+async def start_callback_memory_reports() -> None:
+    global _memory_report_task
+    if CALLBACK_MEMORY_REPORT_INTERVAL > 0:
+        _memory_report_task = asyncio.create_task(_report_memory_periodically())
 
-    redis_client.set(query_key, serialized_data, ex=3600)
-    return query_key
 
+async def stop_callback_memory_reports() -> None:
+    if _memory_report_task is not None:
+        _memory_report_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await _memory_report_task
 
-def redis_callback_get(callback_key: str):
-    logger.debug(f"Retrieving callback data for key: {callback_key}")
-    serialized_data = redis_client.get(callback_key)
-    if serialized_data:
-        return json.loads(serialized_data)
-    return None
 
+async def _report_memory_periodically() -> None:
+    while True:
+        await asyncio.sleep(CALLBACK_MEMORY_REPORT_INTERVAL)
+        try:
+            await log_callback_memory_report()
+        except (RedisError, sqlite3.Error) as exc:
+            logger.warning(f"Callback memory report failed: {exc}")
+
+
+def _l1_get(entry_key: tuple[str, str]) -> dict | None:
+    cached = _l1.get(entry_key)
+    if cached is None:
+        return None
+    if time.monotonic() >= cached.expires_at:
+        del _l1[entry_key]
+        return None
+    _l1.move_to_end(entry_key)
+    return cached.payload
+
+
+def _l1_put(entry_key: tuple[str, str], payload: dict) -> dict:
+    """Cache a read-only copy of ``payload``; return what readers should get."""
+    if CALLBACK_L1_SIZE <= 0:
+        return payload
+    payload = _freeze(payload)
+    _l1[entry_key] = _CachedPayload(payload, time.monotonic() + CALLBACK_L1_TTL_SECONDS)
+    _l1.move_to_end(entry_key)
+    while len(_l1) > CALLBACK_L1_SIZE:
+        _l1.popitem(last=False)
+    return payload
+
+
+def _freeze(value: dict | list) -> dict | list:
+    """Read-only deep copy of a decoded payload, built once per L1 entry."""
+    if isinstance(value, dict):
+        return _ReadOnlyDict(
+            {
+                key: _freeze(item) if isinstance(item, (dict, list)) else item
+                for key, item in value.items()
+            }
+        )
+    return _ReadOnlyList(
+        [_freeze(item) if isinstance(item, (dict, list)) else item for item in value]
+    )
+
+
+def _extract_blobs(callback_data: dict, blobs: dict[str, dict | list]) -> dict:
+    """Replace large field values with references to blobs collected in ``blobs``."""
+    entry = {}
+    for field, value in callback_data.items():
+        if isinstance(value, (dict, list)):
+            serialized = json.dumps(value, sort_keys=True, separators=(",", ":"))
+            if len(serialized) >= CALLBACK_BLOB_MIN_BYTES:
+                digest = hashlib.sha256(serialized.encode()).hexdigest()[:32]
+                blobs[digest] = value
+                value = {BLOB_REFERENCE: digest}
+        entry[field] = value
+    return entry
+
+
+class ActionFilter(Filter):
+    """Matches callback queries whose stored payload has the given ``action``.
+
+    The payload is resolved once per update by ``CallbackPayloadMiddleware``
+    and injected as ``callback_payload``, so matching costs no storage lookup.
+    """
+
+    def __init__(self, action: str) -> None:
+        self.action = action
 
-def check_action(callback_data: str, action: str) -> bool:
-    callback_data = redis_callback_get(callback_data)
-    return callback_data and callback_data.get("action") == action
+    async def __call__(
+        self, callback_query: CallbackQuery, callback_payload: dict | None = None
+    ) -> bool:
+        return bool(callback_payload) and callback_payload.get("action") == self.action
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+
+from aiogram.types import InlineQueryResultArticle, InputTextMessageContent
+from pydantic import ValidationError
+from redis import RedisError
+
+from bot.config import INLINE_DEBOUNCE_SECONDS, INLINE_RESULTS_LIMIT, TITLE_INDEX_MAX_TITLES
+from models.search_provider_types import MediaItem, SearchResults
+from services.redis_services.client import redis_client
+from services.search_integrations.cached import SEARCH_CACHE_KEY_PREFIX
+from services.search_integrations.registry import get_search_provider
+from utilities.title_index import TitleIndex
+
+logger = logging.getLogger(__name__)
+
+title_index = TitleIndex(max_titles=TITLE_INDEX_MAX_TITLES)
+
+
+class InlineDebouncer:
+    """Lets only the last of a burst of queries from one user through.
+
+    Telegram sends an inline query on every keystroke; a query that is
+    followed by another one from the same user within ``delay`` seconds is
+    dropped instead of reaching the search provider.
+    """
+
+    def __init__(self, delay: float) -> None:
+        self._delay = delay
+        self._latest: dict[int, int] = {}
+        self._counter = 0
+
+    async def settle(self, user_id: int) -> bool:
+        self._counter += 1
+        ticket = self._latest[user_id] = self._counter
+        await asyncio.sleep(self._delay)
+        if self._latest.get(user_id) != ticket:
+            return False
+        del self._latest[user_id]
+        return True
+
+
+debouncer = InlineDebouncer(INLINE_DEBOUNCE_SECONDS)
+
+
+def remember_search_results(results: list[MediaItem]) -> None:
+    title_index.add(results)
+
+
+async def warm_title_index() -> None:
+    """Fill the title index from search results kept in the metadata cache."""
+    try:
+        async for key in redis_client.scan_iter(
+            match=f"{SEARCH_CACHE_KEY_PREFIX}*:search:*", count=500
+        ):
+            if not (raw := await redis_client.get(key)):
+                continue
+            try:
+                cached = SearchResults.model_validate(json.loads(raw)["value"])
+            except (KeyError, TypeError, ValueError, ValidationError):
+                continue
+            title_index.add(cached.results)
+    except RedisError as exc:
+        logger.warning("Failed to warm the title index: %s", exc)
+    logger.info("Title index warmed with %d titles", len(title_index))
+
+
+async def inline_search(query: str, user_id: int) -> list[MediaItem] | None:
+    """Answer from the title index; ask the provider only on a settled miss.
+
+    Returns ``None`` when the query was superseded by a newer one.
+    """
+    if hits := title_index.search(query, INLINE_RESULTS_LIMIT):
+        return hits
+    if not await debouncer.settle(user_id):
+        return None
+
+    response = await get_search_provider().search(query)
+    remember_search_results(response.results)
+    return response.results[:INLINE_RESULTS_LIMIT]
+
+
+def build_inline_results(items: list[MediaItem]) -> list[InlineQueryResultArticle]:
+    results = []
+    for item in items:
+        media_type_label = "Сериал" if item.is_series else "Фильм"
+        description = f"{media_type_label}, {item.year}" if item.year else media_type_label
+        if item.original_title and item.original_title != item.title:
+            description = f"{item.original_title} · {description}"
+        results.append(
+            InlineQueryResultArticle(
+                id=item.provider_id,
+                title=item.title,
+                description=description,
+                thumbnail_url=item.poster_url,
+                # The message reaches the bot as a regular search query.
+                input_message_content=InputTextMessageContent(message_text=item.title),
+            )
+        )
+    return results
+
+
+__all__ = [
+    "InlineDebouncer",
+    "build_inline_results",
+    "inline_search",
+    "remember_search_results",
+    "title_index",
+    "warm_title_index",
+]
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 
+from aiogram.exceptions import TelegramAPIError
 from aiogram.types import (
     CallbackQuery,
     InlineKeyboardButton,
@@ -19,7 +20,9 @@ from models.movie_detail_service_types import MovieSearchResult
 from models.search_provider_types import MediaDetails, MediaItem
 from services.exceptions import KinopoiskApiError, NoResultsFoundError, TmdbApiError
 from services.search_integrations.registry import get_search_provider
-from utilities.handlers_utils import redis_callback_get, redis_callback_save
+from utilities.handlers_utils import redis_callback_get, redis_callback_save_many
+from utilities.inline_search_utils import remember_search_results
+from utilities.poster_utils import send_poster_cards
 from utilities.torrent_search_utils import format_torrent_search_results
 
 logger = logging.getLogger(__name__)
@@ -28,21 +31,26 @@ logger = logging.getLogger(__name__)
 async def show_media_results(
     query: str,
     message: Message,
+    *,
+    with_posters: bool = False,
 ) -> None:
     logger.info("Searching for query '%s'", query)
     search_provider = get_search_provider()
     search_response = await search_provider.search(query)
     movies = search_response.results
+    remember_search_results(movies)
     if not movies:
         raise NoResultsFoundError(f"Search returned no results for '{query}'.")
 
-    buttons: list[list[InlineKeyboardButton]] = []
+    captions: list[str] = []
+    payloads: list[dict] = []
+    posters: dict[str, str] = {}
     for movie in movies[:10]:
         if not movie.title:
             continue
         requested_item = movie.title or movie.original_title
         requested_type = "series" if movie.is_series else "movie"
-        callback_key = redis_callback_save(
+        payloads.append(
             {
                 "action": MEDIA_SELECT_CALLBACK,
                 "query": query,
@@ -60,13 +68,30 @@ async def show_media_results(
             if movie.year
             else movie.title
         )
-        buttons.append([InlineKeyboardButton(text=caption, callback_data=callback_key)])
+        captions.append(caption)
+        if movie.poster_url:
+            posters.setdefault(movie.poster_url, caption)
 
+    buttons = [
+        [InlineKeyboardButton(text=caption, callback_data=callback_key)]
+        for caption, callback_key in zip(
+            captions, await redis_callback_save_many(payloads)
+        )
+    ]
     keyboard = InlineKeyboardMarkup(inline_keyboard=buttons)
-    await message.edit_text(
-        f"Результаты поиска для «{query}». Выберите подходящий вариант:",
-        reply_markup=keyboard,
-    )
+    text = f"Результаты поиска для «{query}». Выберите подходящий вариант:"
+    # Posters go first so the album does not push the keyboard up; the
+    # keyboard then replaces the status message at the bottom of the chat.
+    if with_posters and posters and await send_poster_cards(
+        message.bot, message.chat.id, posters
+    ):
+        await message.answer(text, reply_markup=keyboard)
+        try:
+            await message.delete()
+        except TelegramAPIError as exc:
+            logger.debug("Failed to delete search status message: %s", exc)
+        return
+    await message.edit_text(text, reply_markup=keyboard)
 
 
 async def show_season_choices(
@@ -77,19 +102,21 @@ async def show_season_choices(
     requested_item: str | None,
     requested_type: str,
 ) -> None:
-    buttons: list[list[InlineKeyboardButton]] = []
     movie_dump = movie_details.model_dump(mode="json", by_alias=True, exclude_none=True)
     search_context = original_query or requested_item or movie_details.title
 
     season_year_map = {s.season_number: s.year for s in movie_details.seasons}
 
+    labels: list[str] = []
+    payloads: list[dict] = []
     for season in seasons:
         season_year = season_year_map.get(season)
         button_label = f"Сезон {season}"
         if season_year:
             button_label += f" ({season_year})"
 
-        callback_key = redis_callback_save(
+        labels.append(button_label)
+        payloads.append(
             {
                 "action": SEASON_SELECT_CALLBACK,
                 "season": season,
@@ -102,16 +129,18 @@ async def show_season_choices(
                 "requested_type": requested_type,
             }
         )
-        buttons.append(
-            [InlineKeyboardButton(text=button_label, callback_data=callback_key)]
-        )
-
-    back_callback = redis_callback_save(
+    payloads.append(
         {
             "action": MEDIA_LIST_CALLBACK,
             "query": search_context,
         }
     )
+    *season_keys, back_callback = await redis_callback_save_many(payloads)
+
+    buttons: list[list[InlineKeyboardButton]] = [
+        [InlineKeyboardButton(text=button_label, callback_data=callback_key)]
+        for button_label, callback_key in zip(labels, season_keys)
+    ]
     buttons.append(
         [
             InlineKeyboardButton(
@@ -165,10 +194,12 @@ async def get_details_from_callback(
                     )
         return None
 
-    # Always try to fetch fresh details first to get season info.
+    # Details come from the provider cache, which refreshes stale entries.
     try:
         search_provider = get_search_provider()
-        return await search_provider.get_details(movie_id)
+        return await search_provider.get_details(
+            movie_id, is_series=_is_series_hint(callback_data)
+        )
     except (KinopoiskApiError, TmdbApiError) as exc:
         logger.warning(
             "Failed to fetch details for id %s: %s. Falling back to cached data.",
@@ -188,11 +219,20 @@ async def get_details_from_callback(
     return None
 
 
+def _is_series_hint(callback_data: dict) -> bool | None:
+    movie_payload = callback_data.get("movie") or {}
+    if "is_series" in movie_payload:
+        return bool(movie_payload["is_series"])
+    requested_type = callback_data.get("requested_type")
+    return requested_type == "series" if requested_type else None
+
+
 async def show_cached_torrent_results(
     message: Message,
     cache_key: str,
+    page: int = 0,
 ) -> bool:
-    cached_data = redis_callback_get(cache_key)
+    cached_data = await redis_callback_get(cache_key)
     if not cached_data:
         return False
 
@@ -200,14 +240,17 @@ async def show_cached_torrent_results(
     requested_item = cached_data.get("requested_item")
     back_callback_key = cached_data.get("back_callback_key")
     back_button_text = cached_data.get("back_button_text")
+    tmdb_info = cached_data.get("tmdb_info")
 
     try:
         results = [MovieSearchResult.model_validate(r) for r in results_json]
-        keyboard = format_torrent_search_results(
+        keyboard = await format_torrent_search_results(
             results,
             cache_key,
+            page=page,
             back_callback_key=back_callback_key,
             back_button_text=back_button_text,
+            tmdb_info=tmdb_info,
         )
 
         message_text = "Выберите результат"
@@ -4,7 +4,11 @@ import re
 from difflib import SequenceMatcher
 
 from models.search_provider_types import MediaDetails
-from models.movie_detail_service_types import VideoQuality
+from utilities.title_features import (
+    SeasonVerdict,
+    classify_season,
+    extract_title_features,
+)
 
 MAX_QUERY_LENGTH = 64
 
@@ -135,11 +139,7 @@ def clean_title_for_query(title: str) -> str:
 
 
 def parse_video_quality(name: str) -> str | None:
-    name_lower = name.lower()
-    for quality in VideoQuality:
-        if any(k in name_lower for k in quality.keywords):
-            return quality
-    return None
+    return extract_title_features(name).quality
 
 
 def calculate_similarity(s1: str, s2: str) -> float:
@@ -147,25 +147,11 @@ def calculate_similarity(s1: str, s2: str) -> float:
 
 
 def extract_season_number(title: str) -> int | None:
-    title_lower = title.lower()
-
-    # Patterns: "season X", "сезон X", "X сезон", "sX"
-    patterns = [
-        r"(?:season|сезон)\s*(\d+)",
-        r"(\d+)\s*сезон",
-        r"\bs(\d+)",
-    ]
-
-    for pattern in patterns:
-        if match := re.search(pattern, title_lower):
-            return int(match.group(1))
-
-    return None
+    return extract_title_features(title).season
 
 
 def is_season_match(title: str, target_season: int) -> bool:
-    extracted = extract_season_number(title)
-    return extracted == target_season if extracted is not None else False
+    return classify_season(title, target_season) == SeasonVerdict.MATCH
 
 
 __all__ = [
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from itertools import islice
+
+import httpx
+from aiogram import Bot
+from aiogram.exceptions import TelegramAPIError, TelegramBadRequest
+from aiogram.types import BufferedInputFile, InputMediaPhoto, Message
+
+from bot.config import POSTER_CARDS_LIMIT, POSTER_DOWNLOAD_CONCURRENCY, POSTER_MAX_BYTES
+from services.redis_services.poster_cache import (
+    forget_poster_file_ids,
+    get_poster_file_ids,
+    save_poster_file_ids,
+)
+from services.search_integrations.http_client import PooledHttpClient
+
+logger = logging.getLogger(__name__)
+
+_http = PooledHttpClient("posters")
+_downloads = asyncio.Semaphore(POSTER_DOWNLOAD_CONCURRENCY)
+
+
+async def download_poster(poster_url: str) -> bytes | None:
+    """Download one poster, at most ``POSTER_DOWNLOAD_CONCURRENCY`` at a time.
+
+    The body is streamed and the download is abandoned as soon as it grows
+    past ``POSTER_MAX_BYTES``.
+    """
+    chunks: list[bytes] = []
+    size = 0
+    async with _downloads:
+        try:
+            async with _http.client.stream(
+                "GET", poster_url, follow_redirects=True
+            ) as response:
+                response.raise_for_status()
+                content_length = response.headers.get("content-length", "")
+                if content_length.isdigit() and int(content_length) > POSTER_MAX_BYTES:
+                    logger.debug("Skipping oversized poster %s", poster_url)
+                    return None
+                async for chunk in response.aiter_bytes():
+                    size += len(chunk)
+                    if size > POSTER_MAX_BYTES:
+                        logger.debug("Skipping oversized poster %s", poster_url)
+                        return None
+                    chunks.append(chunk)
+        except httpx.HTTPError as exc:
+            logger.warning("Failed to download poster %s: %s", poster_url, exc)
+            return None
+    return b"".join(chunks)
+
+
+async def send_poster_cards(bot: Bot, chat_id: int, posters: dict[str, str]) -> bool:
+    """Send posters with their captions as one album.
+
+    ``posters`` maps poster URLs to captions. Posters Telegram already has are
+    sent by ``file_id`` without any transfer; only the others are downloaded
+    and uploaded, and the ``file_id`` Telegram assigns them is remembered.
+    Returns whether the album was sent.
+    """
+    posters = dict(islice(posters.items(), POSTER_CARDS_LIMIT))
+    poster_urls = list(posters)
+    cached = dict(zip(poster_urls, await get_poster_file_ids(poster_urls)))
+    missing = [url for url in poster_urls if not cached[url]]
+    downloaded = dict(
+        zip(missing, await asyncio.gather(*(download_poster(url) for url in missing)))
+    )
+
+    media: list[InputMediaPhoto] = []
+    sent_urls: list[str] = []
+    for poster_url, caption in posters.items():
+        if file_id := cached[poster_url]:
+            photo = file_id
+        elif content := downloaded.get(poster_url):
+            photo = BufferedInputFile(content, filename="poster.jpg")
+        else:
+            continue
+        media.append(InputMediaPhoto(media=photo, caption=caption))
+        sent_urls.append(poster_url)
+    if not media:
+        return False
+
+    try:
+        messages: list[Message]
+        if len(media) == 1:
+            # Albums need at least two items.
+            messages = [
+                await bot.send_photo(chat_id, media[0].media, caption=media[0].caption)
+            ]
+        else:
+            messages = await bot.send_media_group(chat_id, media)
+    except TelegramBadRequest as exc:
+        # A stored file_id can be rejected (e.g. after the bot token changed);
+        # drop them so the posters are uploaded again next time.
+        logger.warning("Failed to send poster cards: %s", exc)
+        await forget_poster_file_ids([url for url in sent_urls if cached[url]])
+        return False
+    except TelegramAPIError as exc:
+        logger.warning("Failed to send poster cards: %s", exc)
+        return False
+
+    await save_poster_file_ids(
+        {
+            poster_url: message.photo[-1].file_id
+            for poster_url, message in zip(sent_urls, messages)
+            if not cached[poster_url] and message.photo
+        }
+    )
+    return True
+
+
+async def close_poster_downloads() -> None:
+    await _http.aclose()
+
+
+__all__ = ["close_poster_downloads", "download_poster", "send_poster_cards"]
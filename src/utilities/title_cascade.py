@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import logging
+import re
+from dataclasses import dataclass, field
+from enum import StrEnum
+
+from bot import config
+from utilities.title_features import (
+    SeasonVerdict,
+    TitleFeatures,
+    classify_season,
+    extract_title_features,
+)
+from utilities.title_matcher import TitleMatcher
+
+logger = logging.getLogger(__name__)
+
+# Only unambiguous audio, book and software markers reject locally; words like
+# "soft" (Soft Subs) or "repack" also appear in video releases and are left
+# to the LLM.
+_NON_VIDEO_RE = re.compile(
+    r"\b(?:ost|soundtrack|саундтрек|mp3|flac|аудиокнига|audiobook|software)\b"
+)
+
+# Highest score of a title not containing a whole expected title, kept below
+# GROQ_CASCADE_ACCEPT_SCORE so that fuzzy matches are never accepted locally.
+FUZZY_SCORE_CAP = 0.8
+YEAR_MATCH_BONUS = 0.2
+YEAR_MISMATCH_PENALTY = 0.4
+TYPE_MISMATCH_PENALTY = 0.3
+
+
+class CascadeDecision(StrEnum):
+    ACCEPT = "accept"
+    REJECT = "reject"
+    UNSURE = "unsure"
+
+
+@dataclass(slots=True)
+class CascadeStats:
+    accepted: int = 0
+    rejected: int = 0
+    unsure: int = 0
+
+    @property
+    def llm_calls_avoided(self) -> int:
+        return self.accepted + self.rejected
+
+
+@dataclass(slots=True)
+class TitleCascade:
+    """Scores torrent titles with local signals before asking the LLM.
+
+    Titles scoring at least ``accept_score`` are accepted locally, titles at
+    or below ``reject_score`` are rejected locally and only the band in
+    between is left for the LLM. One instance is built per search.
+    """
+
+    expected_titles: list[str]
+    requested_type: str | None = None
+    year: int | None = None
+    season_number: int | None = None
+    accept_score: float = config.GROQ_CASCADE_ACCEPT_SCORE
+    reject_score: float = config.GROQ_CASCADE_REJECT_SCORE
+    stats: CascadeStats = field(default_factory=CascadeStats)
+    _matcher: TitleMatcher = field(init=False)
+
+    def __post_init__(self) -> None:
+        self._matcher = TitleMatcher(self.expected_titles)
+
+    def decide(self, title: str) -> CascadeDecision:
+        score = self.score(title)
+        if score >= self.accept_score:
+            decision = CascadeDecision.ACCEPT
+            self.stats.accepted += 1
+        elif score <= self.reject_score:
+            decision = CascadeDecision.REJECT
+            self.stats.rejected += 1
+        else:
+            decision = CascadeDecision.UNSURE
+            self.stats.unsure += 1
+        logger.debug("Cascade %s (%.2f) for title %s", decision, score, title)
+        return decision
+
+    def score(self, title: str) -> float:
+        features = extract_title_features(title)
+        if self._has_non_video_keyword(features):
+            return 0.0
+
+        season_verdict = None
+        if self.season_number is not None:
+            season_verdict = classify_season(title, self.season_number)
+            if season_verdict == SeasonVerdict.MISMATCH:
+                return 0.0
+
+        whole_title = bool(self._matcher) and self._matcher.contains_whole_title(title)
+        if not self._matcher:
+            score = 0.5
+        elif whole_title:
+            score = 1.0
+        else:
+            score = self._matcher.score(title)
+
+        if self.year and features.year:
+            if abs(features.year - self.year) <= 1:
+                score += YEAR_MATCH_BONUS
+            else:
+                score -= YEAR_MISMATCH_PENALTY
+
+        has_season_info = (
+            features.season is not None
+            or features.season_range is not None
+            or features.is_complete_series
+        )
+        if self.requested_type == "movie" and has_season_info:
+            score -= TYPE_MISMATCH_PENALTY
+        if self.requested_type == "series" and season_verdict == SeasonVerdict.UNSURE:
+            score -= TYPE_MISMATCH_PENALTY
+
+        if not whole_title:
+            # Partial containment or fuzzy similarity is never conclusive,
+            # whatever the bonuses.
+            score = min(score, FUZZY_SCORE_CAP)
+        return score
+
+    def _has_non_video_keyword(self, features: TitleFeatures) -> bool:
+        # Words from the expected titles do not count: "Игра престолов" is a series.
+        title_words = self._matcher.words
+        return any(
+            match.group(0) not in title_words
+            for match in _NON_VIDEO_RE.finditer(features.normalized)
+        )
+
+
+def local_verdict(title: str) -> dict:
+    """Build a verdict for a locally accepted title from its parsed features."""
+    features = extract_title_features(title)
+    original_language = next(
+        (language for language in features.languages if language != "RUS"), "ORIG"
+    )
+    audio_language = []
+    for code in features.translations:
+        if code == "ORG":
+            audio_language.append({"language": original_language, "quality": "Original"})
+        else:
+            audio_language.append({"language": "RUS", "quality": code})
+    return {
+        "is_valid": True,
+        "video_quality": features.quality,
+        "audio_quality": None,
+        "audio_language": audio_language,
+        "search_name": title,
+    }
+
+
+__all__ = [
+    "FUZZY_SCORE_CAP",
+    "CascadeDecision",
+    "CascadeStats",
+    "TitleCascade",
+    "local_verdict",
+]
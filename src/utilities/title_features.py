@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from enum import StrEnum
+from functools import lru_cache
+
+from models.movie_detail_service_types import VideoQuality
+
+TITLE_FEATURES_CACHE_SIZE = 8192
+
+_NON_WORD_RE = re.compile(r"[\W_]+")
+_NUMBER_RE = re.compile(r"\d+")
+
+# One alternation for every feature we extract from a release title. The order
+# of the branches matters: at a given position the more specific ones win.
+_TOKEN_RE = re.compile(
+    r"""
+    (?P<complete_series>\b(?:complete\s+series|full\s+series|all\s+seasons|все\s+сезоны|полный\s+сериал)\b)
+    | (?P<sxe>\bs(?P<sxe_season>\d{1,2})\s*e(?P<sxe_from>\d{1,3})(?:\s*-\s*e?(?P<sxe_to>\d{1,3}))?)
+    | (?P<s_range>\bs(?P<s_range_from>\d{1,2})\s*(?:[-–—]|to)\s*s?(?P<s_range_to>\d{1,2})\b)
+    | (?P<s_list>\bs\d{1,2}(?:\s*,\s*s\d{1,2})+\b)
+    | (?P<season_of>(?<!\d)(?P<so_from>\d{1,2})(?:\s*[-–—]\s*(?P<so_to>\d{1,2}))?\s*из\s*(?P<so_total>\d{1,2})\s*(?:сезон|season))
+    | (?P<season_word_of>(?:seasons?|сезоны?)\s*:?\s*(?P<swo_from>\d{1,2})(?:\s*[-–—]\s*(?P<swo_to>\d{1,2}))?\s*(?:из|of)\s*(?P<swo_total>\d{1,2})(?!\d))
+    | (?P<num_range_season>(?<!\d)(?:с\s*)?(?P<nrs_from>\d{1,2})\s*(?:[-–—]|по|to)\s*(?P<nrs_to>\d{1,2})\s*(?:сезон|season))
+    | (?P<season_word_range>(?:seasons?|сезоны?)\s*:?\s*(?:с\s*)?(?P<swr_from>\d{1,2})\s*(?:[-–—]|по|to)\s*(?P<swr_to>\d{1,2})(?!\d))
+    | (?P<season_word_list>(?:seasons?|сезоны?)\s*:?\s*\d{1,2}(?:\s*,\s*\d{1,2}(?!\d|\s*[-–—]|\s*(?:сери|эпизод|episode)))+)
+    | (?P<number_list_season>(?<!\d)\d{1,2}(?:\s*,\s*\d{1,2})+\s*(?:сезон|season))
+    | (?P<episode_range>(?<!\d)(?P<er_from>\d{1,3})\s*[-–—]\s*(?P<er_to>\d{1,3})\s*(?:сери|эпизод|episode))
+    | (?P<episode_word>(?:серии|серия|эпизоды?|episodes?)\s*(?P<ew_from>\d{1,3})(?:\s*[-–—]\s*(?P<ew_to>\d{1,3}))?)
+    | (?P<season_word>(?:season|сезон)\s*:?\s*(?P<sw_number>\d+))
+    | (?P<number_season>(?P<ns_number>\d+)\s*сезон)
+    | (?P<s_number>\bs(?P<sn_number>\d+))
+    | (?P<year>(?<!\d)(?:19|20)\d{2}(?!\d))
+    | (?P<codec>\b(?:x\.?26[45]|h\.?26[45]|hevc|avc|xvid|divx|av1)\b)
+    | (?P<translation>\b(?:дубляж|дб|dub|пм|лм|mvo|многоголос\w*|пд|лд|dvo|двухголос\w*
+        |ло|vo|одноголос\w*|ап|avo|авторск\w*|оригинал\w*|original|org|ст|subs?|субтитры)\b)
+    | (?P<language>\b(?:rus|eng|ukr)\b)
+    | (?P<quality>2160p|4k|uhd|1080p|fhd|1080i|720p|hd)
+    """,
+    re.VERBOSE,
+)
+
+# Lower rank wins when several season notations are present, mirroring the
+# precedence of the original season regexes.
+_SEASON_RANKS = {
+    "season_word": 0,
+    "season_word_of": 0,
+    "number_season": 1,
+    "season_of": 1,
+    "num_range_season": 1,
+    "season_word_range": 1,
+    "season_word_list": 1,
+    "number_list_season": 1,
+    "s_number": 2,
+    "s_range": 2,
+    "s_list": 2,
+    "sxe": 2,
+}
+
+_QUALITY_BY_KEYWORD = {
+    keyword: quality for quality in VideoQuality for keyword in quality.keywords
+}
+_QUALITY_RANKS = {quality: rank for rank, quality in enumerate(VideoQuality)}
+
+_TRANSLATION_CODES = {
+    "дубляж": "DUB",
+    "дб": "DUB",
+    "dub": "DUB",
+    "пм": "MVO",
+    "лм": "MVO",
+    "mvo": "MVO",
+    "многоголос": "MVO",
+    "пд": "DVO",
+    "лд": "DVO",
+    "dvo": "DVO",
+    "двухголос": "DVO",
+    "ло": "VO",
+    "vo": "VO",
+    "одноголос": "VO",
+    "ап": "AUTHOR",
+    "avo": "AUTHOR",
+    "авторск": "AUTHOR",
+    "оригинал": "ORG",
+    "original": "ORG",
+    "org": "ORG",
+    "ст": "SUB",
+    "sub": "SUB",
+    "subs": "SUB",
+    "субтитры": "SUB",
+}
+_TRANSLATION_STEMS = ("многоголос", "двухголос", "одноголос", "авторск", "оригинал")
+
+
+def normalize_title(title: str) -> str:
+    """Case-fold, map ``ё`` to ``е`` and collapse punctuation into single spaces."""
+    folded = title.casefold().replace("ё", "е")
+    return _NON_WORD_RE.sub(" ", folded).strip()
+
+
+class SeasonVerdict(StrEnum):
+    MATCH = "match"
+    MISMATCH = "mismatch"
+    UNSURE = "unsure"
+
+
+@dataclass(frozen=True, slots=True)
+class TitleFeatures:
+    normalized: str
+    quality: VideoQuality | None = None
+    season: int | None = None
+    season_range: tuple[int, int] | None = None
+    season_total: int | None = None
+    is_complete_series: bool = False
+    episode_range: tuple[int, int] | None = None
+    year: int | None = None
+    codec: str | None = None
+    translations: tuple[str, ...] = ()
+    languages: tuple[str, ...] = ()
+
+
+@lru_cache(maxsize=TITLE_FEATURES_CACHE_SIZE)
+def extract_title_features(title: str) -> TitleFeatures:
+    """Extract release features from a raw title in a single regex pass.
+
+    Results are memoized on the raw title since the same releases come back
+    across searches; the returned object is immutable and safe to share.
+    """
+    text = title.casefold().replace("ё", "е")
+
+    quality: VideoQuality | None = None
+    season: int | None = None
+    season_rank = len(_SEASON_RANKS)
+    season_range: tuple[int, int] | None = None
+    season_total: int | None = None
+    is_complete_series = False
+    episode_range: tuple[int, int] | None = None
+    year: int | None = None
+    codec: str | None = None
+    translations: list[str] = []
+    languages: list[str] = []
+
+    for match in _TOKEN_RE.finditer(text):
+        kind = match.lastgroup
+        value = match.group(kind)
+
+        if kind == "complete_series":
+            is_complete_series = True
+        elif kind in _SEASON_RANKS:
+            start, end = _season_bounds(match, kind)
+            if kind in ("season_of", "season_word_of") and season_total is None:
+                season_total = int(match.group("so_total" if kind == "season_of" else "swo_total"))
+            if start != end and season_range is None:
+                season_range = (start, end)
+            if _SEASON_RANKS[kind] < season_rank:
+                season, season_rank = start, _SEASON_RANKS[kind]
+            if kind == "sxe" and episode_range is None:
+                episode_range = _int_range(match.group("sxe_from"), match.group("sxe_to"))
+        elif kind == "episode_range" and episode_range is None:
+            episode_range = _int_range(match.group("er_from"), match.group("er_to"))
+        elif kind == "episode_word" and episode_range is None:
+            episode_range = _int_range(match.group("ew_from"), match.group("ew_to"))
+        elif kind == "year" and year is None:
+            year = int(value)
+        elif kind == "codec" and codec is None:
+            codec = value.replace(".", "")
+        elif kind == "translation":
+            code = _translation_code(value)
+            if code not in translations:
+                translations.append(code)
+        elif kind == "language":
+            if (language := value.upper()) not in languages:
+                languages.append(language)
+        elif kind == "quality":
+            candidate = _QUALITY_BY_KEYWORD[value]
+            if quality is None or _QUALITY_RANKS[candidate] < _QUALITY_RANKS[quality]:
+                quality = candidate
+
+    return TitleFeatures(
+        normalized=_NON_WORD_RE.sub(" ", text).strip(),
+        quality=quality,
+        season=season,
+        season_range=season_range,
+        season_total=season_total,
+        is_complete_series=is_complete_series,
+        episode_range=episode_range,
+        year=year,
+        codec=codec,
+        translations=tuple(translations),
+        languages=tuple(languages),
+    )
+
+
+def classify_season(title: str, target_season: int) -> SeasonVerdict:
+    """Decide locally whether ``title`` is exactly ``target_season``.
+
+    Multi-season packs ("1-6 сезоны", "S01-S03", "1-6 из 6 сезонов",
+    "Сезон 1, 2", "S01, S02", "Complete series") never match a single season.
+    ``UNSURE`` means the title carries no season information the parser
+    understands.
+    """
+    features = extract_title_features(title)
+    if features.is_complete_series or features.season_range:
+        return SeasonVerdict.MISMATCH
+    if features.season is None:
+        return SeasonVerdict.UNSURE
+    if features.season == target_season:
+        return SeasonVerdict.MATCH
+    return SeasonVerdict.MISMATCH
+
+
+def _season_bounds(token: re.Match[str], kind: str) -> tuple[int, int]:
+    match kind:
+        case "sxe":
+            number = int(token.group("sxe_season"))
+            return number, number
+        case "s_range":
+            return int(token.group("s_range_from")), int(token.group("s_range_to"))
+        case "num_range_season":
+            return int(token.group("nrs_from")), int(token.group("nrs_to"))
+        case "season_word_range":
+            return int(token.group("swr_from")), int(token.group("swr_to"))
+        case "season_of":
+            return _int_range(token.group("so_from"), token.group("so_to"))
+        case "season_word_of":
+            return _int_range(token.group("swo_from"), token.group("swo_to"))
+        case "s_list" | "season_word_list" | "number_list_season":
+            # A listed pack ("сезон 1, 2", "S01, S03") spans its lowest to highest season.
+            numbers = [int(number) for number in _NUMBER_RE.findall(token.group(kind))]
+            return min(numbers), max(numbers)
+        case "season_word":
+            number = int(token.group("sw_number"))
+        case "number_season":
+            number = int(token.group("ns_number"))
+        case _:
+            number = int(token.group("sn_number"))
+    return number, number
+
+
+def _int_range(start: str, end: str | None) -> tuple[int, int]:
+    return int(start), int(end) if end else int(start)
+
+
+def _translation_code(token: str) -> str:
+    for stem in _TRANSLATION_STEMS:
+        if token.startswith(stem):
+            return _TRANSLATION_CODES[stem]
+    return _TRANSLATION_CODES[token]
+
+
+__all__ = [
+    "SeasonVerdict",
+    "TITLE_FEATURES_CACHE_SIZE",
+    "TitleFeatures",
+    "classify_season",
+    "extract_title_features",
+    "normalize_title",
+]
@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import heapq
+import logging
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass
+from itertools import islice
+
+from models.search_provider_types import MediaItem, Provider
+from utilities.title_features import normalize_title
+from utilities.title_matcher import title_trigrams
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_TITLES = 100_000
+# How many distinct words one prefix may expand to; keeps one-letter queries cheap.
+PREFIX_EXPANSION_LIMIT = 32
+# Matches are collected newest first and ranked once this many are found or
+# this many titles have been checked.
+PREFIX_CANDIDATE_LIMIT = 64
+PREFIX_SCAN_LIMIT = 256
+# Trigrams shared by more than this share of a large index carry no signal
+# and are skipped.
+COMMON_TRIGRAM_RATIO = 0.05
+COMMON_TRIGRAM_MIN_POSTINGS = 100
+# Upper bound of postings counted for one trigram lookup.
+TRIGRAM_POSTINGS_BUDGET = 5_000
+MIN_TRIGRAM_COVERAGE = 0.5
+
+
+@dataclass(frozen=True, slots=True)
+class _IndexedTitle:
+    provider_id: str
+    provider: Provider
+    title: str
+    original_title: str | None
+    year: int | None
+    poster_url: str | None
+    is_series: bool
+    normalized: str
+    padded: str
+    trigram_count: int
+
+    def to_media_item(self) -> MediaItem:
+        return MediaItem.model_construct(
+            provider_id=self.provider_id,
+            provider=self.provider,
+            title=self.title,
+            original_title=self.original_title,
+            year=self.year,
+            poster_url=self.poster_url,
+            is_series=self.is_series,
+        )
+
+
+class TitleIndex:
+    """In-memory prefix and trigram index over titles seen in past searches.
+
+    Every word of the localized and original title is indexed, so the query
+    "dune par" finds "Дюна: Часть вторая / Dune: Part Two". Query words are
+    matched as whole words except the last one, which is still being typed
+    and is matched as a prefix against a sorted word list; the newest titles
+    matching all of them are ranked. When that finds nothing (typos,
+    transliteration), titles are ranked by trigram similarity instead.
+    Postings are compact integer arrays. When the index outgrows
+    ``max_titles`` it is rebuilt from the newest three quarters.
+    """
+
+    def __init__(self, max_titles: int = DEFAULT_MAX_TITLES) -> None:
+        self._max_titles = max_titles
+        self._clear()
+
+    def __len__(self) -> int:
+        return len(self._slot_by_id)
+
+    def add(self, items: list[MediaItem]) -> None:
+        for item in items:
+            self._add(item)
+        if not self._words_sorted:
+            # Mostly sorted already, so this is close to linear.
+            self._words.sort()
+            self._words_sorted = True
+        if len(self._entries) > self._max_titles:
+            newest = self._entries[-(self._max_titles * 3 // 4) :]
+            logger.debug("Title index is full, keeping newest %d titles", len(newest))
+            self._clear()
+            self.add([entry.to_media_item() for entry in newest])
+
+    def search(self, query: str, limit: int = 10) -> list[MediaItem]:
+        normalized = normalize_title(query)
+        if not normalized:
+            return []
+
+        if slots := self._prefix_candidates(normalized.split()):
+            best = heapq.nsmallest(
+                limit, slots, key=lambda slot: self._rank(slot, normalized)
+            )
+        else:
+            best = self._similar(normalized, limit)
+        return [self._entries[slot].to_media_item() for slot in best]
+
+    def _clear(self) -> None:
+        self._entries: list[_IndexedTitle] = []
+        self._slot_by_id: dict[str, int] = {}
+        self._words: list[str] = []
+        self._words_sorted = True
+        self._word_slots: dict[str, array] = {}
+        self._trigram_slots: dict[str, array] = {}
+
+    def _add(self, item: MediaItem) -> None:
+        if item.provider_id in self._slot_by_id:
+            return
+        normalized = normalize_title(f"{item.title} {item.original_title or ''}")
+        words = tuple(dict.fromkeys(normalized.split()))
+        trigrams = title_trigrams(normalized)
+        slot = len(self._entries)
+        self._entries.append(
+            _IndexedTitle(
+                item.provider_id,
+                item.provider,
+                item.title,
+                item.original_title,
+                item.year,
+                item.poster_url,
+                item.is_series,
+                normalized,
+                f" {normalized} ",
+                len(trigrams),
+            )
+        )
+        self._slot_by_id[item.provider_id] = slot
+
+        for word in words:
+            if (postings := self._word_slots.get(word)) is None:
+                postings = self._word_slots[word] = array("I")
+                self._words.append(word)
+                self._words_sorted = False
+            postings.append(slot)
+        for trigram in trigrams:
+            if (postings := self._trigram_slots.get(trigram)) is None:
+                postings = self._trigram_slots[trigram] = array("I")
+            postings.append(slot)
+
+    def _prefix_candidates(self, tokens: list[str]) -> list[int]:
+        *words, prefix = tokens
+        expansions = [[self._word_slots.get(word, array("I"))] for word in words]
+        expansions.append(self._expand(prefix))
+        needles = [f" {word} " for word in words] + [f" {prefix}"]
+
+        # Walk the rarest token's postings and check the others per title.
+        sizes = [sum(map(len, postings)) for postings in expansions]
+        if not all(sizes):
+            return []
+        driver = sizes.index(min(sizes))
+        postings = expansions[driver]
+        if len(tokens) == 1:
+            # Every posting matches a lone prefix; only the newest ones are needed.
+            tails = {slot for p in postings for slot in p[-PREFIX_CANDIDATE_LIMIT:]}
+            return heapq.nlargest(PREFIX_CANDIDATE_LIMIT, tails)
+        if len(postings) == 1:
+            slots = reversed(postings[0])
+        else:
+            tails = (reversed(p[-PREFIX_SCAN_LIMIT:]) for p in postings)
+            slots = heapq.merge(*tails, reverse=True)
+
+        entries = self._entries
+        others = needles[:driver] + needles[driver + 1 :]
+        candidates: list[int] = []
+        previous = -1
+        for slot in islice(slots, PREFIX_SCAN_LIMIT):
+            # Merged postings of several prefix words may repeat a title.
+            if slot == previous:
+                continue
+            previous = slot
+            padded = entries[slot].padded
+            if all(needle in padded for needle in others):
+                candidates.append(slot)
+                if len(candidates) == PREFIX_CANDIDATE_LIMIT:
+                    break
+        return candidates
+
+    def _expand(self, token: str) -> list[array]:
+        """Postings of the words starting with ``token``."""
+        position = bisect_left(self._words, token)
+        postings = []
+        for word in self._words[position : position + PREFIX_EXPANSION_LIMIT]:
+            if not word.startswith(token):
+                break
+            postings.append(self._word_slots[word])
+        return postings
+
+    def _similar(self, normalized: str, limit: int) -> list[int]:
+        query_trigrams = title_trigrams(normalized)
+        common = max(
+            COMMON_TRIGRAM_MIN_POSTINGS, int(len(self._entries) * COMMON_TRIGRAM_RATIO)
+        )
+        postings = sorted(
+            (
+                slots
+                for trigram in query_trigrams
+                if (slots := self._trigram_slots.get(trigram)) is not None
+                and len(slots) <= common
+            ),
+            key=len,
+        )
+        shared: Counter[int] = Counter()
+        budget = TRIGRAM_POSTINGS_BUDGET
+        for slots in postings:
+            if len(slots) > budget:
+                break
+            budget -= len(slots)
+            shared.update(slots)
+
+        # Share of the query found in the title, ties broken by overall similarity.
+        scored = []
+        for slot, count in shared.items():
+            coverage = count / len(query_trigrams)
+            if coverage >= MIN_TRIGRAM_COVERAGE:
+                trigram_count = self._entries[slot].trigram_count
+                dice = 2 * count / (len(query_trigrams) + trigram_count)
+                scored.append((coverage, dice, slot))
+        return [slot for *_, slot in heapq.nlargest(limit, scored)]
+
+    def _rank(self, slot: int, normalized: str) -> tuple[bool, int]:
+        entry = self._entries[slot]
+        return not entry.normalized.startswith(normalized), len(entry.normalized)
+
+
+__all__ = ["TitleIndex"]
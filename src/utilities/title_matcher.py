@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from utilities.title_features import extract_title_features, normalize_title
+
+DEFAULT_SIMILARITY_THRESHOLD = 0.4
+
+
+def title_trigrams(normalized: str) -> frozenset[str]:
+    padded = f" {normalized} "
+    return frozenset(padded[i : i + 3] for i in range(len(padded) - 2))
+
+
+def trigram_similarity(left: frozenset[str], right: frozenset[str]) -> float:
+    """Dice coefficient over character trigrams, in the 0..1 range."""
+    if not left or not right:
+        return 0.0
+    return 2 * len(left & right) / (len(left) + len(right))
+
+
+@dataclass(frozen=True, slots=True)
+class _Target:
+    normalized: str
+    trigrams: frozenset[str]
+
+
+class TitleMatcher:
+    """Matches release names against the titles expected for one search.
+
+    Expected titles are normalized and tokenized once; each candidate is
+    normalized once, checked for cheap containment first and only scored by
+    trigram similarity when no expected title is contained in it.
+    """
+
+    def __init__(
+        self,
+        expected_titles: list[str],
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+    ) -> None:
+        self._threshold = threshold
+        self._targets: list[_Target] = []
+        for title in expected_titles:
+            if normalized := normalize_title(title):
+                self._targets.append(_Target(normalized, title_trigrams(normalized)))
+
+    def __bool__(self) -> bool:
+        return bool(self._targets)
+
+    @property
+    def words(self) -> frozenset[str]:
+        return frozenset(
+            word for target in self._targets for word in target.normalized.split()
+        )
+
+    def contains_whole_title(self, candidate: str) -> bool:
+        """True when an expected title appears in ``candidate`` as whole words."""
+        padded = f" {extract_title_features(candidate).normalized} "
+        return any(f" {target.normalized} " in padded for target in self._targets)
+
+    def matches(self, candidate: str) -> bool:
+        return self.score(candidate) > self._threshold
+
+    def score(self, candidate: str) -> float:
+        """Return 1.0 on containment, else the best trigram similarity."""
+        normalized = extract_title_features(candidate).normalized
+        if any(target.normalized in normalized for target in self._targets):
+            return 1.0
+        candidate_trigrams = title_trigrams(normalized)
+        return max(
+            (
+                trigram_similarity(target.trigrams, candidate_trigrams)
+                for target in self._targets
+            ),
+            default=0.0,
+        )
+
+
+__all__ = [
+    "DEFAULT_SIMILARITY_THRESHOLD",
+    "TitleMatcher",
+    "normalize_title",
+    "title_trigrams",
+    "trigram_similarity",
+]
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import heapq
+import logging
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from itertools import count
+from time import perf_counter
+
+from models.movie_detail_service_types import MovieSearchResult
+from utilities.media_utils import is_season_match, parse_video_quality
+from utilities.title_matcher import TitleMatcher
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class FilterContext:
+    expected_titles: list[str] = field(default_factory=list)
+    season_number: int | None = None
+
+
+@dataclass(slots=True)
+class StageStats:
+    name: str
+    items_in: int = 0
+    items_out: int = 0
+    elapsed: float = 0.0
+
+
+Stage = Callable[[Iterable[MovieSearchResult], FilterContext], Iterable[MovieSearchResult]]
+
+
+def dedupe_stage(
+    results: Iterable[MovieSearchResult], context: FilterContext
+) -> Iterator[MovieSearchResult]:
+    seen_ids: set[str] = set()
+    for result in results:
+        if result.id in seen_ids:
+            continue
+        seen_ids.add(result.id)
+        yield result
+
+
+def drop_zero_seeds_stage(
+    results: Iterable[MovieSearchResult], context: FilterContext
+) -> Iterator[MovieSearchResult]:
+    return (result for result in results if result.seeds)
+
+
+def parse_quality_stage(
+    results: Iterable[MovieSearchResult], context: FilterContext
+) -> Iterator[MovieSearchResult]:
+    for result in results:
+        if not result.video_quality:
+            result.video_quality = parse_video_quality(
+                result.search_name or result.name
+            )
+        yield result
+
+
+def season_match_stage(
+    results: Iterable[MovieSearchResult], context: FilterContext
+) -> Iterator[MovieSearchResult]:
+    if context.season_number is None:
+        yield from results
+        return
+    for result in results:
+        if is_season_match(result.search_name or result.name, context.season_number):
+            yield result
+
+
+def fuzzy_match_stage(
+    results: Iterable[MovieSearchResult], context: FilterContext
+) -> Iterator[MovieSearchResult]:
+    matcher = TitleMatcher(context.expected_titles)
+    if not matcher:
+        yield from results
+        return
+    for result in results:
+        if matcher.matches(result.search_name or result.name):
+            yield result
+
+
+def top_k_per_quality(
+    results: Iterable[MovieSearchResult], k: int = 1
+) -> list[MovieSearchResult]:
+    """Keep the ``k`` most seeded results per quality, ordered by seeds."""
+    tie_breaker = count()
+    heaps: dict[str, list[tuple[int, int, MovieSearchResult]]] = {}
+
+    for result in results:
+        seeds = result.seeds if result.seeds is not None else -1
+        # Earlier results win ties, like max() over the original group did.
+        entry = (seeds, -next(tie_breaker), result)
+        heap = heaps.setdefault(result.video_quality or "N/A", [])
+        if len(heap) < k:
+            heapq.heappush(heap, entry)
+        elif entry > heap[0]:
+            heapq.heapreplace(heap, entry)
+
+    winners = [entry for heap in heaps.values() for entry in heap]
+    return [entry[2] for entry in heapq.nlargest(len(winners), winners)]
+
+
+# Dedupe goes last: a copy of a result rejected by the filters (e.g. one
+# parsed without seeds) must not hide a later valid copy with the same id.
+DEFAULT_STAGES: tuple[Stage, ...] = (
+    drop_zero_seeds_stage,
+    parse_quality_stage,
+    season_match_stage,
+    fuzzy_match_stage,
+    dedupe_stage,
+)
+
+
+class TorrentResultPipeline:
+    """Streams raw torrent results through filter stages and ranks the rest.
+
+    Stages are plain generator functions taking ``(results, context)`` and can
+    be reordered or replaced. Every run records items in/out and the time spent
+    inside each stage (excluding the time spent in upstream stages).
+    """
+
+    def __init__(
+        self, stages: Sequence[Stage] = DEFAULT_STAGES, *, top_k: int = 1
+    ) -> None:
+        self._stages = tuple(stages)
+        self._top_k = top_k
+        self.stats: list[StageStats] = []
+
+    def run(
+        self, raw_results: Iterable[MovieSearchResult], context: FilterContext
+    ) -> list[MovieSearchResult]:
+        self.stats = []
+        stream: Iterable[MovieSearchResult] = raw_results
+        for stage in self._stages:
+            stats = StageStats(name=stage.__name__)
+            self.stats.append(stats)
+            stream = _instrument(stage, stream, context, stats)
+
+        ranking_stats = StageStats(name="top_k_per_quality")
+        self.stats.append(ranking_stats)
+        counted = _CountingIterator(stream)
+        started_at = perf_counter()
+        results = top_k_per_quality(counted, self._top_k)
+        ranking_stats.elapsed = perf_counter() - started_at - counted.elapsed
+        ranking_stats.items_in = counted.count
+        ranking_stats.items_out = len(results)
+
+        self._log_stats()
+        return results
+
+    def _log_stats(self) -> None:
+        for stats in self.stats:
+            logger.debug(
+                "Pipeline stage %s: %d -> %d items in %.3fms",
+                stats.name,
+                stats.items_in,
+                stats.items_out,
+                stats.elapsed * 1000,
+            )
+
+
+class _CountingIterator:
+    """Counts items pulled from ``source`` and the time spent producing them."""
+
+    __slots__ = ("_source", "count", "elapsed")
+
+    def __init__(self, source: Iterable[MovieSearchResult]) -> None:
+        self._source = iter(source)
+        self.count = 0
+        self.elapsed = 0.0
+
+    def __iter__(self) -> _CountingIterator:
+        return self
+
+    def __next__(self) -> MovieSearchResult:
+        started_at = perf_counter()
+        try:
+            item = next(self._source)
+        finally:
+            self.elapsed += perf_counter() - started_at
+        self.count += 1
+        return item
+
+
+def _instrument(
+    stage: Stage,
+    stream: Iterable[MovieSearchResult],
+    context: FilterContext,
+    stats: StageStats,
+) -> Iterator[MovieSearchResult]:
+    upstream = _CountingIterator(stream)
+    output = iter(stage(upstream, context))
+    while True:
+        started_at = perf_counter()
+        upstream_before = upstream.elapsed
+        try:
+            item = next(output)
+        except StopIteration:
+            item = None
+        stats.elapsed += perf_counter() - started_at - (upstream.elapsed - upstream_before)
+        stats.items_in = upstream.count
+        if item is None:
+            return
+        stats.items_out += 1
+        yield item
+
+
+__all__ = [
+    "DEFAULT_STAGES",
+    "FilterContext",
+    "StageStats",
+    "TorrentResultPipeline",
+    "dedupe_stage",
+    "drop_zero_seeds_stage",
+    "fuzzy_match_stage",
+    "parse_quality_stage",
+    "season_match_stage",
+    "top_k_per_quality",
+]
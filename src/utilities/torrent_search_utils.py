@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from itertools import groupby
 
 from aiogram.types import (
     CallbackQuery,
@@ -11,17 +10,19 @@ from aiogram.types import (
     Message,
 )
 
-from bot.constants import MOVIE_DETAILED_CALLBACK
+from bot import config
+from bot.constants import (
+    MOVIE_DETAILED_CALLBACK,
+    SEARCH_MOVIE_CALLBACK,
+    TORRENT_RESULTS_PAGE_SIZE,
+)
 from models.movie_detail_service_types import MovieSearchResult
 from models.search_provider_types import MediaDetails
 from torrents import get_torrent_provider
-from utilities.media_utils import (
-    calculate_similarity,
-    clean_title_for_query,
-    is_season_match,
-    parse_video_quality,
-)
-from utilities.handlers_utils import redis_callback_save
+from utilities.media_utils import clean_title_for_query
+from utilities.groq_utils import filter_movies_with_groq
+from utilities.handlers_utils import redis_callback_save, redis_callback_save_many
+from utilities.torrent_result_pipeline import FilterContext, TorrentResultPipeline
 
 logger = logging.getLogger(__name__)
 
@@ -98,31 +99,41 @@ async def perform_torrent_search(
         await target_message.edit_text("Не удалось выполнить поиск по торрентам.")
         return
 
-    results = _filter_and_process_results(raw_results, media_details, season_number)
+    pipeline = TorrentResultPipeline()
+    results = pipeline.run(
+        raw_results, _build_filter_context(media_details, season_number)
+    )
+    results = await _validate_with_groq(
+        results,
+        requested_item=requested_item or query,
+        requested_type=requested_type,
+        media_details=media_details,
+        season_number=season_number,
+    )
 
     if not results:
         logger.info("No torrent results found after filtering")
         await target_message.edit_text("По запросу ничего не найдено.")
         return
 
-    results = _sort_and_group_results(results)
-
+    tmdb_info = _build_tmdb_info(media_details)
     results_json = [r.model_dump(mode="json") for r in results]
     results_cache_data = {
         "results": results_json,
         "requested_item": requested_item,
         "back_callback_key": back_callback_key,
         "back_button_text": back_button_text,
+        "tmdb_info": tmdb_info,
     }
-    results_cache_key = redis_callback_save(results_cache_data)
+    results_cache_key = await redis_callback_save(results_cache_data)
 
     try:
-        keyboard = format_torrent_search_results(
+        keyboard = await format_torrent_search_results(
             results,
             results_cache_key,
             back_callback_key=back_callback_key,
             back_button_text=back_button_text,
-            media_details=media_details,
+            tmdb_info=tmdb_info,
         )
         if not keyboard.inline_keyboard:
             await target_message.edit_text("По запросу ничего не найдено.")
@@ -143,91 +154,111 @@ async def perform_torrent_search(
         await target_message.edit_text("Не удалось отобразить результаты поиска.")
 
 
-def _filter_and_process_results(
-    raw_results: list[MovieSearchResult],
+def _build_tmdb_info(media_details: MediaDetails | None) -> dict | None:
+    if not media_details:
+        return None
+    return {
+        "original_title": media_details.original_title,
+        "year": media_details.year,
+    }
+
+
+async def _validate_with_groq(
+    results: list[MovieSearchResult],
+    *,
+    requested_item: str,
+    requested_type: str | None,
     media_details: MediaDetails | None,
     season_number: int | None,
 ) -> list[MovieSearchResult]:
-    seen_movie_ids = set()
-    results = []
+    """Drop the results the Groq validator rejects.
+
+    Only runs when ``GROQ_TORRENT_FILTER`` is enabled. The validator works on
+    copies, so the kept results keep the names and qualities parsed from the
+    tracker. If validation fails the results are kept as they are.
+    """
+    if not config.GROQ_TORRENT_FILTER or not results:
+        return results
+    if requested_type is None and media_details:
+        requested_type = "series" if media_details.is_series else "movie"
+
+    try:
+        validated = await filter_movies_with_groq(
+            [result.model_copy(deep=True) for result in results],
+            requested_item=requested_item,
+            requested_type=requested_type or "",
+            expected_titles=_build_filter_context(
+                media_details, season_number
+            ).expected_titles,
+            year=media_details.year if media_details else None,
+            season_number=season_number,
+        )
+    except Exception as exc:
+        logger.warning("Groq validation failed, keeping unvalidated results: %s", exc)
+        return results
+    accepted = {result.id for result in validated}
+    return [result for result in results if result.id in accepted]
+
 
+def _build_filter_context(
+    media_details: MediaDetails | None,
+    season_number: int | None,
+) -> FilterContext:
     expected_titles = []
     if media_details:
         expected_titles = [
             t for t in [media_details.title, media_details.original_title] if t
         ]
+    return FilterContext(expected_titles=expected_titles, season_number=season_number)
 
-    for result in raw_results:
-        if result.id in seen_movie_ids or not result.seeds:
-            continue
-
-        if not result.video_quality:
-            result.video_quality = parse_video_quality(
-                result.search_name or result.name
-            )
-
-        result_name = result.search_name or result.name
-
-        if season_number is not None and not is_season_match(
-            result_name, season_number
-        ):
-            continue
-
-        if expected_titles and not _is_fuzzy_match(result_name, expected_titles):
-            continue
-
-        seen_movie_ids.add(result.id)
-        results.append(result)
-
-    return results
-
-
-def _is_fuzzy_match(result_name: str, expected_titles: list[str]) -> bool:
-    result_clean = clean_title_for_query(result_name).lower()
-
-    for expected in expected_titles:
-        expected_clean = clean_title_for_query(expected).lower()
-        if expected_clean in result_clean:
-            return True
-        if calculate_similarity(expected, result_name) > 0.4:
-            return True
-
-    return False
 
-
-def _sort_and_group_results(
-    results: list[MovieSearchResult],
-) -> list[MovieSearchResult]:
-    def get_quality(r: MovieSearchResult) -> str:
-        return r.video_quality or "N/A"
-
-    results.sort(key=get_quality)
-    best_results = []
-
-    for _, group in groupby(results, key=get_quality):
-        best_in_group = max(group, key=lambda r: r.seeds if r.seeds is not None else -1)
-        best_results.append(best_in_group)
-
-    best_results.sort(
-        key=lambda r: r.seeds if r.seeds is not None else -1, reverse=True
-    )
-    return best_results
-
-
-def format_torrent_search_results(
+async def format_torrent_search_results(
     results: list[MovieSearchResult],
     results_cache_key: str,
     *,
+    page: int = 0,
     back_callback_key: str | None = None,
     back_button_text: str | None = None,
-    media_details: MediaDetails | None = None,
+    tmdb_info: dict | None = None,
 ) -> InlineKeyboardMarkup:
-    """Format torrent search results into Telegram inline keyboard."""
+    """Format one page of torrent search results into Telegram inline keyboard.
+
+    Callback entries are created only for the visible page, in one Redis
+    round-trip; other pages are rebuilt from the cached result set when the
+    user navigates to them.
+    """
+    pages_count = max(1, -(-len(results) // TORRENT_RESULTS_PAGE_SIZE))
+    page = min(max(page, 0), pages_count - 1)
+    page_start = page * TORRENT_RESULTS_PAGE_SIZE
+    page_results = results[page_start : page_start + TORRENT_RESULTS_PAGE_SIZE]
+
+    labels = [_result_button_label(result) for result in page_results]
+    payloads = [
+        _result_button_payload(result, results_cache_key, page, tmdb_info)
+        for result in page_results
+    ]
+    pages = _pagination_targets(page, pages_count)
+    payloads += [
+        {
+            "action": SEARCH_MOVIE_CALLBACK,
+            "results_cache_key": results_cache_key,
+            "page": target_page,
+        }
+        for _, target_page in pages
+    ]
+    callback_keys = await redis_callback_save_many(payloads)
+
     buttons = [
-        _create_result_button(result, results_cache_key, media_details)
-        for result in results
+        [InlineKeyboardButton(text=label, callback_data=callback_key)]
+        for label, callback_key in zip(labels, callback_keys)
     ]
 
+    if pages:
+        buttons.append([
+            InlineKeyboardButton(text=text, callback_data=callback_key)
+            for (text, _), callback_key in zip(pages, callback_keys[len(labels) :])
+        ])
+
     if back_callback_key:
         buttons.append([
             InlineKeyboardButton(
@@ -239,35 +270,44 @@ def format_torrent_search_results(
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
 
-def _create_result_button(
-    result: MovieSearchResult,
-    results_cache_key: str,
-    media_details: MediaDetails | None,
-) -> list[InlineKeyboardButton]:
-    """Create a single result button with metadata."""
+def _pagination_targets(page: int, pages_count: int) -> list[tuple[str, int]]:
+    """Prev/Next button texts and the pages of the cached result set they open."""
+    targets = []
+    if page > 0:
+        targets.append((f"⬅️ {page}/{pages_count}", page - 1))
+    if page < pages_count - 1:
+        targets.append((f"{page + 2}/{pages_count} ➡️", page + 1))
+    return targets
+
+
+def _result_button_label(result: MovieSearchResult) -> str:
     quality = result.video_quality or "N/A"
     size = result.size or "N/A"
     seeds = result.seeds if result.seeds is not None else "?"
     peers = result.peers if result.peers is not None else "?"
-    
-    label = f"{quality} | {size} | ⬆️{seeds} ⬇️{peers}"
-    
+    return f"{quality} | {size} | ⬆️{seeds} ⬇️{peers}"
+
+
+def _result_button_payload(
+    result: MovieSearchResult,
+    results_cache_key: str,
+    page: int,
+    tmdb_info: dict | None,
+) -> dict:
+    """Callback payload of a single result button with metadata."""
     payload = {
         "action": MOVIE_DETAILED_CALLBACK,
         "movie_id": result.id,
         "results_cache_key": results_cache_key,
+        "page": page,
     }
     
-    if media_details:
-        payload["tmdb_info"] = {
-            "original_title": media_details.original_title,
-            "year": media_details.year,
-        }
+    if tmdb_info:
+        payload["tmdb_info"] = tmdb_info
     
     if result.has_full_details:
         payload["movie_details"] = result.model_dump(
             mode="json", by_alias=True, exclude_none=True
         )
     
-    callback_data = redis_callback_save(payload)
-    return [InlineKeyboardButton(text=label, callback_data=callback_data)]
+    return payload
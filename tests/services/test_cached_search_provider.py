@@ -0,0 +1,45 @@
+from models.search_provider_types import MediaDetails, Provider, SearchResults
+from services.search_integrations.cached import CachedSearchProvider
+from services.search_integrations.interface import SearchProvider
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.data: dict[str, str] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: str, ex: int | None = None) -> None:
+        self.data[key] = value
+
+
+class FakeProvider(SearchProvider):
+    def __init__(self) -> None:
+        self.details_calls: list[tuple[str, bool | None]] = []
+
+    async def search(self, query: str) -> SearchResults:
+        return SearchResults()
+
+    async def get_details(
+        self, media_id: str, *, is_series: bool | None = None
+    ) -> MediaDetails:
+        self.details_calls.append((media_id, is_series))
+        return MediaDetails(
+            provider_id=media_id,
+            provider=next(iter(Provider)),
+            title="Series" if is_series else "Movie",
+            is_series=bool(is_series),
+        )
+
+
+async def test_details_are_cached_per_type_hint():
+    upstream = FakeProvider()
+    provider = CachedSearchProvider(upstream, "test", redis=FakeRedis())
+
+    movie = await provider.get_details("42", is_series=False)
+    series = await provider.get_details("42", is_series=True)
+    again = await provider.get_details("42", is_series=True)
+
+    assert (movie.is_series, series.is_series, again.is_series) == (False, True, True)
+    assert upstream.details_calls == [("42", False), ("42", True)]
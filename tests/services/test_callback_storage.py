@@ -0,0 +1,220 @@
+"""The ``CallbackStorage`` contract, checked against every backend.
+
+Memory and SQLite run on a fake clock. Redis runs when it is reachable at
+REDIS_HOST:REDIS_PORT and expires keys itself, so its expiry checks wait in
+real time.
+"""
+
+import asyncio
+import uuid
+from collections.abc import Awaitable, Callable
+
+import pytest
+from redis import RedisError
+from redis.asyncio import Redis
+
+from bot.config import REDIS_HOST, REDIS_PORT
+from services.callback_storage.interface import BLOBS_NAMESPACE, CallbackStorage
+from services.callback_storage.memory_storage import MemoryCallbackStorage
+from services.callback_storage.redis_storage import RedisCallbackStorage
+from services.callback_storage.sqlite_storage import SQLiteCallbackStorage
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class Backend:
+    """Builds storages of one kind and waits for their TTLs to pass."""
+
+    def __init__(
+        self,
+        make: Callable[..., CallbackStorage],
+        wait: Callable[[float], Awaitable[None]],
+    ) -> None:
+        self._make = make
+        self.wait = wait
+        self.storages: list[CallbackStorage] = []
+
+    def __call__(self, **kwargs) -> CallbackStorage:
+        storage = self._make(**kwargs)
+        self.storages.append(storage)
+        return storage
+
+
+def unique(label: str) -> str:
+    # Keeps runs apart from each other and from real chats sharing a Redis.
+    return f"test-{label}-{uuid.uuid4().hex[:8]}"
+
+
+@pytest.fixture(params=["memory", "sqlite", "redis"])
+async def backend(request, tmp_path):
+    if request.param == "memory":
+        clock = FakeClock()
+        backend = Backend(
+            lambda **kwargs: MemoryCallbackStorage(clock=clock, **kwargs), clock.sleep
+        )
+    elif request.param == "sqlite":
+        clock = FakeClock()
+        paths = (str(tmp_path / f"{number}.sqlite3") for number in range(100))
+        backend = Backend(
+            lambda **kwargs: SQLiteCallbackStorage(next(paths), clock=clock, **kwargs),
+            clock.sleep,
+        )
+    else:
+        if not REDIS_HOST:
+            pytest.skip("REDIS_HOST is not set")
+        redis = Redis(host=REDIS_HOST, port=REDIS_PORT)
+        try:
+            await redis.ping()
+        except (RedisError, OSError):
+            await redis.aclose()
+            pytest.skip("Redis is not reachable")
+        backend = Backend(
+            lambda **kwargs: RedisCallbackStorage(redis, **kwargs), asyncio.sleep
+        )
+
+    yield backend
+    for storage in backend.storages:
+        await storage.aclose()
+    if request.param == "redis":
+        await redis.aclose()
+
+
+async def test_round_trip(backend):
+    storage, chat, other = backend(), unique("chat"), unique("chat")
+    await storage.save(chat, {"a": b"first", "b": b"second"}, {})
+
+    assert await storage.get(chat, "a") == b"first"
+    assert await storage.get(chat, "b") == b"second"
+    assert await storage.get(chat, "missing") is None
+    assert await storage.get(other, "a") is None, "namespaces must be isolated"
+    await storage.delete(chat, ["a", "b"])
+
+
+async def test_blobs(backend):
+    storage, chat, digest = backend(), unique("chat"), unique("blob")
+    await storage.save(chat, {"a": b"entry"}, {digest: b"blob"})
+
+    assert await storage.get_blobs([unique("missing"), digest]) == [None, b"blob"]
+    await storage.delete(chat, ["a"])
+
+
+async def test_delete(backend):
+    storage, chat = backend(), unique("chat")
+    await storage.save(chat, {"a": b"1", "b": b"2"}, {})
+    await storage.delete(chat, ["a", "unknown"])
+
+    assert await storage.get(chat, "a") is None
+    assert await storage.get(chat, "b") == b"2"
+    await storage.delete(chat, ["b"])
+
+
+async def test_evicts_least_recently_used(backend):
+    storage, chat = backend(max_keys=3), unique("chat")
+    for key in ("a", "b", "c"):
+        assert await storage.save(chat, {key: key.encode()}, {}) == []
+        # Distinct last-use times for backends ordering by timestamp.
+        await backend.wait(0.01)
+    assert await storage.get(chat, "a") == b"a"
+    await backend.wait(0.01)
+    storage.touch(chat, "b")
+
+    assert await storage.save(chat, {"d": b"d"}, {}) == ["c"]
+    assert await storage.get(chat, "c") is None
+    assert sorted(await storage.save(chat, {"e": b"e", "f": b"f"}, {})) == ["a", "b"]
+    await storage.delete(chat, ["d", "e", "f"])
+
+
+async def test_expiry(backend):
+    storage, chat, digest = backend(ttl=1), unique("chat"), unique("blob")
+    await storage.save(chat, {"a": b"1"}, {digest: b"blob"})
+    await backend.wait(1.2)
+
+    assert await storage.get(chat, "a") is None
+    assert await storage.get_blobs([digest]) == [None]
+
+
+async def test_reads_slide_the_ttl(backend):
+    storage, chat = backend(ttl=2), unique("chat")
+    await storage.save(chat, {"a": b"1", "b": b"2"}, {})
+    await backend.wait(1.2)
+    assert await storage.get(chat, "a") == b"1"
+    await backend.wait(1.2)
+
+    assert await storage.get(chat, "a") == b"1"
+    assert await storage.get(chat, "b") is None
+    await storage.delete(chat, ["a"])
+
+
+async def test_usage(backend):
+    storage, chat, digest = backend(), unique("chat"), unique("blob")
+    await storage.save(chat, {"a": b"12345", "bb": b"123"}, {digest: b"blob"})
+    report = await storage.usage()
+
+    assert report[chat][0] == 2
+    assert report[chat][1] >= len("a12345bb123")
+    assert report[BLOBS_NAMESPACE][0] >= 1
+    await storage.delete(chat, ["a", "bb"])
+
+
+async def test_memory_blobs_are_bounded():
+    storage = MemoryCallbackStorage(max_blob_bytes=100)
+    await storage.save("chat", {"a": b"entry"}, {"blob-a": b"x" * 40})
+    await storage.save("chat", {"b": b"entry"}, {"blob-b": b"x" * 40})
+    await storage.get_blobs(["blob-a"])
+    await storage.save("chat", {"c": b"entry"}, {"blob-c": b"x" * 40})
+
+    found = await storage.get_blobs(["blob-a", "blob-b", "blob-c"])
+    assert [blob is not None for blob in found] == [True, False, True]
+    assert (await storage.usage())[BLOBS_NAMESPACE][0] == 2
+
+
+class _Pipeline:
+    def __init__(self) -> None:
+        self.commands: list[str] = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        pass
+
+    def __getattr__(self, command: str):
+        return lambda *args, **kwargs: self.commands.append(command)
+
+    async def execute(self) -> list:
+        return [None] * len(self.commands)
+
+
+class _MissingRedis:
+    """Misses every namespaced entry and records bare-key reads."""
+
+    def __init__(self) -> None:
+        self.bare_reads: list[str] = []
+
+    def pipeline(self, transaction: bool = True) -> _Pipeline:
+        return _Pipeline()
+
+    async def get(self, key: str) -> bytes:
+        self.bare_reads.append(key)
+        return b"legacy"
+
+
+async def test_redis_reads_bare_keys_only_for_legacy_entries():
+    clock, redis = FakeClock(), _MissingRedis()
+    storage = RedisCallbackStorage(redis, clock=clock)
+    legacy_key = str(uuid.uuid4())
+
+    assert await storage.get("chat", "qbt-refresh") is None
+    assert await storage.get("chat", legacy_key) == b"legacy"
+    await clock.sleep(3600)
+    assert await storage.get("chat", legacy_key) is None
+    assert redis.bare_reads == [legacy_key]
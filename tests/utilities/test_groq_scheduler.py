@@ -0,0 +1,166 @@
+import asyncio
+
+import httpx
+import pytest
+from groq import RateLimitError
+
+from utilities.groq_scheduler import GroqScheduler, Priority, TokenBucket
+
+
+class FakeClock:
+    """Monotonic clock that only moves when the scheduler sleeps."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+        await asyncio.sleep(0)
+
+
+def _rate_limit_error(retry_after: str | None = None) -> RateLimitError:
+    headers = {"retry-after": retry_after} if retry_after is not None else {}
+    response = httpx.Response(
+        429,
+        headers=headers,
+        request=httpx.Request("POST", "https://api.groq.com/openai/v1/chat/completions"),
+    )
+    return RateLimitError("rate limited", response=response, body=None)
+
+
+def _scheduler(create, clock: FakeClock, **kwargs) -> GroqScheduler:
+    options = {
+        "requests_per_minute": 60,
+        "tokens_per_minute": 6000,
+        "max_concurrency": 1,
+        "base_backoff": 0.0,
+        "clock": clock,
+        "sleep": clock.sleep,
+    }
+    options.update(kwargs)
+    return GroqScheduler(create, **options)
+
+
+def test_token_bucket_refills_over_time():
+    clock = FakeClock()
+    bucket = TokenBucket(capacity=10, refill_per_second=2, clock=clock)
+
+    bucket.consume(10)
+    assert bucket.delay(4) == pytest.approx(2.0)
+
+    clock.now += 1
+    assert bucket.delay(4) == pytest.approx(1.0)
+
+    clock.now += 1
+    assert bucket.delay(4) == 0.0
+
+
+def test_token_bucket_never_exceeds_capacity():
+    clock = FakeClock()
+    bucket = TokenBucket(capacity=10, refill_per_second=2, clock=clock)
+
+    clock.now += 100
+    bucket.consume(10)
+    assert bucket.delay(1) == pytest.approx(0.5)
+
+
+def test_token_bucket_debt_delays_next_call():
+    clock = FakeClock()
+    bucket = TokenBucket(capacity=10, refill_per_second=1, clock=clock)
+
+    bucket.consume(15)
+    # Requests larger than the capacity only wait for a full bucket.
+    assert bucket.delay(20) == pytest.approx(15.0)
+
+
+async def test_waits_for_request_bucket_refill():
+    clock = FakeClock()
+    calls: list[float] = []
+
+    async def create(**kwargs):
+        calls.append(clock.now)
+        return "ok"
+
+    scheduler = _scheduler(create, clock, requests_per_minute=2)
+    results = await asyncio.gather(
+        *(scheduler.create(estimated_tokens=10) for _ in range(3))
+    )
+
+    assert results == ["ok"] * 3
+    # Two requests fit in the bucket, the third waits for one to refill.
+    assert calls == pytest.approx([0.0, 0.0, 30.0])
+
+
+async def test_releases_waiters_in_priority_order():
+    clock = FakeClock()
+    order: list[str] = []
+
+    async def create(*, name: str):
+        order.append(name)
+        return name
+
+    scheduler = _scheduler(create, clock)
+    await asyncio.gather(
+        scheduler.create(estimated_tokens=10, priority=Priority.BACKGROUND, name="bg-1"),
+        scheduler.create(estimated_tokens=10, priority=Priority.BACKGROUND, name="bg-2"),
+        scheduler.create(estimated_tokens=10, priority=Priority.INTERACTIVE, name="fg"),
+    )
+
+    assert order == ["fg", "bg-1", "bg-2"]
+
+
+async def test_retries_after_server_supplied_delay():
+    clock = FakeClock()
+    calls: list[float] = []
+
+    async def create(**kwargs):
+        calls.append(clock.now)
+        if len(calls) == 1:
+            raise _rate_limit_error("7")
+        return "ok"
+
+    scheduler = _scheduler(create, clock)
+
+    assert await scheduler.create(estimated_tokens=10) == "ok"
+    assert calls == pytest.approx([0.0, 7.0])
+    assert clock.sleeps[0] == pytest.approx(7.0)
+
+
+async def test_backs_off_without_retry_after():
+    clock = FakeClock()
+    attempts = 0
+
+    async def create(**kwargs):
+        nonlocal attempts
+        attempts += 1
+        if attempts < 3:
+            raise _rate_limit_error()
+        return "ok"
+
+    scheduler = _scheduler(create, clock, base_backoff=1.0, max_backoff=1.5)
+
+    assert await scheduler.create(estimated_tokens=10) == "ok"
+    assert len(clock.sleeps) == 2
+    assert 0.0 <= clock.sleeps[0] <= 1.0
+    assert 0.0 <= clock.sleeps[1] <= 1.5
+
+
+async def test_gives_up_after_max_retries():
+    clock = FakeClock()
+    attempts = 0
+
+    async def create(**kwargs):
+        nonlocal attempts
+        attempts += 1
+        raise _rate_limit_error("1")
+
+    scheduler = _scheduler(create, clock, max_retries=2)
+
+    with pytest.raises(RateLimitError):
+        await scheduler.create(estimated_tokens=10)
+    assert attempts == 3
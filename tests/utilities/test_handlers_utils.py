@@ -0,0 +1,82 @@
+import copy
+import json
+
+import pytest
+
+from services.callback_storage.memory_storage import MemoryCallbackStorage
+from utilities import handlers_utils
+from services.redis_services.serializer import callback_serializer
+from utilities.handlers_utils import (
+    redis_callback_delete,
+    redis_callback_get,
+    redis_callback_save,
+)
+
+
+@pytest.fixture
+def storage(monkeypatch):
+    storage = MemoryCallbackStorage()
+    monkeypatch.setattr(handlers_utils, "get_callback_storage", lambda: storage)
+    monkeypatch.setattr(handlers_utils, "CALLBACK_L1_SIZE", 16)
+    handlers_utils._l1.clear()
+    yield storage
+    handlers_utils._l1.clear()
+
+
+def _payload() -> dict:
+    return {
+        "action": "test",
+        "movie": {"title": "Игра престолов", "genres": ["драма", "фэнтези"]},
+        "results": [{"id": str(index), "name": "x" * 40} for index in range(20)],
+    }
+
+
+async def test_cached_payloads_are_read_only(storage):
+    payload = _payload()
+    callback_key = await redis_callback_save(payload)
+    payload["movie"]["genres"].append("changed after save")
+
+    cached = await redis_callback_get(callback_key)
+    assert cached == _payload()
+    with pytest.raises(TypeError):
+        cached["movie"]["genres"].clear()
+    with pytest.raises(TypeError):
+        cached["action"] = "changed"
+
+    mutable = copy.deepcopy(cached)
+    mutable["results"].pop()
+    assert type(mutable) is dict
+    assert await redis_callback_get(callback_key) == _payload()
+
+
+async def test_cached_payloads_serialize_like_plain_ones(storage):
+    cached = await redis_callback_get(await redis_callback_save(_payload()))
+
+    assert json.loads(json.dumps(cached)) == _payload()
+    assert callback_serializer.loads(callback_serializer.dumps(cached)) == _payload()
+
+
+async def test_delete_drops_cached_payloads(storage):
+    callback_key = await redis_callback_save(_payload())
+    namespace = handlers_utils.callback_namespace.get()
+    assert await redis_callback_get(callback_key) is not None
+
+    await redis_callback_delete(namespace, [callback_key])
+
+    assert await redis_callback_get(callback_key) is None
+    assert await storage.get(namespace, callback_key) is None
+
+
+async def test_payload_with_expired_blob_is_missing(monkeypatch):
+    now = [0.0]
+    storage = MemoryCallbackStorage(ttl=10, clock=lambda: now[0])
+    monkeypatch.setattr(handlers_utils, "get_callback_storage", lambda: storage)
+    monkeypatch.setattr(handlers_utils, "CALLBACK_L1_SIZE", 0)
+    callback_key = await redis_callback_save(_payload())
+
+    # Uses served from the in-process cache slide the entry, not its blobs.
+    now[0] = 8
+    storage.touch(handlers_utils.callback_namespace.get(), callback_key)
+    now[0] = 12
+
+    assert await redis_callback_get(callback_key) is None
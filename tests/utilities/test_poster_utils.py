@@ -0,0 +1,46 @@
+import httpx
+import pytest
+
+from utilities import poster_utils
+
+
+@pytest.fixture
+def serve(monkeypatch):
+    """Serve ``chunks`` chunks of 1 KiB and record how many were read."""
+    sent: list[int] = []
+
+    def install(chunks: int, headers: dict[str, str] | None = None) -> list[int]:
+        async def body():
+            for _ in range(chunks):
+                sent.append(1024)
+                yield b"x" * 1024
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, headers=headers, content=body())
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(poster_utils._http, "_client", client)
+        return sent
+
+    monkeypatch.setattr(poster_utils, "POSTER_MAX_BYTES", 4 * 1024)
+    return install
+
+
+async def test_download_poster_returns_small_posters(serve):
+    serve(3)
+
+    assert await poster_utils.download_poster("https://posters/1.jpg") == b"x" * 3072
+
+
+async def test_download_poster_stops_reading_oversized_posters(serve):
+    sent = serve(100)
+
+    assert await poster_utils.download_poster("https://posters/1.jpg") is None
+    assert len(sent) == 5
+
+
+async def test_download_poster_trusts_content_length(serve):
+    sent = serve(100, headers={"content-length": str(100 * 1024)})
+
+    assert await poster_utils.download_poster("https://posters/1.jpg") is None
+    assert sent == []
@@ -0,0 +1,51 @@
+import pytest
+
+from utilities.title_cascade import FUZZY_SCORE_CAP, CascadeDecision, TitleCascade
+
+
+@pytest.fixture
+def cascade() -> TitleCascade:
+    return TitleCascade(["Дюна", "Dune"], "movie", 2021)
+
+
+def test_whole_title_with_matching_year_is_accepted(cascade):
+    assert cascade.decide("Дюна / Dune (2021) WEB-DL (1080p)") == CascadeDecision.ACCEPT
+
+
+def test_fuzzy_match_is_never_accepted_despite_year_bonus(cascade):
+    title = "Дюны / Dunes (2021) WEB-DL"
+    assert cascade.score(title) <= FUZZY_SCORE_CAP
+    assert cascade.decide(title) == CascadeDecision.UNSURE
+
+
+@pytest.mark.parametrize(
+    "title",
+    [
+        "Дюна / Dune (2021) OST",
+        "Дюна / Dune (2021) Soundtrack FLAC",
+        "Дюна / Dune (2021) аудиокнига MP3",
+    ],
+)
+def test_audio_and_book_releases_are_rejected(cascade, title):
+    assert cascade.decide(title) == CascadeDecision.REJECT
+
+
+@pytest.mark.parametrize(
+    "title",
+    [
+        "Дюна / Dune (2021) BDRip 1080p Soft Subs",
+        "Дюна / Dune (2021) WEB-DL 1080p Repack",
+    ],
+)
+def test_ambiguous_words_do_not_reject_locally(cascade, title):
+    assert cascade.decide(title) != CascadeDecision.REJECT
+
+
+def test_expected_title_words_are_not_non_video_markers():
+    cascade = TitleCascade(["Игра престолов", "Game of Thrones"], "series", season_number=1)
+    assert cascade.score("Игра престолов / Game of Thrones (1 сезон) WEB-DL") > 0
+
+
+def test_other_season_is_rejected():
+    cascade = TitleCascade(["Игра престолов"], "series", season_number=1)
+    assert cascade.decide("Игра престолов (2 сезон: 1-10 серии из 10)") == CascadeDecision.REJECT
@@ -0,0 +1,44 @@
+import pytest
+
+from models.movie_detail_service_types import VideoQuality
+from utilities.title_features import SeasonVerdict, classify_season, extract_title_features
+
+
+@pytest.mark.parametrize(
+    ("title", "verdict"),
+    [
+        ("Игра престолов (1 сезон: 1-10 серии из 10) WEB-DL", SeasonVerdict.MATCH),
+        ("Game of Thrones S01E01-10 1080p", SeasonVerdict.MATCH),
+        ("Игра престолов (Сезон: 1 из 8)", SeasonVerdict.MATCH),
+        ("Игра престолов (Сезон 1, 1-10 серии)", SeasonVerdict.MATCH),
+        ("Игра престолов (сезон: 2)", SeasonVerdict.MISMATCH),
+        ("Игра престолов (1-6 сезоны)", SeasonVerdict.MISMATCH),
+        ("Game of Thrones S01-S03", SeasonVerdict.MISMATCH),
+        ("Игра престолов (1-6 из 6 сезонов)", SeasonVerdict.MISMATCH),
+        ("Игра престолов [Сезон 1, 2]", SeasonVerdict.MISMATCH),
+        ("Game of Thrones S01, S02", SeasonVerdict.MISMATCH),
+        ("Игра престолов (1, 2 сезон)", SeasonVerdict.MISMATCH),
+        ("Game of Thrones Complete Series", SeasonVerdict.MISMATCH),
+        ("Игра престолов (2011) WEB-DL", SeasonVerdict.UNSURE),
+    ],
+)
+def test_classify_season(title, verdict):
+    assert classify_season(title, 1) == verdict
+
+
+def test_listed_pack_spans_lowest_to_highest_season():
+    assert extract_title_features("Сериал [Сезон 3, 1, 2]").season_range == (1, 3)
+
+
+def test_season_of_total_after_colon():
+    features = extract_title_features("Сериал (Сезон: 1 из 8)")
+    assert (features.season, features.season_total) == (1, 8)
+
+
+def test_release_features():
+    features = extract_title_features("Дюна / Dune (2021) WEB-DL 1080p x264 ДБ, СТ | Rus, Eng")
+    assert features.year == 2021
+    assert features.quality == VideoQuality.FHD_1080P
+    assert features.codec == "x264"
+    assert features.translations == ("DUB", "SUB")
+    assert features.languages == ("RUS", "ENG")
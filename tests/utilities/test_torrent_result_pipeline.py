@@ -0,0 +1,112 @@
+from models.movie_detail_service_types import MovieDetails, MovieRatings, MovieSearchResult
+from utilities.torrent_result_pipeline import (
+    FilterContext,
+    TorrentResultPipeline,
+    dedupe_stage,
+    drop_zero_seeds_stage,
+    fuzzy_match_stage,
+    parse_quality_stage,
+    season_match_stage,
+    top_k_per_quality,
+)
+
+
+def _result(
+    search_id: str,
+    search_name: str = "Дюна / Dune (2021) WEB-DL 1080p",
+    *,
+    seeds: int | None = 10,
+    video_quality: str | None = None,
+) -> MovieSearchResult:
+    details = MovieDetails(
+        name=search_name,
+        year="2021",
+        genres=[],
+        director="",
+        actors=[],
+        video_quality=video_quality,
+        ratings=MovieRatings(),
+        torrent_details=[],
+    )
+    return MovieSearchResult.from_search_data(
+        search_id=search_id,
+        size="10 GB",
+        search_name=search_name,
+        details=details,
+        seeds=seeds,
+    )
+
+
+def _ids(results) -> list[str]:
+    return [result.id for result in results]
+
+
+def test_dedupe_keeps_first_copy():
+    results = [_result("1", "first"), _result("2"), _result("1", "second")]
+
+    kept = list(dedupe_stage(results, FilterContext()))
+
+    assert _ids(kept) == ["1", "2"]
+    assert kept[0].search_name == "first"
+
+
+def test_drop_zero_seeds():
+    results = [_result("1", seeds=0), _result("2", seeds=None), _result("3", seeds=1)]
+
+    assert _ids(drop_zero_seeds_stage(results, FilterContext())) == ["3"]
+
+
+def test_parse_quality_fills_only_missing_quality():
+    results = [
+        _result("1", "Дюна / Dune (2021) WEB-DL 2160p"),
+        _result("2", "Дюна / Dune (2021) WEB-DL 2160p", video_quality="1080p"),
+    ]
+
+    parsed = list(parse_quality_stage(results, FilterContext()))
+
+    assert [result.video_quality for result in parsed] == ["4K", "1080p"]
+
+
+def test_season_match():
+    results = [
+        _result("1", "Игра престолов / Game of Thrones S01 1080p"),
+        _result("2", "Игра престолов / Game of Thrones S02 1080p"),
+    ]
+
+    assert _ids(season_match_stage(results, FilterContext(season_number=2))) == ["2"]
+    assert _ids(season_match_stage(results, FilterContext())) == ["1", "2"]
+
+
+def test_fuzzy_match():
+    results = [
+        _result("1", "Дюна / Dune (2021) WEB-DL 1080p"),
+        _result("2", "Интерстеллар / Interstellar (2014) BDRip 1080p"),
+    ]
+    context = FilterContext(expected_titles=["Дюна", "Dune"])
+
+    assert _ids(fuzzy_match_stage(results, context)) == ["1"]
+    assert _ids(fuzzy_match_stage(results, FilterContext())) == ["1", "2"]
+
+
+def test_top_k_per_quality():
+    results = [
+        _result("1", seeds=5, video_quality="1080p"),
+        _result("2", seeds=50, video_quality="1080p"),
+        _result("3", seeds=7, video_quality="4K"),
+        _result("4", seeds=7, video_quality="4K"),
+        _result("5", seeds=None),
+    ]
+
+    assert _ids(top_k_per_quality(results, 1)) == ["2", "3", "5"]
+    assert _ids(top_k_per_quality(results, 2)) == ["2", "3", "4", "1", "5"]
+
+
+def test_rejected_duplicate_does_not_hide_valid_copy():
+    results = [_result("1", seeds=0), _result("1", seeds=20)]
+    pipeline = TorrentResultPipeline()
+
+    kept = pipeline.run(results, FilterContext(expected_titles=["Дюна"]))
+
+    assert [(result.id, result.seeds) for result in kept] == [("1", 20)]
+    assert [stats.name for stats in pipeline.stats][-1] == "top_k_per_quality"
+    assert pipeline.stats[0].items_in == 2
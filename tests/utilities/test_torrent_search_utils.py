@@ -0,0 +1,73 @@
+from bot import config
+from models.movie_detail_service_types import MovieDetails, MovieRatings, MovieSearchResult
+from utilities import torrent_search_utils
+from utilities.torrent_search_utils import _validate_with_groq
+
+
+def _result(search_id: str, search_name: str) -> MovieSearchResult:
+    details = MovieDetails(
+        name="Дюна",
+        year="2021",
+        genres=[],
+        director="",
+        actors=[],
+        video_quality="1080p",
+        ratings=MovieRatings(),
+        torrent_details=[],
+    )
+    return MovieSearchResult.from_search_data(
+        search_id=search_id, size="10 GB", search_name=search_name, details=details
+    )
+
+
+async def _validate(results):
+    return await _validate_with_groq(
+        results,
+        requested_item="Дюна",
+        requested_type="movie",
+        media_details=None,
+        season_number=None,
+    )
+
+
+async def test_groq_filter_is_off_by_default(monkeypatch):
+    async def fail(*args, **kwargs):
+        raise AssertionError("the LLM must not be called")
+
+    monkeypatch.setattr(config, "GROQ_TORRENT_FILTER", False)
+    monkeypatch.setattr(torrent_search_utils, "filter_movies_with_groq", fail)
+    results = [_result("1", "Дюна / Dune (2021) WEB-DL 1080p")]
+
+    assert await _validate(results) is results
+
+
+async def test_groq_filter_only_drops_results(monkeypatch):
+    async def reject_second(movies, **kwargs):
+        for movie in movies:
+            movie.search_name = "rewritten by the model"
+            movie.video_quality = "4K"
+        return [movie for movie in movies if movie.id != "2"]
+
+    monkeypatch.setattr(config, "GROQ_TORRENT_FILTER", True)
+    monkeypatch.setattr(torrent_search_utils, "filter_movies_with_groq", reject_second)
+    results = [
+        _result("1", "Дюна / Dune (2021) WEB-DL 1080p"),
+        _result("2", "Дюна: Пророчество / Dune: Prophecy S01"),
+    ]
+
+    kept = await _validate(results)
+
+    assert [result.id for result in kept] == ["1"]
+    assert kept[0].search_name == "Дюна / Dune (2021) WEB-DL 1080p"
+    assert kept[0].video_quality == "1080p"
+
+
+async def test_groq_filter_failure_keeps_results(monkeypatch):
+    async def fail(*args, **kwargs):
+        raise RuntimeError("Groq is down")
+
+    monkeypatch.setattr(config, "GROQ_TORRENT_FILTER", True)
+    monkeypatch.setattr(torrent_search_utils, "filter_movies_with_groq", fail)
+    results = [_result("1", "Дюна / Dune (2021) WEB-DL 1080p")]
+
+    assert await _validate(results) is results